@@ -0,0 +1,33 @@
+"""
+Alembic Migration: Add full-text search vector to document extracts
+Revision ID: 002_document_extract_fulltext
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = '002_document_extract_fulltext'
+down_revision = '001_neurosurgical_base'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    """Add a generated tsvector column with a GIN index for keyword search"""
+
+    op.execute(
+        "ALTER TABLE document_extracts ADD COLUMN content_tsv tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('english', content)) STORED"
+    )
+    op.create_index(
+        'ix_document_extracts_content_tsv',
+        'document_extracts',
+        ['content_tsv'],
+        postgresql_using='gin'
+    )
+
+def downgrade():
+    """Drop the full-text search vector and its index"""
+
+    op.drop_index('ix_document_extracts_content_tsv', table_name='document_extracts')
+    op.drop_column('document_extracts', 'content_tsv')
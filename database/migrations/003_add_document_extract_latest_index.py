@@ -0,0 +1,27 @@
+"""
+Alembic Migration: Index document extracts by document and creation time
+Revision ID: 003_document_extract_latest
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = '003_document_extract_latest'
+down_revision = '002_document_extract_fulltext'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    """Index extracts so the newest one per document is a single index probe"""
+
+    op.create_index(
+        'ix_document_extracts_document_created',
+        'document_extracts',
+        ['document_id', 'created_at']
+    )
+
+def downgrade():
+    """Drop the document/creation time index"""
+
+    op.drop_index('ix_document_extracts_document_created', table_name='document_extracts')
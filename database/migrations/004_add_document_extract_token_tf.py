@@ -0,0 +1,25 @@
+"""
+Alembic Migration: Persist term frequencies on document extracts
+Revision ID: 004_document_extract_token_tf
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = '004_document_extract_token_tf'
+down_revision = '003_document_extract_latest'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    """Add the token -> count map used by keyword search"""
+
+    op.add_column('document_extracts', sa.Column('token_tf', postgresql.JSONB, nullable=True))
+
+def downgrade():
+    """Drop the term frequency map"""
+
+    op.drop_column('document_extracts', 'token_tf')
@@ -0,0 +1,26 @@
+"""
+Alembic Migration: Record the source file digest on document extracts
+Revision ID: 005_document_extract_sha256
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '005_document_extract_sha256'
+down_revision = '004_document_extract_token_tf'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    """Add the SHA-256 of the source bytes so identical uploads reuse an extract"""
+
+    op.add_column('document_extracts', sa.Column('content_sha256', sa.String(64), nullable=True))
+    op.create_index('ix_document_extracts_content_sha256', 'document_extracts', ['content_sha256'])
+
+def downgrade():
+    """Drop the source digest and its index"""
+
+    op.drop_index('ix_document_extracts_content_sha256', table_name='document_extracts')
+    op.drop_column('document_extracts', 'content_sha256')
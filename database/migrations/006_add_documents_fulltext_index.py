@@ -0,0 +1,26 @@
+"""
+Alembic Migration: Full-text index on document titles and authors
+Revision ID: 006_documents_fulltext
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = '006_documents_fulltext'
+down_revision = '005_document_extract_sha256'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    """Index the title/author search vector used by list_documents"""
+
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_documents_fts ON documents USING GIN "
+        "(to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(authors::text, '')))"
+    )
+
+def downgrade():
+    """Drop the title/author search index"""
+
+    op.execute("DROP INDEX IF EXISTS idx_documents_fts")
@@ -0,0 +1,32 @@
+"""
+Alembic Migration: Trigram and prefix indexes on document titles
+Revision ID: 007_documents_title_patterns
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = '007_documents_title_patterns'
+down_revision = '006_documents_fulltext'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    """Index lower(title) for substring (trigram) and prefix (pattern ops) LIKE"""
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_documents_title_trgm ON documents "
+        "USING GIN (lower(title) gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_documents_title_lower ON documents "
+        "(lower(title) text_pattern_ops)"
+    )
+
+def downgrade():
+    """Drop the title pattern indexes"""
+
+    op.execute('DROP INDEX IF EXISTS idx_documents_title_lower')
+    op.execute('DROP INDEX IF EXISTS idx_documents_title_trgm')
@@ -0,0 +1,36 @@
+"""
+Alembic Migration: Composite indexes for filtered document listings
+Revision ID: 008_documents_listing
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = '008_documents_listing'
+down_revision = '007_documents_title_patterns'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    """Index each list_documents filter column together with created_at DESC"""
+
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_documents_type_created ON documents "
+        "(document_type, created_at DESC)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_documents_specialty_created ON documents "
+        "(specialty, created_at DESC)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_documents_status_created ON documents "
+        "(processing_status, created_at DESC)"
+    )
+
+def downgrade():
+    """Drop the listing indexes"""
+
+    op.execute('DROP INDEX IF EXISTS idx_documents_status_created')
+    op.execute('DROP INDEX IF EXISTS idx_documents_specialty_created')
+    op.execute('DROP INDEX IF EXISTS idx_documents_type_created')
@@ -462,7 +462,7 @@ const DocumentLibrary: React.FC = () => {
 
                   <div className="flex items-center space-x-2 ml-4">
                     <button
-                      onClick={() => window.open(`/api/library/${doc.id}/content`, '_blank')}
+                      onClick={() => window.open(`/api/library/${doc.id}/content/text`, '_blank')}
                       disabled={doc.status !== 'ready'}
                       className="p-2 text-gray-600 hover:text-gray-900 hover:bg-gray-100 rounded disabled:opacity-50"
                       title="View document"
@@ -13,6 +13,8 @@ from src.api import chapters, search, ai, health, research, library, processing,
 from src.core.api_key_manager import api_key_manager
 from src.services.monitoring_service import monitoring_service
 from src.services.semantic_search_engine import semantic_search_engine
+from src.services.document_service import document_service
+from src.services.research_api import research_api
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -44,6 +46,12 @@ async def lifespan(app: FastAPI):
     logger.info("🔄 Shutting down Neurosurgical Medical Platform...")
 
     try:
+        # Hand off uploads still waiting for their processing batch
+        await document_service.flush_pending_processing()
+
+        # Close the shared research HTTP session
+        await research_api.close()
+
         # Cleanup Redis connections
         if api_key_manager.redis_client:
             await api_key_manager.redis_client.close()
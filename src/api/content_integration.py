@@ -7,6 +7,7 @@ Ensures uniform content processing regardless of source method.
 """
 
 from fastapi import APIRouter, HTTPException, UploadFile, File, Form
+from fastapi.responses import StreamingResponse
 from typing import List, Optional, Dict, Any
 import logging
 from pydantic import BaseModel
@@ -23,6 +24,13 @@ from ..services.content_integration_service import (
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+EXPORT_MEDIA_TYPES = {
+    "json": "application/json",
+    "markdown": "text/markdown",
+    "csv": "text/csv"
+}
+EXPORT_FILE_EXTENSIONS = {"json": "json", "markdown": "md", "csv": "csv"}
+
 class WebContentImport(BaseModel):
     """Model for importing content from web interfaces"""
     content: str
@@ -92,7 +100,7 @@ async def import_web_content(request: WebContentImport):
                 "tags": integrated_content.tags,
                 "references_count": len(integrated_content.references)
             },
-            "content": integrated_content.dict()
+            "content": integrated_content.to_dict()
         }
 
     except Exception as e:
@@ -276,7 +284,7 @@ async def get_content_details(content_id: str):
 
         return {
             "success": True,
-            "content": content.dict(),
+            "content": content.to_dict(),
             "analysis": {
                 "word_count": len(content.content.split()),
                 "medical_concept_count": len(content.medical_concepts),
@@ -334,6 +342,7 @@ async def export_content(
     Export integrated content in various formats
 
     Supports JSON, Markdown, and CSV formats for different use cases.
+    The export is streamed to the client as it is generated.
     """
     try:
         logger.info(f"📤 Exporting content in {format_type} format")
@@ -349,24 +358,22 @@ async def export_content(
         if date_to:
             filter_criteria["date_to"] = date_to
 
-        # Export content
-        exported_content = await content_integration_service.export_integrated_content(
+        # Export content as a stream of encoded chunks
+        chunks = content_integration_service.export_integrated_content(
             format_type=format_type,
             filter_criteria=filter_criteria
         )
 
-        return {
-            "success": True,
-            "format": format_type,
-            "filter_criteria": filter_criteria,
-            "content": exported_content,
-            "export_info": {
-                "generated_at": "datetime.utcnow().isoformat()",
-                "content_length": len(exported_content),
-                "format_type": format_type
+        return StreamingResponse(
+            chunks,
+            media_type=EXPORT_MEDIA_TYPES[format_type],
+            headers={
+                "Content-Disposition": f'attachment; filename="integrated_content.{EXPORT_FILE_EXTENSIONS[format_type]}"'
             }
-        }
+        )
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Content export failed: {e}")
         raise HTTPException(status_code=500, detail=f"Export failed: {str(e)}")
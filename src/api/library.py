@@ -4,11 +4,14 @@ Upload and manage medical documents, books, chapters, papers
 """
 
 from fastapi import APIRouter, HTTPException, UploadFile, File, Form
-from typing import Optional, List
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, Optional, List
+import asyncio
+import itertools
 import logging
 from pydantic import BaseModel
 
-from ..services.document_service import document_service
+from ..services.document_service import document_service, UPLOAD_CHUNK_BYTES, UPLOAD_WRITE_CONCURRENCY
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -26,6 +29,21 @@ class DocumentMetadata(BaseModel):
     isbn: Optional[str] = None
     keywords: Optional[List[str]] = None
 
+async def _iter_upload(file: UploadFile) -> AsyncIterator[memoryview]:
+    """Yield an uploaded file in chunks read into a small ring of reused buffers
+
+    A buffer is refilled UPLOAD_WRITE_CONCURRENCY + 1 chunks after it was
+    yielded, by which point DocumentService._write_stream has written it.
+    """
+    buffer_size = min(file.size or UPLOAD_CHUNK_BYTES, UPLOAD_CHUNK_BYTES)
+    buffers = [bytearray(buffer_size) for _ in range(UPLOAD_WRITE_CONCURRENCY + 1)]
+    for index in itertools.count():
+        buffer = buffers[index % len(buffers)]
+        read = await asyncio.to_thread(file.file.readinto, buffer)
+        if not read:
+            return
+        yield memoryview(buffer)[:read]
+
 class CollectionCreate(BaseModel):
     name: str
     description: Optional[str] = None
@@ -50,9 +68,6 @@ async def upload_document(
     """Upload a document to the library (PDF, DOCX, TXT, MD)"""
 
     try:
-        # Read file content
-        file_content = await file.read()
-
         # Parse JSON fields
         import json
         parsed_authors = json.loads(authors) if authors else []
@@ -75,7 +90,7 @@ async def upload_document(
 
         # Upload document
         result = await document_service.upload_document(
-            file_content=file_content,
+            file_stream=_iter_upload(file),
             filename=file.filename,
             title=title,
             document_type=document_type,
@@ -134,6 +149,24 @@ async def get_document_content(document_id: str):
         logger.error(f"Failed to get document content: {e}")
         raise HTTPException(status_code=500, detail="Failed to get document content")
 
+@router.get("/{document_id}/content/text")
+async def stream_document_content(document_id: str):
+    """Stream extracted text content of document as plain text"""
+
+    try:
+        result = await document_service.get_document_text_stream(document_id)
+
+        if not result["success"]:
+            raise HTTPException(status_code=404, detail=result["error"])
+
+        return StreamingResponse(result["chunks"], media_type="text/plain; charset=utf-8")
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to stream document content: {e}")
+        raise HTTPException(status_code=500, detail="Failed to stream document content")
+
 @router.get("/")
 async def list_documents(
     document_type: Optional[str] = None,
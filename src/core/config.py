@@ -49,6 +49,12 @@ class Settings(BaseSettings):
     default_ai_provider: str = "gemini"
     enable_multi_provider_synthesis: bool = True
     max_concurrent_ai_requests: int = 3
+    # Mark Claude's fixed instructions for Anthropic prompt caching
+    claude_prompt_caching: bool = True
+    # Persistent PMID -> evidence score cache (used when diskcache is installed)
+    evidence_score_cache_dir: str = ".cache/evidence_scores"
+    # Persistent cache of completed literature analyses (used when diskcache is installed)
+    literature_analysis_cache_dir: str = ".cache/literature_analysis"
 
     # Medical Domain
     medical_specialties: List[str] = [
@@ -70,6 +76,7 @@ class Settings(BaseSettings):
 
     # Document Processing
     max_file_size_mb: int = 100
+    upload_drop_cache_threshold_mb: int = 16
     allowed_file_types: str = "pdf,docx,txt,md"
     enable_ocr: bool = True
     enable_figure_extraction: bool = True
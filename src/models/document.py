@@ -1,14 +1,23 @@
 """Document Library Models for Medical Knowledge Platform"""
 
-from sqlalchemy import Column, String, Text, DateTime, JSON, Integer, Float, Boolean, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Text, DateTime, JSON, Integer, Float, Boolean, ForeignKey, Computed, Index, cast, func, literal_column
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR, JSONB
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from enum import Enum
 import uuid
 
+try:
+    from uuid_utils.compat import uuid7
+except ImportError:
+    uuid7 = None
+
 from ..core.database import Base
 
+def time_ordered_uuid() -> uuid.UUID:
+    """UUIDv7 when uuid-utils is installed (sequential B-tree inserts), else UUIDv4"""
+    return uuid7() if uuid7 is not None else uuid.uuid4()
+
 class DocumentType(str, Enum):
     BOOK = "book"
     CHAPTER = "chapter"
@@ -32,7 +41,7 @@ class Document(Base):
 
     __tablename__ = "documents"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=time_ordered_uuid)
     title = Column(String(500), nullable=False)
     authors = Column(JSON, nullable=True)  # List of authors
     document_type = Column(String(50), nullable=False)  # DocumentType enum
@@ -46,8 +55,8 @@ class Document(Base):
     file_type = Column(String(10), nullable=False)  # pdf, docx, txt, etc.
     mime_type = Column(String(100), nullable=True)
 
-    # Content extraction
-    extracted_text = Column(Text, nullable=True)
+    # Content extraction (deferred: only get_document_content reads the full text)
+    extracted_text = Column(Text, nullable=True, deferred=True)
     word_count = Column(Integer, nullable=True)
     page_count = Column(Integer, nullable=True)
 
@@ -127,6 +136,36 @@ class Document(Base):
             "is_favorite": self.is_favorite,
         }
 
+# Title/author search vector. Queries must use this exact expression (with
+# inline constants, not bind parameters) for Postgres to match the GIN index.
+DOCUMENT_SEARCH_VECTOR = func.to_tsvector(
+    literal_column("'simple'"),
+    func.coalesce(Document.title, literal_column("''"))
+    .op("||")(literal_column("' '"))
+    .op("||")(func.coalesce(cast(Document.authors, Text), literal_column("''")))
+)
+
+Index("idx_documents_fts", DOCUMENT_SEARCH_VECTOR, postgresql_using="gin")
+
+# Title substring (trigram) and anchored prefix (pattern btree) lookups
+Index(
+    "idx_documents_title_trgm",
+    func.lower(Document.title).label("title_lower"),
+    postgresql_using="gin",
+    postgresql_ops={"title_lower": "gin_trgm_ops"}
+)
+Index(
+    "idx_documents_title_lower",
+    func.lower(Document.title).label("title_lower"),
+    postgresql_ops={"title_lower": "text_pattern_ops"}
+)
+
+# list_documents filters (newest first): lets a filtered page be an index
+# range scan with the LIMIT pushed down instead of a sort of every match
+Index("idx_documents_type_created", Document.document_type, Document.created_at.desc())
+Index("idx_documents_specialty_created", Document.specialty, Document.created_at.desc())
+Index("idx_documents_status_created", Document.processing_status, Document.created_at.desc())
+
 class DocumentFigure(Base):
     """Extracted figures from documents"""
 
@@ -164,6 +203,11 @@ class DocumentExtract(Base):
     """Key text extracts from documents"""
 
     __tablename__ = "document_extracts"
+    __table_args__ = (
+        Index("ix_document_extracts_content_tsv", "content_tsv", postgresql_using="gin"),
+        Index("ix_document_extracts_document_created", "document_id", "created_at"),
+        Index("ix_document_extracts_content_sha256", "content_sha256"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     document_id = Column(UUID(as_uuid=True), ForeignKey("documents.id"), nullable=False)
@@ -178,6 +222,15 @@ class DocumentExtract(Base):
     importance_score = Column(Float, nullable=True)
     medical_concepts = Column(JSON, nullable=True)
 
+    # SHA-256 of the source file bytes, used to reuse extracts of identical uploads
+    content_sha256 = Column(String(64), nullable=True)
+
+    # Lowercase token -> occurrence count, computed once at extraction time
+    token_tf = Column(JSONB, nullable=True)
+
+    # Full-text search vector, generated by Postgres from content
+    content_tsv = Column(TSVECTOR, Computed("to_tsvector('english', content)", persisted=True))
+
     created_at = Column(DateTime, default=datetime.utcnow)
 
     # Relationships
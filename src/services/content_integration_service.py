@@ -11,15 +11,27 @@ with consistent formatting, indexing, and searchability.
 """
 
 import asyncio
+import csv
+import io
 import json
 import logging
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Union
+from typing import AsyncIterator, Dict, List, Optional, Any, Tuple, Union
 from enum import Enum
+from itertools import islice
 from pathlib import Path
 import hashlib
 import re
-from pydantic import BaseModel
+import numpy as np
+
+# orjson is a production optimization; fall back to the stdlib encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from ..core.database import get_async_session
 from .semantic_search_engine import semantic_search_engine
@@ -27,6 +39,25 @@ from .neurosurgical_concepts import neurosurgical_concepts
 
 logger = logging.getLogger(__name__)
 
+# Patterns shared by the extraction helpers, compiled once at import
+CITATION_PATTERN = re.compile(r'\[(\d+)\]')
+URL_PATTERN = re.compile(r'https?://[^\s]+')
+DOI_PATTERN = re.compile(r'10\.\d+/[^\s]+')
+CAUSAL_REASONING_PATTERN = re.compile(r'(?:because|therefore|thus|hence)')
+STEP_REASONING_PATTERN = re.compile(r'(?:let me|first|second|third|finally)')
+STRUCTURED_OUTPUT_PATTERN = re.compile(r'\d+\.\s|\n-\s|•\s')
+
+# Medical specialties and content characteristics that become tags verbatim
+TAG_KEYWORDS = (
+    "neurosurgery", "oncology", "cardiology", "radiology", "pathology",
+    "treatment", "diagnosis", "research"
+)
+TAG_KEYWORD_PATTERN = re.compile("|".join(map(re.escape, TAG_KEYWORDS)))
+
+def _count_matches(pattern: re.Pattern, text: str) -> int:
+    """Count pattern matches without building a list of them"""
+    return sum(1 for _ in pattern.finditer(text))
+
 class ContentSource(str, Enum):
     """Content source types"""
     GEMINI_API = "gemini_api"
@@ -52,8 +83,13 @@ class ContentType(str, Enum):
     EDUCATIONAL_CONTENT = "educational_content"
     RAW_EXTRACTION = "raw_extraction"
 
-class IntegratedContent(BaseModel):
-    """Unified content model for all sources"""
+@dataclass(slots=True)
+class IntegratedContent:
+    """Unified content model for all sources
+
+    Instances are built by trusted service code; request payloads are
+    validated by the API models before they reach the service.
+    """
     id: str
     title: str
     content: str
@@ -70,12 +106,334 @@ class IntegratedContent(BaseModel):
     references: List[str]
     embedding_vector: Optional[List[float]]
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dictionary"""
+        return asdict(self)
+
+@dataclass(slots=True)
+class TextStats:
+    """Per-item text statistics shared by the metadata and scoring helpers"""
+    char_count: int
+    word_count: int
+    sentence_count: int
+    citation_count: int
+    concept_count: int
+
+@dataclass(slots=True)
+class ContentAnalysis:
+    """Result of the CPU-bound analysis of one content item"""
+    content_id: str
+    title: str
+    metadata: Dict[str, Any]
+    medical_concepts: List[str]
+    confidence: float
+    tags: List[str]
+    references: List[str]
+
+class EmbeddingIndex:
+    """Int8-quantized matrix of L2-normalized embeddings for vectorized similarity
+
+    Each row is stored as int8 codes with a per-row float32 scale, a quarter
+    of the memory of float32 rows. The backing arrays double in capacity
+    when full. Query similarity is computed as blocked matrix-vector
+    products over the codes, and pairwise similarity as blocked int8 dot
+    products, without dequantizing the whole index.
+    """
+
+    def __init__(self, initial_capacity: int = 256, score_block_size: int = 4096):
+        self.initial_capacity = initial_capacity
+        self.score_block_size = score_block_size
+        self._codes: Optional[np.ndarray] = None
+        self._scales: Optional[np.ndarray] = None
+        self._ids: List[str] = []
+        self._positions: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def ids(self) -> List[str]:
+        return self._ids
+
+    @staticmethod
+    def _normalize(embedding: Any) -> Optional[np.ndarray]:
+        vector = np.asarray(embedding, dtype=np.float32)
+        if vector.ndim != 1 or vector.size == 0:
+            return None
+        norm = np.linalg.norm(vector)
+        if norm == 0:
+            return None
+        return vector / norm
+
+    @staticmethod
+    def _quantize(vector: np.ndarray) -> Tuple[np.ndarray, float]:
+        scale = float(np.abs(vector).max()) / 127
+        return np.round(vector / scale).astype(np.int8), scale
+
+    def add(self, content_id: str, embedding: Any):
+        """Insert or replace the embedding stored for ``content_id``"""
+        vector = self._normalize(embedding)
+        if vector is None:
+            return
+
+        if self._codes is None:
+            self._codes = np.empty((self.initial_capacity, vector.shape[0]), dtype=np.int8)
+            self._scales = np.empty(self.initial_capacity, dtype=np.float32)
+        elif vector.shape[0] != self._codes.shape[1]:
+            logger.warning(f"Skipping embedding with dimension {vector.shape[0]} for {content_id}")
+            return
+
+        position = self._positions.get(content_id)
+        if position is None:
+            position = len(self._ids)
+            if position == self._codes.shape[0]:
+                self._grow()
+            self._positions[content_id] = position
+            self._ids.append(content_id)
+
+        self._codes[position], self._scales[position] = self._quantize(vector)
+
+    def similar_pairs(self, threshold: float, block_size: int = 1024) -> np.ndarray:
+        """Row index pairs (i < j) whose cosine similarity exceeds ``threshold``
+
+        Similarities are computed straight from the int8 codes, one pair of
+        blocks on or above the diagonal at a time: an int32 dot product scaled
+        by both rows' scales. Memory stays at ``block_size ** 2`` scores
+        instead of the full square matrix or a dequantized copy of the index.
+        """
+        count = len(self._ids)
+        pairs = []
+        for row_start in range(0, count, block_size):
+            row_stop = min(row_start + block_size, count)
+            row_codes = self._codes[row_start:row_stop].astype(np.int32)
+            row_scales = self._scales[row_start:row_stop, None]
+            for col_start in range(row_start, count, block_size):
+                col_stop = min(col_start + block_size, count)
+                dots = row_codes @ self._codes[col_start:col_stop].astype(np.int32).T
+                similarities = dots * row_scales * self._scales[None, col_start:col_stop]
+                rows, cols = np.nonzero(similarities > threshold)
+                rows += row_start
+                cols += col_start
+                upper = cols > rows
+                pairs.append(np.stack([rows[upper], cols[upper]], axis=1))
+        if not pairs:
+            return np.empty((0, 2), dtype=np.intp)
+        return np.concatenate(pairs)
+
+    def similar_groups(self, threshold: float) -> List[List[str]]:
+        """Group content IDs into connected components of similar embeddings"""
+        parent = list(range(len(self._ids)))
+
+        def find(node: int) -> int:
+            while parent[node] != node:
+                parent[node] = parent[parent[node]]
+                node = parent[node]
+            return node
+
+        for left, right in self.similar_pairs(threshold):
+            left_root, right_root = find(left), find(right)
+            if left_root != right_root:
+                parent[right_root] = left_root
+
+        groups: Dict[int, List[str]] = {}
+        for position, content_id in enumerate(self._ids):
+            groups.setdefault(find(position), []).append(content_id)
+        return list(groups.values())
+
+    def remove(self, content_id: str):
+        """Drop the embedding stored for ``content_id``, if any"""
+        position = self._positions.pop(content_id, None)
+        if position is None:
+            return
+
+        last = len(self._ids) - 1
+        if position != last:
+            # Move the last row into the freed slot to keep rows contiguous
+            last_id = self._ids[last]
+            self._codes[position] = self._codes[last]
+            self._scales[position] = self._scales[last]
+            self._ids[position] = last_id
+            self._positions[last_id] = position
+        self._ids.pop()
+
+    def _grow(self):
+        count = len(self._ids)
+        codes = np.empty((count * 2, self._codes.shape[1]), dtype=np.int8)
+        codes[:count] = self._codes
+        scales = np.empty(count * 2, dtype=np.float32)
+        scales[:count] = self._scales
+        self._codes, self._scales = codes, scales
+
+    def scores(self, query_embedding: Any) -> np.ndarray:
+        """Approximate cosine similarity of the query against every stored embedding"""
+        query = self._normalize(query_embedding)
+        count = len(self)
+        if query is None or not count or query.shape[0] != self._codes.shape[1]:
+            return np.empty(0, dtype=np.float32)
+
+        scores = np.empty(count, dtype=np.float32)
+        for start in range(0, count, self.score_block_size):
+            stop = min(start + self.score_block_size, count)
+            scores[start:stop] = self._codes[start:stop].astype(np.float32) @ query
+
+        return scores * self._scales[:count]
+
+class ContentStore(OrderedDict):
+    """Bounded LRU mapping of content ID to integrated content
+
+    Inserting beyond ``max_items`` evicts the least recently used entry and
+    calls ``on_evict`` with its ID so dependent indexes stay in sync.
+    """
+
+    def __init__(self, max_items: int = 10000, on_evict=None):
+        super().__init__()
+        self.max_items = max_items
+        self.on_evict = on_evict
+
+    def __setitem__(self, key: str, value: "IntegratedContent"):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.max_items:
+            evicted_id, _ = self.popitem(last=False)
+            if self.on_evict:
+                self.on_evict(evicted_id)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            return default
+        self.move_to_end(key)
+        return self[key]
+
+    def peek(self, key: str, default: Any = None) -> Any:
+        """Look up an entry without marking it as recently used"""
+        return super().get(key, default)
+
+class EmbeddingCache:
+    """Content-addressed LRU cache for embedding vectors
+
+    Entries are keyed on a BLAKE2b digest of the model name and text, and
+    vectors are held as raw float32 bytes to keep the per-entry footprint small.
+    """
+
+    def __init__(self, model_name: str, max_entries: int = 10000):
+        self.model_name = model_name
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[bytes, bytes]" = OrderedDict()
+
+    def _key(self, text: str) -> bytes:
+        digest = hashlib.blake2b(digest_size=32)
+        digest.update(self.model_name.encode())
+        digest.update(b"\0")
+        digest.update(text.encode())
+        return digest.digest()
+
+    def get(self, text: str) -> Optional[np.ndarray]:
+        key = self._key(text)
+        raw = self._entries.get(key)
+        if raw is None:
+            return None
+        self._entries.move_to_end(key)
+        return np.frombuffer(raw, dtype=np.float32)
+
+    def put(self, text: str, embedding: Any):
+        key = self._key(text)
+        self._entries[key] = np.asarray(embedding, dtype=np.float32).tobytes()
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_or_compute_many(self, texts: List[str], batch_fn) -> List[np.ndarray]:
+        """Return embeddings for ``texts``, computing only the cache misses in one batch"""
+        results: List[Optional[np.ndarray]] = [self.get(text) for text in texts]
+        missing = list(dict.fromkeys(
+            text for text, result in zip(texts, results) if result is None
+        ))
+
+        if missing:
+            computed = dict(zip(missing, await batch_fn(missing)))
+            for text, embedding in computed.items():
+                self.put(text, embedding)
+            results = [
+                result if result is not None else np.asarray(computed[text], dtype=np.float32)
+                for text, result in zip(texts, results)
+            ]
+
+        return results
+
+class EmbeddingBatcher:
+    """Coalesces concurrent embedding requests into micro-batches
+
+    Requests are queued and a background worker flushes them to ``batch_fn``
+    once ``batch_size`` texts are pending or ``wait_timeout`` seconds have
+    passed since the first one arrived.
+    """
+
+    def __init__(self, batch_fn, batch_size: int = 32, wait_timeout: float = 0.01):
+        self.batch_fn = batch_fn
+        self.batch_size = batch_size
+        self.wait_timeout = wait_timeout
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def embed(self, text: str) -> Any:
+        """Queue a text for embedding and wait for its vector"""
+        self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    def _ensure_worker(self):
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+    async def _collect_batch(self) -> List[tuple]:
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.wait_timeout
+
+        while len(batch) < self.batch_size:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _run(self):
+        while True:
+            batch = await self._collect_batch()
+            texts = [text for text, _ in batch]
+
+            try:
+                embeddings = await self.batch_fn(texts)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), embedding in zip(batch, embeddings):
+                if not future.done():
+                    future.set_result(embedding)
+
 class ContentIntegrationService:
     """Service for integrating content from all AI provider sources"""
 
     def __init__(self):
-        self.content_store = {}  # In-memory cache
+        self._embedding_index = EmbeddingIndex()
+        self.content_store = ContentStore(on_evict=self._embedding_index.remove)  # Bounded LRU cache
         self.integration_rules = self._load_integration_rules()
+        self._embedding_cache = EmbeddingCache(semantic_search_engine.model_name)
+        self._embedding_batcher = EmbeddingBatcher(self._cached_embedding_batch)
+        self.write_batch_size = 256
+        self.flush_interval = 0.1  # seconds
+        self._write_buffer: List[IntegratedContent] = []
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
 
     def _load_integration_rules(self) -> Dict:
         """Load content integration and processing rules"""
@@ -128,40 +486,14 @@ class ContentIntegrationService:
     ) -> IntegratedContent:
         """Integrate content from API calls"""
 
-        # Generate unique content ID
-        content_id = self._generate_content_id(content, provider, "api")
-
-        # Extract medical concepts
-        medical_concepts = await self._extract_medical_concepts(content)
-
-        # Determine content source
-        source = self._map_provider_to_api_source(provider)
-
-        # Create embedding vector
-        embedding = await self._create_embedding(content)
-
-        # Extract metadata based on provider
-        enhanced_metadata = await self._enhance_metadata(content, provider, metadata)
-
-        # Determine content confidence
-        confidence = await self._calculate_confidence(content, provider, "api")
+        # Analyze text off the event loop while the embedding is created
+        analysis, embedding = await asyncio.gather(
+            asyncio.to_thread(self._analyze_content, content, provider, "api", metadata),
+            self._create_embedding(content)
+        )
 
-        integrated_content = IntegratedContent(
-            id=content_id,
-            title=enhanced_metadata.get("title", self._generate_title(content)),
-            content=content,
-            content_type=content_type,
-            source=source,
-            provider=provider,
-            extraction_method="api",
-            metadata=enhanced_metadata,
-            medical_concepts=medical_concepts,
-            confidence_score=confidence,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
-            tags=self._extract_tags(content, provider),
-            references=self._extract_references(content, provider),
-            embedding_vector=embedding
+        integrated_content = self._build_integrated_content(
+            content, provider, "api", content_type, analysis, embedding
         )
 
         # Store in database and cache
@@ -179,42 +511,16 @@ class ContentIntegrationService:
     ) -> IntegratedContent:
         """Integrate content from web interfaces (manual extraction)"""
 
-        # Generate unique content ID
-        content_id = self._generate_content_id(content, provider, "web")
-
-        # Extract medical concepts
-        medical_concepts = await self._extract_medical_concepts(content)
-
-        # Determine content source
-        source = self._map_provider_to_web_source(provider)
-
-        # Create embedding vector
-        embedding = await self._create_embedding(content)
-
-        # Extract metadata with web-specific enhancements
-        enhanced_metadata = await self._enhance_web_metadata(
-            content, provider, source_interface, metadata
+        # Analyze text off the event loop while the embedding is created
+        analysis, embedding = await asyncio.gather(
+            asyncio.to_thread(
+                self._analyze_content, content, provider, "web", metadata, source_interface
+            ),
+            self._create_embedding(content)
         )
 
-        # Determine content confidence (web content often has additional context)
-        confidence = await self._calculate_confidence(content, provider, "web")
-
-        integrated_content = IntegratedContent(
-            id=content_id,
-            title=enhanced_metadata.get("title", self._generate_title(content)),
-            content=content,
-            content_type=content_type,
-            source=source,
-            provider=provider,
-            extraction_method="web_import",
-            metadata=enhanced_metadata,
-            medical_concepts=medical_concepts,
-            confidence_score=confidence,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
-            tags=self._extract_tags(content, provider),
-            references=self._extract_references(content, provider),
-            embedding_vector=embedding
+        integrated_content = self._build_integrated_content(
+            content, provider, "web", content_type, analysis, embedding
         )
 
         # Store in database and cache
@@ -224,37 +530,97 @@ class ContentIntegrationService:
 
     async def batch_integrate_content(
         self,
-        content_items: List[Dict[str, Any]]
+        content_items: List[Dict[str, Any]],
+        concurrency: int = 8,
+        queue_size: int = 512
     ) -> List[IntegratedContent]:
-        """Batch integration for multiple content items"""
-
-        integrated_items = []
-
-        for item in content_items:
-            try:
-                if item.get("extraction_method") == "api":
-                    integrated = await self.integrate_api_content(
-                        content=item["content"],
-                        provider=item["provider"],
-                        metadata=item.get("metadata", {}),
-                        content_type=ContentType(item.get("content_type", "raw_extraction"))
+        """Batch integration for multiple content items
+
+        Items flow through analyze -> embed -> store stages connected by
+        bounded queues. The stages overlap, and a slow stage applies
+        backpressure instead of letting work pile up in memory. The embed
+        stage runs enough workers to fill a full embedding micro-batch.
+        """
+
+        workers = max(1, concurrency)
+        analyze_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        embed_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        store_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        results: List[Optional[IntegratedContent]] = [None] * len(content_items)
+
+        async def _analyze_stage():
+            while True:
+                index, item = await analyze_queue.get()
+                try:
+                    method = "api" if item.get("extraction_method") == "api" else "web"
+                    analysis = await asyncio.to_thread(
+                        self._analyze_content,
+                        item["content"],
+                        item["provider"],
+                        method,
+                        item.get("metadata", {}),
+                        item.get("source_interface", "unknown")
                     )
-                else:
-                    integrated = await self.integrate_web_content(
-                        content=item["content"],
-                        provider=item["provider"],
-                        source_interface=item.get("source_interface", "unknown"),
-                        metadata=item.get("metadata", {}),
-                        content_type=ContentType(item.get("content_type", "raw_extraction"))
+                    await embed_queue.put((index, item, method, analysis))
+                except Exception as e:
+                    logger.error(f"Failed to integrate content item: {e}")
+                finally:
+                    analyze_queue.task_done()
+
+        async def _embed_stage():
+            while True:
+                index, item, method, analysis = await embed_queue.get()
+                try:
+                    embedding = await self._create_embedding(item["content"])
+                    integrated = self._build_integrated_content(
+                        item["content"],
+                        item["provider"],
+                        method,
+                        ContentType(item.get("content_type", "raw_extraction")),
+                        analysis,
+                        embedding
                     )
+                    await store_queue.put((index, integrated))
+                except Exception as e:
+                    logger.error(f"Failed to integrate content item: {e}")
+                finally:
+                    embed_queue.task_done()
+
+        async def _store_stage():
+            while True:
+                index, integrated = await store_queue.get()
+                try:
+                    await self._store_content(integrated)
+                    results[index] = integrated
+                except Exception as e:
+                    logger.error(f"Failed to integrate content item: {e}")
+                finally:
+                    store_queue.task_done()
+
+        stage_workers = [
+            (_analyze_stage, workers),
+            (_embed_stage, self._embedding_batcher.batch_size),
+            (_store_stage, workers)
+        ]
+        tasks = [
+            asyncio.create_task(stage())
+            for stage, count in stage_workers
+            for _ in range(count)
+        ]
 
-                integrated_items.append(integrated)
+        try:
+            for entry in enumerate(content_items):
+                await analyze_queue.put(entry)
+            for queue in (analyze_queue, embed_queue, store_queue):
+                await queue.join()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
-            except Exception as e:
-                logger.error(f"Failed to integrate content item: {e}")
-                continue
+        await self.flush()
 
-        return integrated_items
+        return [integrated for integrated in results if integrated is not None]
 
     async def search_integrated_content(
         self,
@@ -280,72 +646,154 @@ class ContentIntegrationService:
         self,
         similarity_threshold: float = 0.9
     ) -> List[Dict[str, Any]]:
-        """Identify and merge similar content from different sources"""
+        """Identify and merge similar content from different sources
 
-        merged_items = []
-        processed_ids = set()
+        Items are clustered in one pass over the embedding matrix: any two
+        items above the threshold end up in the same group, and each group
+        with more than one member is merged.
+        """
 
-        all_content = await self._get_all_content()
+        merged_items = []
+        clustered_ids = set()
 
-        for content in all_content:
-            if content.id in processed_ids:
+        for group in self._embedding_index.similar_groups(similarity_threshold):
+            items = [self.content_store[content_id] for content_id in group if content_id in self.content_store]
+            if len(items) < 2:
                 continue
 
-            # Find similar content
-            similar_items = await self._find_similar_content(
-                content, similarity_threshold
-            )
-
-            if similar_items:
-                # Merge content
-                merged = await self._merge_content_items([content] + similar_items)
-                merged_items.append(merged)
+            merged_items.append(await self._merge_content_items(items))
+            clustered_ids.update(item.id for item in items)
 
-                # Mark as processed
-                processed_ids.add(content.id)
-                for item in similar_items:
-                    processed_ids.add(item.id)
-            else:
-                # Keep as standalone
-                merged_items.append(content.dict())
+        # Keep everything else as standalone
+        for content in await self._get_all_content():
+            if content.id not in clustered_ids:
+                merged_items.append(content.to_dict())
 
         return merged_items
 
-    async def export_integrated_content(
+    def export_integrated_content(
         self,
         format_type: str = "json",
         filter_criteria: Optional[Dict] = None
-    ) -> str:
-        """Export integrated content in various formats"""
-
-        content_items = await self._filter_content(filter_criteria or {})
+    ) -> AsyncIterator[bytes]:
+        """Export integrated content in various formats
+
+        Returns an async iterator of encoded chunks so large exports can be
+        streamed without building the whole document in memory. The format
+        is validated up front, before any chunk is produced.
+        """
+
+        exporters = {
+            "json": self._export_to_json,
+            "markdown": self._export_to_markdown,
+            "csv": self._export_to_csv
+        }
 
-        if format_type == "json":
-            return json.dumps([item.dict() for item in content_items], indent=2, default=str)
-        elif format_type == "markdown":
-            return await self._export_to_markdown(content_items)
-        elif format_type == "csv":
-            return await self._export_to_csv(content_items)
-        else:
+        if format_type not in exporters:
             raise ValueError(f"Unsupported export format: {format_type}")
 
+        return exporters[format_type](self._filter_content(filter_criteria or {}))
+
     # Helper Methods
 
+    def _analyze_content(
+        self,
+        content: str,
+        provider: str,
+        method: str,
+        metadata: Dict[str, Any],
+        source_interface: Optional[str] = None
+    ) -> ContentAnalysis:
+        """Run the CPU-bound text analysis for one item
+
+        Safe to call from worker threads: it only reads shared state.
+        """
+
+        # Lowercase once for all text helpers
+        content_lower = content.lower()
+
+        # Extract medical concepts
+        medical_concepts = self._extract_medical_concepts(content_lower)
+
+        # Gather counts used by the metadata and confidence helpers
+        stats = self._compute_text_stats(content, medical_concepts)
+
+        # Web imports carry extra context about the interface they came from
+        web_extra = None
+        if method == "web":
+            web_extra = {
+                "source_interface": source_interface or "unknown",
+                "extraction_context": "web_interface",
+                "manual_extraction": True,
+                "interface_features_used": self._detect_interface_features(content_lower, provider)
+            }
+
+        # Extract metadata based on provider
+        enhanced_metadata = self._enhance_metadata(
+            content, content_lower, stats, provider, metadata, web_extra
+        )
+
+        return ContentAnalysis(
+            content_id=self._generate_content_id(content, provider, method),
+            title=enhanced_metadata.get("title", self._generate_title(content)),
+            metadata=enhanced_metadata,
+            medical_concepts=medical_concepts,
+            confidence=self._calculate_confidence(stats, provider, method),
+            tags=self._extract_tags(content, content_lower, provider),
+            references=self._extract_references(content, provider)
+        )
+
+    def _build_integrated_content(
+        self,
+        content: str,
+        provider: str,
+        method: str,
+        content_type: ContentType,
+        analysis: ContentAnalysis,
+        embedding: List[float]
+    ) -> IntegratedContent:
+        """Assemble an IntegratedContent record from analysis results"""
+
+        if method == "api":
+            source = self._map_provider_to_api_source(provider)
+            extraction_method = "api"
+        else:
+            source = self._map_provider_to_web_source(provider)
+            extraction_method = "web_import"
+
+        return IntegratedContent(
+            id=analysis.content_id,
+            title=analysis.title,
+            content=content,
+            content_type=content_type,
+            source=source,
+            provider=provider,
+            extraction_method=extraction_method,
+            metadata=analysis.metadata,
+            medical_concepts=analysis.medical_concepts,
+            confidence_score=analysis.confidence,
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow(),
+            tags=analysis.tags,
+            references=analysis.references,
+            embedding_vector=embedding
+        )
+
     def _generate_content_id(self, content: str, provider: str, method: str) -> str:
         """Generate unique content ID"""
         content_hash = hashlib.md5(content.encode()).hexdigest()[:8]
         timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
         return f"{provider}_{method}_{timestamp}_{content_hash}"
 
-    async def _extract_medical_concepts(self, content: str) -> List[str]:
-        """Extract medical concepts from content"""
+    def _extract_medical_concepts(self, content_lower: str) -> List[str]:
+        """Extract medical concepts from lowercased content"""
         concepts = []
 
         # Use neurosurgical concepts database
         all_concepts = neurosurgical_concepts.get_all_concepts()
 
         for concept in all_concepts:
-            if concept.lower() in content.lower():
+            if concept.lower() in content_lower:
                 concepts.append(concept)
 
         # Additional NLP-based concept extraction could be added here
@@ -355,12 +803,18 @@ class ContentIntegrationService:
     async def _create_embedding(self, content: str) -> List[float]:
         """Create embedding vector for content"""
         try:
-            embedding = await semantic_search_engine.create_embedding(content)
+            embedding = await self._embedding_batcher.embed(content)
             return embedding.tolist() if hasattr(embedding, 'tolist') else embedding
         except Exception as e:
             logger.error(f"Failed to create embedding: {e}")
             return []
 
+    async def _cached_embedding_batch(self, texts: List[str]) -> List[np.ndarray]:
+        """Embed a micro-batch, skipping texts already in the embedding cache"""
+        return await self._embedding_cache.get_or_compute_many(
+            texts, semantic_search_engine.create_embedding_batch
+        )
+
     def _map_provider_to_api_source(self, provider: str) -> ContentSource:
         """Map provider to API source enum"""
         mapping = {
@@ -381,179 +835,181 @@ class ContentIntegrationService:
         }
         return mapping.get(provider, ContentSource.USER_UPLOADED)
 
-    async def _enhance_metadata(
-        self, content: str, provider: str, metadata: Dict[str, Any]
+    def _enhance_metadata(
+        self,
+        content: str,
+        content_lower: str,
+        stats: TextStats,
+        provider: str,
+        metadata: Dict[str, Any],
+        web_extra: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        """Enhance metadata based on provider-specific patterns"""
+        """Enhance metadata based on provider-specific patterns
+
+        ``web_extra`` holds web-interface keys merged in the same pass.
+        """
 
         enhanced = metadata.copy()
         rules = self.integration_rules.get(provider, {})
 
         # Extract provider-specific features
         if provider == "gemini":
-            enhanced.update(await self._extract_gemini_features(content))
+            enhanced.update(self._extract_gemini_features(content, content_lower, stats))
         elif provider == "claude":
-            enhanced.update(await self._extract_claude_features(content))
+            enhanced.update(self._extract_claude_features(content, content_lower, stats))
         elif provider == "openai":
-            enhanced.update(await self._extract_openai_features(content))
+            enhanced.update(self._extract_openai_features(content, content_lower, stats))
         elif provider == "perplexity":
-            enhanced.update(await self._extract_perplexity_features(content))
+            enhanced.update(self._extract_perplexity_features(content, content_lower, stats))
 
         # Add general metadata
         enhanced.update({
-            "content_length": len(content),
-            "word_count": len(content.split()),
-            "medical_density": await self._calculate_medical_density(content),
-            "readability_score": await self._calculate_readability(content),
-            "extraction_timestamp": datetime.utcnow().isoformat()
+            "content_length": stats.char_count,
+            "word_count": stats.word_count,
+            "medical_density": self._calculate_medical_density(stats),
+            "readability_score": self._calculate_readability(stats),
+            "extraction_timestamp": datetime.utcnow().isoformat(),
+            **(web_extra or {})
         })
 
         return enhanced
 
-    async def _enhance_web_metadata(
-        self, content: str, provider: str, source_interface: str, metadata: Dict[str, Any]
+    def _extract_gemini_features(
+        self, content: str, content_lower: str, stats: TextStats
     ) -> Dict[str, Any]:
-        """Enhance metadata for web-sourced content"""
-
-        enhanced = await self._enhance_metadata(content, provider, metadata)
-
-        # Add web-specific metadata
-        enhanced.update({
-            "source_interface": source_interface,
-            "extraction_context": "web_interface",
-            "manual_extraction": True,
-            "interface_features_used": await self._detect_interface_features(content, provider)
-        })
-
-        return enhanced
-
-    async def _extract_gemini_features(self, content: str) -> Dict[str, Any]:
         """Extract Gemini-specific features"""
         features = {}
 
         # Detect Deep Search usage
-        if any(indicator in content.lower() for indicator in ["searched for:", "found sources:"]):
+        if any(indicator in content_lower for indicator in ["searched for:", "found sources:"]):
             features["deep_search_used"] = True
-            features["search_results_count"] = len(re.findall(r'\[\d+\]', content))
+            features["search_results_count"] = stats.citation_count
 
         # Detect Deep Think usage
-        if any(indicator in content.lower() for indicator in ["reasoning:", "analysis:"]):
+        if any(indicator in content_lower for indicator in ["reasoning:", "analysis:"]):
             features["deep_think_used"] = True
-            features["reasoning_depth"] = len(re.findall(r'(?:because|therefore|thus|hence)', content.lower()))
+            features["reasoning_depth"] = _count_matches(CAUSAL_REASONING_PATTERN, content_lower)
 
         # Detect multimodal content
-        if any(term in content.lower() for term in ["image", "chart", "diagram", "figure"]):
+        if any(term in content_lower for term in ["image", "chart", "diagram", "figure"]):
             features["multimodal_content"] = True
 
         return features
 
-    async def _extract_claude_features(self, content: str) -> Dict[str, Any]:
+    def _extract_claude_features(
+        self, content: str, content_lower: str, stats: TextStats
+    ) -> Dict[str, Any]:
         """Extract Claude-specific features"""
         features = {}
 
         # Detect extended reasoning
-        reasoning_patterns = len(re.findall(r'(?:let me|first|second|third|finally)', content.lower()))
-        features["reasoning_complexity"] = reasoning_patterns
+        features["reasoning_complexity"] = _count_matches(STEP_REASONING_PATTERN, content_lower)
 
         # Detect file analysis
-        if any(term in content.lower() for term in ["document", "file", "uploaded"]):
+        if any(term in content_lower for term in ["document", "file", "uploaded"]):
             features["file_analysis"] = True
 
         # Detect structured thinking
-        if re.search(r'\d+\.\s|\n-\s|•\s', content):
+        if STRUCTURED_OUTPUT_PATTERN.search(content):
             features["structured_output"] = True
 
         return features
 
-    async def _extract_openai_features(self, content: str) -> Dict[str, Any]:
+    def _extract_openai_features(
+        self, content: str, content_lower: str, stats: TextStats
+    ) -> Dict[str, Any]:
         """Extract OpenAI-specific features"""
         features = {}
 
         # Detect code execution
-        if "```" in content or "execution result" in content.lower():
+        if "```" in content or "execution result" in content_lower:
             features["code_execution_used"] = True
 
         # Detect DALL-E usage
-        if any(term in content.lower() for term in ["generated image", "dall-e", "image created"]):
+        if any(term in content_lower for term in ["generated image", "dall-e", "image created"]):
             features["image_generation"] = True
 
         # Detect web browsing
-        if any(term in content.lower() for term in ["browsed", "searched the web", "found online"]):
+        if any(term in content_lower for term in ["browsed", "searched the web", "found online"]):
             features["web_browsing_used"] = True
 
         return features
 
-    async def _extract_perplexity_features(self, content: str) -> Dict[str, Any]:
+    def _extract_perplexity_features(
+        self, content: str, content_lower: str, stats: TextStats
+    ) -> Dict[str, Any]:
         """Extract Perplexity-specific features"""
         features = {}
 
         # Count source citations
-        citations = len(re.findall(r'\[\d+\]', content))
-        features["source_citations_count"] = citations
+        features["source_citations_count"] = stats.citation_count
 
         # Detect real-time data
-        if any(term in content.lower() for term in ["latest", "recent", "current", "2024"]):
+        if any(term in content_lower for term in ["latest", "recent", "current", "2024"]):
             features["real_time_data"] = True
 
         # Extract source URLs
-        urls = re.findall(r'https?://[^\s]+', content)
-        features["source_urls"] = urls[:10]  # Limit to first 10
+        features["source_urls"] = [  # Limit to first 10
+            match.group() for match in islice(URL_PATTERN.finditer(content), 10)
+        ]
 
         return features
 
+    def _compute_text_stats(self, content: str, medical_concepts: List[str]) -> TextStats:
+        """Collect character, word, sentence, citation and concept counts"""
+        return TextStats(
+            char_count=len(content),
+            word_count=len(content.split()),
+            sentence_count=content.count('.') + content.count('!') + content.count('?'),
+            citation_count=_count_matches(CITATION_PATTERN, content),
+            concept_count=len(medical_concepts)
+        )
+
     def _generate_title(self, content: str, max_length: int = 100) -> str:
         """Generate title from content"""
-        # Simple title generation - take first meaningful sentence
-        sentences = content.split('.')
-        for sentence in sentences:
-            clean_sentence = sentence.strip()
+        # Simple title generation - take first meaningful sentence,
+        # scanning sentence by sentence rather than splitting the whole text
+        start = 0
+        while start <= len(content):
+            end = content.find('.', start)
+            if end == -1:
+                end = len(content)
+            clean_sentence = content[start:end].strip()
             if len(clean_sentence) > 10 and len(clean_sentence) <= max_length:
                 return clean_sentence
+            start = end + 1
 
         # Fallback to first max_length characters
         return content[:max_length].strip() + "..."
 
-    def _extract_tags(self, content: str, provider: str) -> List[str]:
+    def _extract_tags(self, content: str, content_lower: str, provider: str) -> List[str]:
         """Extract relevant tags from content"""
-        tags = [provider]
+        tags = {provider}
 
-        # Medical specialties
-        specialties = ["neurosurgery", "oncology", "cardiology", "radiology", "pathology"]
-        for specialty in specialties:
-            if specialty in content.lower():
-                tags.append(specialty)
+        # Medical specialties and content characteristics in a single scan
+        tags.update(match.group() for match in TAG_KEYWORD_PATTERN.finditer(content_lower))
 
-        # Content characteristics
         if len(content) > 2000:
-            tags.append("detailed_analysis")
-        if "treatment" in content.lower():
-            tags.append("treatment")
-        if "diagnosis" in content.lower():
-            tags.append("diagnosis")
-        if "research" in content.lower():
-            tags.append("research")
+            tags.add("detailed_analysis")
 
-        return list(set(tags))
+        return list(tags)
 
     def _extract_references(self, content: str, provider: str) -> List[str]:
         """Extract references from content"""
         references = []
 
         # URL references
-        urls = re.findall(r'https?://[^\s]+', content)
-        references.extend(urls)
+        references.extend(URL_PATTERN.findall(content))
 
         # Citation patterns
-        citations = re.findall(r'\[(\d+)\]', content)
-        references.extend([f"Citation {c}" for c in citations])
+        references.extend(f"Citation {match.group(1)}" for match in CITATION_PATTERN.finditer(content))
 
         # DOI patterns
-        dois = re.findall(r'10\.\d+/[^\s]+', content)
-        references.extend([f"DOI: {doi}" for doi in dois])
+        references.extend(f"DOI: {match.group()}" for match in DOI_PATTERN.finditer(content))
 
         return references
 
-    async def _calculate_confidence(self, content: str, provider: str, method: str) -> float:
+    def _calculate_confidence(self, stats: TextStats, provider: str, method: str) -> float:
         """Calculate confidence score for content"""
         base_confidence = 0.7
 
@@ -570,67 +1026,233 @@ class ContentIntegrationService:
 
         # Content quality indicators
         quality_score = 0
-        if len(content) > 500:  # Substantial content
+        if stats.char_count > 500:  # Substantial content
             quality_score += 0.1
-        if re.search(r'\[\d+\]', content):  # Has citations
+        if stats.citation_count:  # Has citations
             quality_score += 0.1
-        if len(re.findall(r'[.!?]', content)) > 5:  # Well-structured
+        if stats.sentence_count > 5:  # Well-structured
             quality_score += 0.05
 
         return min(1.0, base_confidence + provider_bonus + method_bonus + quality_score)
 
+    async def flush(self):
+        """Write all buffered content to the database in one transaction"""
+        async with self._flush_lock:
+            if not self._write_buffer:
+                return
+
+            pending, self._write_buffer = self._write_buffer, []
+
+            # Store in database (implementation would depend on your database schema)
+            try:
+                async with get_async_session() as session:
+                    # Implementation for database storage
+                    # This would be a single multi-row insert of `pending` into your content table
+                    pass
+            except Exception as e:
+                logger.error(f"Failed to store {len(pending)} content items in database: {e}")
+
+    async def _flush_after_interval(self):
+        await asyncio.sleep(self.flush_interval)
+        await self.flush()
+
     async def _store_content(self, content: IntegratedContent):
-        """Store content in database and cache"""
+        """Store content in cache and queue it for a batched database write"""
         # Store in cache
         self.content_store[content.id] = content
+        if content.embedding_vector:
+            self._embedding_index.add(content.id, content.embedding_vector)
 
-        # Store in database (implementation would depend on your database schema)
-        try:
-            async with get_async_session() as session:
-                # Implementation for database storage
-                # This would involve inserting into your content table
-                pass
-        except Exception as e:
-            logger.error(f"Failed to store content in database: {e}")
+        # Buffer the database write; flush once a batch fills or the interval passes
+        self._write_buffer.append(content)
+        if len(self._write_buffer) >= self.write_batch_size:
+            await self.flush()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_after_interval())
 
-    async def _calculate_medical_density(self, content: str) -> float:
-        """Calculate the density of medical terms in content"""
-        words = content.split()
-        medical_terms = await self._extract_medical_concepts(content)
+    async def _semantic_search(
+        self,
+        query_embedding: List[float],
+        content_type: Optional[ContentType],
+        provider: Optional[str],
+        source: Optional[ContentSource],
+        max_results: int
+    ) -> List[IntegratedContent]:
+        """Rank stored content by cosine similarity to the query embedding"""
+
+        scores = self._embedding_index.scores(query_embedding)
+        if not scores.size or max_results <= 0:
+            return []
+
+        ids = self._embedding_index.ids
+        if content_type or provider or source:
+            mask = np.fromiter(
+                (
+                    self._matches_filters(self.content_store.peek(content_id), content_type, provider, source)
+                    for content_id in ids
+                ),
+                dtype=bool,
+                count=len(ids)
+            )
+            scores = np.where(mask, scores, -np.inf)
+
+        k = min(max_results, scores.size)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+
+        # Only the returned results count as used for LRU eviction
+        results = []
+        for position in top:
+            if np.isfinite(scores[position]):
+                content = self.content_store.get(ids[position])
+                if content is not None:
+                    results.append(content)
+        return results
+
+    def _matches_filters(
+        self,
+        content: Optional[IntegratedContent],
+        content_type: Optional[ContentType],
+        provider: Optional[str],
+        source: Optional[ContentSource]
+    ) -> bool:
+        """Check stored content against optional search filters"""
+        if content is None:
+            return False
+        if content_type and content.content_type != content_type:
+            return False
+        if provider and content.provider != provider:
+            return False
+        if source and content.source != source:
+            return False
+        return True
+
+    async def _get_all_content(self) -> List[IntegratedContent]:
+        """Get all integrated content"""
+        return list(self.content_store.values())
+
+    async def _merge_content_items(self, items: List[IntegratedContent]) -> Dict[str, Any]:
+        """Merge similar content items, keeping the most confident one as primary"""
+
+        primary = max(items, key=lambda item: item.confidence_score)
+        merged = primary.to_dict()
+
+        merged.update({
+            "merged_from": [item.id for item in items],
+            "providers": list(dict.fromkeys(item.provider for item in items)),
+            "medical_concepts": list(dict.fromkeys(
+                concept for item in items for concept in item.medical_concepts
+            )),
+            "tags": list(dict.fromkeys(tag for item in items for tag in item.tags)),
+            "references": list(dict.fromkeys(
+                reference for item in items for reference in item.references
+            ))
+        })
+
+        return merged
+
+    def _filter_content(self, filter_criteria: Dict[str, Any]) -> List[IntegratedContent]:
+        """Select stored content matching export filter criteria"""
+
+        provider = filter_criteria.get("provider")
+        content_type = filter_criteria.get("content_type")
+        date_from = filter_criteria.get("date_from")
+        date_to = filter_criteria.get("date_to")
+        date_from = datetime.fromisoformat(date_from) if date_from else None
+        date_to = datetime.fromisoformat(date_to) if date_to else None
+
+        return [
+            item for item in list(self.content_store.values())
+            if (not provider or item.provider == provider)
+            and (not content_type or item.content_type == content_type)
+            and (not date_from or item.created_at >= date_from)
+            and (not date_to or item.created_at <= date_to)
+        ]
+
+    async def _export_to_json(self, content_items: List[IntegratedContent]) -> AsyncIterator[bytes]:
+        """Stream content as a JSON array, one item per chunk"""
+        yield b"["
+        for position, item in enumerate(content_items):
+            if ORJSON_AVAILABLE:
+                encoded = orjson.dumps(item, option=orjson.OPT_NAIVE_UTC, default=str)
+            else:
+                encoded = json.dumps(item.to_dict(), default=str).encode()
+            yield b"," + encoded if position else encoded
+        yield b"]"
 
-        if not words:
+    async def _export_to_markdown(self, content_items: List[IntegratedContent]) -> AsyncIterator[bytes]:
+        """Stream content as Markdown, one section per item"""
+        yield b"# Integrated Content Export\n\n"
+        for item in content_items:
+            section = (
+                f"## {item.title}\n\n"
+                f"- **Provider:** {item.provider}\n"
+                f"- **Source:** {item.source.value}\n"
+                f"- **Content Type:** {item.content_type.value}\n"
+                f"- **Confidence:** {item.confidence_score:.2f}\n"
+                f"- **Created:** {item.created_at.isoformat()}\n"
+                f"- **Tags:** {', '.join(item.tags)}\n\n"
+                f"{item.content}\n\n---\n\n"
+            )
+            yield section.encode()
+
+    async def _export_to_csv(
+        self, content_items: List[IntegratedContent], rows_per_chunk: int = 100
+    ) -> AsyncIterator[bytes]:
+        """Stream content as CSV, flushing every ``rows_per_chunk`` rows"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow([
+            "id", "title", "provider", "source", "content_type", "extraction_method",
+            "confidence_score", "created_at", "tags", "medical_concepts", "content"
+        ])
+
+        for position, item in enumerate(content_items, start=1):
+            writer.writerow([
+                item.id, item.title, item.provider, item.source.value, item.content_type.value,
+                item.extraction_method, item.confidence_score, item.created_at.isoformat(),
+                ";".join(item.tags), ";".join(item.medical_concepts), item.content
+            ])
+            if position % rows_per_chunk == 0:
+                yield buffer.getvalue().encode()
+                buffer.seek(0)
+                buffer.truncate()
+
+        if buffer.tell():
+            yield buffer.getvalue().encode()
+
+    def _calculate_medical_density(self, stats: TextStats) -> float:
+        """Calculate the density of medical terms in content"""
+        if not stats.word_count:
             return 0.0
 
-        return len(medical_terms) / len(words)
+        return stats.concept_count / stats.word_count
 
-    async def _calculate_readability(self, content: str) -> float:
+    def _calculate_readability(self, stats: TextStats) -> float:
         """Calculate readability score (simplified)"""
-        sentences = len(re.findall(r'[.!?]', content))
-        words = len(content.split())
-
-        if sentences == 0:
+        if stats.sentence_count == 0:
             return 0.0
 
         # Simplified readability (average words per sentence)
-        avg_words_per_sentence = words / sentences
+        avg_words_per_sentence = stats.word_count / stats.sentence_count
 
         # Score from 0-1 (lower is more readable)
         return min(1.0, avg_words_per_sentence / 25)
 
-    async def _detect_interface_features(self, content: str, provider: str) -> List[str]:
+    def _detect_interface_features(self, content_lower: str, provider: str) -> List[str]:
         """Detect which interface features were used"""
         features = []
 
         if provider == "gemini":
-            if "deep search" in content.lower():
+            if "deep search" in content_lower:
                 features.append("deep_search")
-            if "deep think" in content.lower():
+            if "deep think" in content_lower:
                 features.append("deep_think")
 
         elif provider == "claude":
-            if "reasoning" in content.lower():
+            if "reasoning" in content_lower:
                 features.append("extended_reasoning")
-            if "file" in content.lower():
+            if "file" in content_lower:
                 features.append("file_analysis")
 
         # Add more provider-specific feature detection
@@ -4,12 +4,20 @@ Text extraction, indexing, search, and AI-powered analysis
 """
 
 import asyncio
+import io
 import logging
-import mimetypes
+import multiprocessing
+import functools
 import hashlib
-from typing import Dict, Any, List, Optional
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple
 from datetime import datetime
+from pathlib import Path
+from html import unescape as unescape_html
 import re
+from collections import Counter
 
 # Document processing libraries
 try:
@@ -24,24 +32,245 @@ except ImportError:
     BeautifulSoup = None
     markdown = None
 
+# pypdfium2 extracts PDF text in native code; PyPDF2 remains the fallback
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+try:
+    from charset_normalizer import from_bytes as detect_charset
+except ImportError:
+    detect_charset = None
+
+# BeautifulSoup tree builder, chosen once: libxml2's C parser when lxml is
+# installed, the pure-Python html.parser otherwise
+try:
+    import lxml
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+from ..core.config import settings
 from ..core.database import get_async_session
-from ..models.document import Document, DocumentExtract, DocumentAnalysis
-from sqlalchemy import select, update, and_, or_, desc
-from sqlalchemy.orm import selectinload
+from ..models.document import Document, DocumentExtract, DocumentAnalysis, ProcessingStatus
+from sqlalchemy import select, update, and_, or_, desc, func
+from sqlalchemy.orm import load_only
 
 logger = logging.getLogger(__name__)
 
+# Supported MIME types and the extractor that handles each
+SUPPORTED_MIME_TYPES = {
+    'application/pdf': 'pdf',
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document': 'docx',
+    'text/plain': 'txt',
+    'text/markdown': 'md',
+    'text/html': 'html'
+}
+FILE_TYPE_MIME_TYPES = {file_type: mime_type for mime_type, file_type in SUPPORTED_MIME_TYPES.items()}
+
+# File extension -> extractor, resolved with one dict lookup instead of mimetypes
+EXTENSION_FILE_TYPES = {
+    'pdf': 'pdf',
+    'docx': 'docx',
+    'txt': 'txt',
+    'md': 'md',
+    'markdown': 'md',
+    'html': 'html',
+    'htm': 'html'
+}
+
+# DocumentExtract.extract_type of the full extracted text of a document
+FULL_TEXT_EXTRACT_TYPE = "full_text"
+
+# Statuses a document passes through between upload and completion
+IN_PROGRESS_STATUSES = {
+    ProcessingStatus.PROCESSING.value,
+    ProcessingStatus.EXTRACTING.value,
+    ProcessingStatus.INDEXING.value
+}
+
+# Smallest page range handed to one worker, so tiny PDFs are not over-split
+PDF_MIN_PAGES_PER_TASK = 4
+
+# Threads for file reads and tokenizing, kept apart from the event loop's
+# default executor so batch processing cannot starve other to_thread users
+IO_POOL_WORKERS = 8
+
+# Whitespace runs collapsed by _clean_extracted_text in a single pass;
+# the replacement is picked by which alternative matched
+WHITESPACE_RUN_PATTERN = re.compile(r'(\n\s*\n)|( +)|(\t+)')
+WHITESPACE_RUN_REPLACEMENTS = (None, '\n\n', ' ', '\t')
+
+# str.translate table deleting C0 control characters other than tab and
+# newline; printable Unicode (accents, Greek letters, symbols) is kept
+CONTROL_CHAR_TABLE = dict.fromkeys(c for c in range(0x20) if c not in (0x09, 0x0A))
+
+# Markdown syntax stripped by _simple_markdown_to_text
+MD_HEADER_PATTERN = re.compile(r'^#{1,6}\s*', re.MULTILINE)
+MD_BOLD_PATTERN = re.compile(r'\*\*(.*?)\*\*')
+MD_ITALIC_PATTERN = re.compile(r'\*(.*?)\*')
+MD_BOLD_UNDERSCORE_PATTERN = re.compile(r'__(.*?)__')
+MD_ITALIC_UNDERSCORE_PATTERN = re.compile(r'_(.*?)_')
+MD_LINK_PATTERN = re.compile(r'\[([^\]]+)\]\([^\)]+\)')
+MD_CODE_BLOCK_PATTERN = re.compile(r'```.*?```', re.DOTALL)
+MD_INLINE_CODE_PATTERN = re.compile(r'`([^`]+)`')
+
+# Word tokens counted into DocumentExtract.token_tf and matched by keyword search
+TOKEN_PATTERN = re.compile(r'\w+')
+
+@functools.lru_cache(maxsize=256)
+def _query_token_pattern(query_terms: Tuple[str, ...]) -> re.Pattern:
+    """Compile one case-insensitive whole-word alternation of query tokens"""
+    return re.compile(r'\b(?:' + '|'.join(map(re.escape, query_terms)) + r')\b', re.IGNORECASE)
+
+# Script/style blocks and tags removed by _simple_html_to_text in one scan
+HTML_MARKUP_PATTERN = re.compile(
+    r'<script.*?</script>|<style.*?</style>|<[^>]+>', re.DOTALL | re.IGNORECASE
+)
+
+def _pdf_info_worker(file_content: bytes) -> Dict[str, Any]:
+    """Read page count and document info from a PDF (runs in a worker process)"""
+
+    if pdfium:
+        pdf = pdfium.PdfDocument(file_content)
+        try:
+            info = pdf.get_metadata_dict()
+            return {
+                "page_count": len(pdf),
+                "pdf_info": {
+                    "title": info.get("Title", ""),
+                    "author": info.get("Author", ""),
+                    "subject": info.get("Subject", ""),
+                    "creator": info.get("Creator", "")
+                }
+            }
+        finally:
+            pdf.close()
+
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_content))
+
+    metadata = {
+        "page_count": len(pdf_reader.pages),
+        "pdf_info": {}
+    }
+
+    # Extract PDF metadata if available
+    if pdf_reader.metadata:
+        metadata["pdf_info"] = {
+            "title": str(pdf_reader.metadata.get("/Title", "")),
+            "author": str(pdf_reader.metadata.get("/Author", "")),
+            "subject": str(pdf_reader.metadata.get("/Subject", "")),
+            "creator": str(pdf_reader.metadata.get("/Creator", ""))
+        }
+
+    return metadata
+
+def _pdf_pages_worker(file_content: bytes, start: int, stop: int) -> str:
+    """Extract cleaned text for pages [start, stop) of a PDF (runs in a worker process)"""
+
+    if pdfium:
+        pdf = pdfium.PdfDocument(file_content)
+        try:
+            text_content = _collect_page_texts(
+                lambda page_num: _pdfium_page_text(pdf, page_num), start, stop
+            )
+        finally:
+            pdf.close()
+    else:
+        pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_content))
+        text_content = _collect_page_texts(
+            lambda page_num: pdf_reader.pages[page_num].extract_text(), start, stop
+        )
+
+    return DocumentProcessor._clean_extracted_text("\n".join(text_content))
+
+def _collect_page_texts(extract_page, start: int, stop: int) -> List[str]:
+    text_content = []
+    for page_num in range(start, stop):
+        try:
+            page_text = extract_page(page_num)
+            if page_text.strip():
+                text_content.append(f"[Page {page_num + 1}]\n{page_text}\n")
+        except Exception as e:
+            logger.warning(f"Failed to extract text from page {page_num + 1}: {e}")
+            continue
+    return text_content
+
+def _pdfium_page_text(pdf: Any, page_num: int) -> str:
+    page = pdf[page_num]
+    textpage = page.get_textpage()
+    try:
+        return textpage.get_text_range()
+    finally:
+        textpage.close()
+        page.close()
+
+def _docx_extract_worker(file_content: bytes) -> Dict[str, Any]:
+    """Extract cleaned text and metadata from a DOCX file (runs in a worker process)"""
+
+    doc = docx.Document(io.BytesIO(file_content))
+
+    # python-docx rebuilds .text from the XML runs on every access, so each
+    # paragraph and cell is read once
+    text_content = [text for text in (p.text for p in doc.paragraphs) if text.strip()]
+    tables = doc.tables
+    metadata = {
+        "paragraph_count": len(text_content),
+        "table_count": len(tables)
+    }
+
+    # Extract text from tables
+    for table in tables:
+        table_text = "\n".join(
+            " | ".join(cells)
+            for cells in (
+                [text for text in (cell.text.strip() for cell in row.cells) if text]
+                for row in table.rows
+            )
+            if cells
+        )
+
+        if table_text:
+            text_content.append(f"\n[TABLE]\n{table_text}\n[/TABLE]\n")
+
+    full_text = "\n".join(text_content)
+
+    return {
+        "content": DocumentProcessor._clean_extracted_text(full_text),
+        "metadata": metadata
+    }
+
 class DocumentProcessor:
     """Service for processing uploaded documents"""
 
+    # Shared pool for CPU-bound PDF/DOCX parsing, created on first use.
+    # "spawn" avoids forking a process that holds the event loop and DB pool.
+    _process_pool: Optional[ProcessPoolExecutor] = None
+
+    @classmethod
+    def _get_process_pool(cls) -> ProcessPoolExecutor:
+        if cls._process_pool is None:
+            cls._process_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return cls._process_pool
+
+    # Shared thread pool for blocking file reads and GIL-light text work
+    _io_pool: Optional[ThreadPoolExecutor] = None
+
+    @classmethod
+    def _get_io_pool(cls) -> ThreadPoolExecutor:
+        if cls._io_pool is None:
+            cls._io_pool = ThreadPoolExecutor(
+                max_workers=IO_POOL_WORKERS,
+                thread_name_prefix="document-io"
+            )
+        return cls._io_pool
+
     def __init__(self):
-        self.supported_types = {
-            'application/pdf': 'pdf',
-            'application/vnd.openxmlformats-officedocument.wordprocessingml.document': 'docx',
-            'text/plain': 'txt',
-            'text/markdown': 'md',
-            'text/html': 'html'
-        }
+        self.supported_types = SUPPORTED_MIME_TYPES
 
     async def process_document(self, document_id: str) -> Dict[str, Any]:
         """Process a document: extract text, create index, analyze content"""
@@ -59,32 +288,82 @@ class DocumentProcessor:
                     return {"success": False, "error": "Document not found"}
 
                 # Update status to processing
-                document.status = "processing"
+                document.processing_status = ProcessingStatus.PROCESSING.value
                 await session.commit()
 
                 try:
-                    # Extract text content
-                    extraction_result = await self._extract_text(document)
-
-                    if not extraction_result["success"]:
-                        document.status = "error"
-                        await session.commit()
-                        return extraction_result
-
-                    # Store extracted content
-                    extract = DocumentExtract(
-                        document_id=document_id,
-                        content=extraction_result["content"],
-                        extraction_method=extraction_result["method"],
-                        word_count=len(extraction_result["content"].split()),
-                        processing_metadata=extraction_result.get("metadata", {})
-                    )
-
-                    session.add(extract)
+                    # Identical bytes (a re-upload or a reprocess) reuse the
+                    # stored extract instead of being parsed again
+                    file_content = await self._read_file_content(document)
+                    content_sha256 = hashlib.sha256(file_content).hexdigest() if file_content else None
+
+                    existing_extract = None
+                    if content_sha256:
+                        existing_stmt = select(DocumentExtract).where(
+                            DocumentExtract.extract_type == FULL_TEXT_EXTRACT_TYPE,
+                            DocumentExtract.content_sha256 == content_sha256
+                        ).order_by(desc(DocumentExtract.created_at)).limit(1)
+                        existing_result = await session.execute(existing_stmt)
+                        existing_extract = existing_result.scalar_one_or_none()
+
+                    if existing_extract is not None:
+                        # The extraction method lives on the document that was parsed
+                        if existing_extract.document_id == document.id:
+                            processing_log = document.processing_log
+                        else:
+                            processing_log = (await session.execute(
+                                select(Document.processing_log).where(
+                                    Document.id == existing_extract.document_id
+                                )
+                            )).scalar_one_or_none()
+                        processing_log = processing_log or {}
+                        extraction_result = {
+                            "success": True,
+                            "content": existing_extract.content,
+                            "method": processing_log.get("extraction_method"),
+                            "metadata": processing_log.get("metadata", {})
+                        }
+                        token_tf = existing_extract.token_tf
+                    else:
+                        # Extract text content
+                        extraction_result = await self._extract_text(document, file_content)
+
+                        if not extraction_result["success"]:
+                            document.processing_status = ProcessingStatus.FAILED.value
+                            await session.commit()
+                            return extraction_result
+
+                        # Term frequencies are stored with the extract, so
+                        # keyword search never re-tokenizes the text
+                        token_tf = await asyncio.get_running_loop().run_in_executor(
+                            self._get_io_pool(), self._term_frequencies, extraction_result["content"]
+                        )
+
+                    # A document that already has the extract for these bytes keeps it
+                    if existing_extract is None or existing_extract.document_id != document.id:
+                        # Store extracted content
+                        extract = DocumentExtract(
+                            document_id=document_id,
+                            extract_type=FULL_TEXT_EXTRACT_TYPE,
+                            content=extraction_result["content"],
+                            content_sha256=content_sha256,
+                            token_tf=token_tf
+                        )
+
+                        session.add(extract)
+
+                    # Extraction details are kept on the document itself
+                    metadata = extraction_result.get("metadata", {})
+                    document.word_count = len(extraction_result["content"].split())
+                    document.page_count = metadata.get("page_count", document.page_count)
+                    document.processing_log = {
+                        "extraction_method": extraction_result["method"],
+                        "metadata": metadata
+                    }
 
                     # Update document status
-                    document.status = "ready"
-                    document.processed_at = datetime.utcnow()
+                    document.processing_status = ProcessingStatus.COMPLETED.value
+                    document.indexed_at = datetime.utcnow()
 
                     await session.commit()
 
@@ -94,12 +373,12 @@ class DocumentProcessor:
                         "success": True,
                         "document_id": document_id,
                         "content_length": len(extraction_result["content"]),
-                        "word_count": extract.word_count,
+                        "word_count": document.word_count,
                         "extraction_method": extraction_result["method"]
                     }
 
                 except Exception as e:
-                    document.status = "error"
+                    document.processing_status = ProcessingStatus.FAILED.value
                     await session.commit()
                     logger.error(f"Error processing document {document_id}: {e}")
                     return {"success": False, "error": str(e)}
@@ -108,31 +387,54 @@ class DocumentProcessor:
             logger.error(f"Document processing failed: {e}")
             return {"success": False, "error": str(e)}
 
-    async def _extract_text(self, document: Document) -> Dict[str, Any]:
+    async def process_documents(
+        self,
+        document_ids: List[str],
+        concurrency: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Process several documents concurrently, yielding results as they finish"""
+
+        # Each in-flight document holds a DB connection and a parsing worker
+        if concurrency is None:
+            concurrency = min(os.cpu_count() or 1, settings.database_pool_size)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def process_one(document_id: str) -> Dict[str, Any]:
+            async with semaphore:
+                result = await self.process_document(document_id)
+            return {"document_id": document_id, **result}
+
+        tasks = [asyncio.create_task(process_one(document_id)) for document_id in document_ids]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Stop outstanding work if the caller abandons the iteration
+            for task in tasks:
+                task.cancel()
+
+    async def _extract_text(self, document: Document, file_content: Optional[bytes]) -> Dict[str, Any]:
         """Extract text content from document based on file type"""
 
         try:
             # Determine file type
-            mime_type = mimetypes.guess_type(document.filename)[0]
-            if not mime_type or mime_type not in self.supported_types:
-                return {"success": False, "error": f"Unsupported file type: {mime_type}"}
-
-            file_type = self.supported_types[mime_type]
+            file_type = self._file_type(document)
+            if not file_type:
+                return {"success": False, "error": f"Unsupported file type: {document.original_filename}"}
 
-            # Read file content
-            if not document.file_content:
+            if not file_content:
                 return {"success": False, "error": "No file content available"}
 
             if file_type == 'pdf':
-                return await self._extract_pdf_text(document.file_content)
+                return await self._extract_pdf_text(file_content)
             elif file_type == 'docx':
-                return await self._extract_docx_text(document.file_content)
+                return await self._extract_docx_text(file_content)
             elif file_type == 'txt':
-                return await self._extract_txt_text(document.file_content)
+                return await self._extract_txt_text(file_content)
             elif file_type == 'md':
-                return await self._extract_markdown_text(document.file_content)
+                return await self._extract_markdown_text(file_content)
             elif file_type == 'html':
-                return await self._extract_html_text(document.file_content)
+                return await self._extract_html_text(file_content)
             else:
                 return {"success": False, "error": f"No extractor for file type: {file_type}"}
 
@@ -140,50 +442,66 @@ class DocumentProcessor:
             logger.error(f"Text extraction failed: {e}")
             return {"success": False, "error": str(e)}
 
-    async def _extract_pdf_text(self, file_content: bytes) -> Dict[str, Any]:
-        """Extract text from PDF file"""
+    @staticmethod
+    def _file_type(document: Document) -> Optional[str]:
+        """Resolve the extractor type from the stored upload type or the filename extension"""
 
-        if not PyPDF2:
-            return {"success": False, "error": "PDF processing not available (PyPDF2 required)"}
+        # Uploads record their extension in Document.file_type
+        extension = document.file_type or document.original_filename.rsplit('.', 1)[-1]
+        return EXTENSION_FILE_TYPES.get(extension.lower())
 
-        try:
-            import io
-            pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_content))
+    @classmethod
+    async def _read_file_content(cls, document: Document) -> Optional[bytes]:
+        """Return the uploaded bytes, reading the file off the event loop"""
 
-            text_content = []
-            metadata = {
-                "page_count": len(pdf_reader.pages),
-                "pdf_info": {}
-            }
+        # Uploads are stored on disk (Document.file_path) and read in a
+        # worker thread so a large file never blocks other requests
+        file_path = document.file_path
+        if not file_path:
+            return None
 
-            # Extract PDF metadata if available
-            if pdf_reader.metadata:
-                metadata["pdf_info"] = {
-                    "title": pdf_reader.metadata.get("/Title", ""),
-                    "author": pdf_reader.metadata.get("/Author", ""),
-                    "subject": pdf_reader.metadata.get("/Subject", ""),
-                    "creator": pdf_reader.metadata.get("/Creator", "")
-                }
+        return await asyncio.get_running_loop().run_in_executor(
+            cls._get_io_pool(), Path(file_path).read_bytes
+        )
 
-            # Extract text from each page
-            for page_num, page in enumerate(pdf_reader.pages):
-                try:
-                    page_text = page.extract_text()
-                    if page_text.strip():
-                        text_content.append(f"[Page {page_num + 1}]\n{page_text}\n")
-                except Exception as e:
-                    logger.warning(f"Failed to extract text from page {page_num + 1}: {e}")
-                    continue
+    async def _extract_pdf_text(self, file_content: bytes) -> Dict[str, Any]:
+        """Extract text from PDF file"""
+
+        if not pdfium and not PyPDF2:
+            return {"success": False, "error": "PDF processing not available (pypdfium2 or PyPDF2 required)"}
 
-            full_text = "\n".join(text_content)
+        try:
+            loop = asyncio.get_running_loop()
+            pool = self._get_process_pool()
+
+            metadata = await loop.run_in_executor(pool, _pdf_info_worker, file_content)
+
+            # Extract page ranges in parallel across the pool, keeping page order
+            page_count = metadata["page_count"]
+            pages_per_task = max(PDF_MIN_PAGES_PER_TASK, -(-page_count // (os.cpu_count() or 1)))
+            page_ranges = [
+                (start, min(start + pages_per_task, page_count))
+                for start in range(0, page_count, pages_per_task)
+            ]
+            chunks = await asyncio.gather(
+                *[
+                    loop.run_in_executor(pool, _pdf_pages_worker, file_content, start, stop)
+                    for start, stop in page_ranges
+                ],
+                return_exceptions=True
+            )
 
-            # Clean up text
-            full_text = self._clean_extracted_text(full_text)
+            text_content = []
+            for (start, stop), chunk in zip(page_ranges, chunks):
+                if isinstance(chunk, Exception):
+                    logger.warning(f"Failed to extract text from pages {start + 1}-{stop}: {chunk}")
+                elif chunk:
+                    text_content.append(chunk)
 
             return {
                 "success": True,
-                "content": full_text,
-                "method": "PyPDF2",
+                "content": "\n\n".join(text_content),
+                "method": "pypdfium2" if pdfium else "PyPDF2",
                 "metadata": metadata
             }
 
@@ -198,44 +516,16 @@ class DocumentProcessor:
             return {"success": False, "error": "DOCX processing not available (python-docx required)"}
 
         try:
-            import io
-            doc = docx.Document(io.BytesIO(file_content))
-
-            text_content = []
-            metadata = {
-                "paragraph_count": 0,
-                "table_count": 0
-            }
-
-            # Extract text from paragraphs
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    text_content.append(paragraph.text)
-                    metadata["paragraph_count"] += 1
-
-            # Extract text from tables
-            for table in doc.tables:
-                metadata["table_count"] += 1
-                table_text = []
-                for row in table.rows:
-                    row_text = []
-                    for cell in row.cells:
-                        if cell.text.strip():
-                            row_text.append(cell.text.strip())
-                    if row_text:
-                        table_text.append(" | ".join(row_text))
-
-                if table_text:
-                    text_content.append("\n[TABLE]\n" + "\n".join(table_text) + "\n[/TABLE]\n")
-
-            full_text = "\n".join(text_content)
-            full_text = self._clean_extracted_text(full_text)
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                self._get_process_pool(), _docx_extract_worker, file_content
+            )
 
             return {
                 "success": True,
-                "content": full_text,
+                "content": result["content"],
                 "method": "python-docx",
-                "metadata": metadata
+                "metadata": result["metadata"]
             }
 
         except Exception as e:
@@ -246,27 +536,32 @@ class DocumentProcessor:
         """Extract text from plain text file"""
 
         try:
-            # Try different encodings
-            encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
-
-            for encoding in encodings:
-                try:
-                    text = file_content.decode(encoding)
-                    cleaned_text = self._clean_extracted_text(text)
+            # Most uploads are UTF-8, and a strict decode is the fastest check
+            try:
+                text = file_content.decode('utf-8')
+                encoding = 'utf-8'
+            except UnicodeDecodeError:
+                # Detect the legacy encoding once instead of trial-decoding;
+                # latin-1 maps every byte, so it is the last resort
+                best = detect_charset(file_content).best() if detect_charset else None
+                if best is not None:
+                    text = str(best)
+                    encoding = best.encoding
+                else:
+                    text = file_content.decode('latin-1')
+                    encoding = 'latin-1'
 
-                    return {
-                        "success": True,
-                        "content": cleaned_text,
-                        "method": f"text_decode_{encoding}",
-                        "metadata": {
-                            "encoding": encoding,
-                            "line_count": len(text.splitlines())
-                        }
-                    }
-                except UnicodeDecodeError:
-                    continue
+            cleaned_text = self._clean_extracted_text(text)
 
-            return {"success": False, "error": "Could not decode text file with any supported encoding"}
+            return {
+                "success": True,
+                "content": cleaned_text,
+                "method": f"text_decode_{encoding}",
+                "metadata": {
+                    "encoding": encoding,
+                    "line_count": len(text.splitlines())
+                }
+            }
 
         except Exception as e:
             logger.error(f"Text extraction failed: {e}")
@@ -283,7 +578,7 @@ class DocumentProcessor:
             if markdown and BeautifulSoup:
                 try:
                     html = markdown.markdown(text)
-                    soup = BeautifulSoup(html, 'html.parser')
+                    soup = BeautifulSoup(html, HTML_PARSER)
                     extracted_text = soup.get_text()
                     method = "markdown_to_html"
                 except:
@@ -318,7 +613,7 @@ class DocumentProcessor:
             html = file_content.decode('utf-8')
 
             if BeautifulSoup:
-                soup = BeautifulSoup(html, 'html.parser')
+                soup = BeautifulSoup(html, HTML_PARSER)
                 # Remove script and style elements
                 for script in soup(["script", "style"]):
                     script.decompose()
@@ -345,16 +640,17 @@ class DocumentProcessor:
             logger.error(f"HTML extraction failed: {e}")
             return {"success": False, "error": f"HTML extraction failed: {str(e)}"}
 
-    def _clean_extracted_text(self, text: str) -> str:
+    @staticmethod
+    def _clean_extracted_text(text: str) -> str:
         """Clean and normalize extracted text"""
 
-        # Remove excessive whitespace
-        text = re.sub(r'\n\s*\n', '\n\n', text)  # Multiple newlines to double newline
-        text = re.sub(r' +', ' ', text)  # Multiple spaces to single space
-        text = re.sub(r'\t+', '\t', text)  # Multiple tabs to single tab
+        # Collapse newline, space and tab runs in one scan
+        text = WHITESPACE_RUN_PATTERN.sub(
+            lambda match: WHITESPACE_RUN_REPLACEMENTS[match.lastindex], text
+        )
 
-        # Remove non-printable characters (except newlines, tabs, and common punctuation)
-        text = re.sub(r'[^\x20-\x7E\n\t]', '', text)
+        # Remove control characters (except newlines and tabs)
+        text = text.translate(CONTROL_CHAR_TABLE)
 
         # Trim whitespace
         text = text.strip()
@@ -367,56 +663,49 @@ class DocumentProcessor:
         text = markdown_text
 
         # Remove headers
-        text = re.sub(r'^#{1,6}\s*', '', text, flags=re.MULTILINE)
+        text = MD_HEADER_PATTERN.sub('', text)
 
         # Remove bold and italic
-        text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)
-        text = re.sub(r'\*(.*?)\*', r'\1', text)
-        text = re.sub(r'__(.*?)__', r'\1', text)
-        text = re.sub(r'_(.*?)_', r'\1', text)
+        text = MD_BOLD_PATTERN.sub(r'\1', text)
+        text = MD_ITALIC_PATTERN.sub(r'\1', text)
+        text = MD_BOLD_UNDERSCORE_PATTERN.sub(r'\1', text)
+        text = MD_ITALIC_UNDERSCORE_PATTERN.sub(r'\1', text)
 
         # Remove links
-        text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)
+        text = MD_LINK_PATTERN.sub(r'\1', text)
 
         # Remove code blocks
-        text = re.sub(r'```.*?```', '', text, flags=re.DOTALL)
-        text = re.sub(r'`([^`]+)`', r'\1', text)
+        text = MD_CODE_BLOCK_PATTERN.sub('', text)
+        text = MD_INLINE_CODE_PATTERN.sub(r'\1', text)
 
         return text
 
     def _simple_html_to_text(self, html: str) -> str:
         """Simple HTML to text conversion without external libraries"""
 
-        # Remove script and style content
-        text = re.sub(r'<script.*?</script>', '', html, flags=re.DOTALL | re.IGNORECASE)
-        text = re.sub(r'<style.*?</style>', '', text, flags=re.DOTALL | re.IGNORECASE)
-
-        # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
-
-        # Decode HTML entities
-        html_entities = {
-            '&amp;': '&',
-            '&lt;': '<',
-            '&gt;': '>',
-            '&quot;': '"',
-            '&#39;': "'",
-            '&nbsp;': ' '
-        }
-
-        for entity, char in html_entities.items():
-            text = text.replace(entity, char)
+        # Remove script/style content and tags in a single pass
+        text = HTML_MARKUP_PATTERN.sub('', html)
 
-        return text
+        # Decode HTML entities (named and numeric)
+        return unescape_html(text)
 
     async def get_document_content(self, document_id: str) -> Dict[str, Any]:
         """Get processed content for a document"""
 
         try:
             async with get_async_session() as session:
-                # Get document with extract
+                # Load only the metadata returned with the content
                 stmt = select(Document).options(
-                    selectinload(Document.extracts)
+                    load_only(
+                        Document.id,
+                        Document.title,
+                        Document.document_type,
+                        Document.authors,
+                        Document.specialty,
+                        Document.word_count,
+                        Document.processing_status,
+                        Document.processing_log
+                    )
                 ).where(Document.id == document_id)
 
                 result = await session.execute(stmt)
@@ -426,10 +715,10 @@ class DocumentProcessor:
                     return {"success": False, "error": "Document not found"}
 
                 # Check if document is processed
-                if document.status != "ready":
-                    if document.status == "processing":
+                if document.processing_status != ProcessingStatus.COMPLETED.value:
+                    if document.processing_status in IN_PROGRESS_STATUSES:
                         return {"success": False, "error": "Document is still being processed"}
-                    elif document.status == "error":
+                    elif document.processing_status == ProcessingStatus.FAILED.value:
                         return {"success": False, "error": "Document processing failed"}
                     else:
                         # Try to process if not started
@@ -437,10 +726,15 @@ class DocumentProcessor:
                         if not process_result["success"]:
                             return process_result
 
-                # Get latest extract
-                if document.extracts:
-                    latest_extract = max(document.extracts, key=lambda e: e.created_at)
+                # Get latest extract (one row via the document_id, created_at index)
+                extract_stmt = select(DocumentExtract).where(
+                    DocumentExtract.document_id == document_id
+                ).order_by(desc(DocumentExtract.created_at)).limit(1)
 
+                result = await session.execute(extract_stmt)
+                latest_extract = result.scalar_one_or_none()
+
+                if latest_extract:
                     return {
                         "success": True,
                         "content": latest_extract.content,
@@ -449,8 +743,8 @@ class DocumentProcessor:
                             "document_type": document.document_type,
                             "authors": document.authors,
                             "specialty": document.specialty,
-                            "word_count": latest_extract.word_count,
-                            "extraction_method": latest_extract.extraction_method,
+                            "word_count": document.word_count,
+                            "extraction_method": (document.processing_log or {}).get("extraction_method"),
                             "processing_timestamp": latest_extract.created_at.isoformat()
                         }
                     }
@@ -473,28 +767,45 @@ class DocumentProcessor:
 
         try:
             async with get_async_session() as session:
-                # Build base query
-                base_stmt = select(Document, DocumentExtract).join(
+                if search_type != "keyword":
+                    # Ranked by Postgres full-text search over the indexed tsvector;
+                    # "semantic" uses it too until vector search is wired up
+                    search_results = await self._fulltext_search(
+                        session, query, document_ids, max_results, include_snippets
+                    )
+
+                    return {
+                        "success": True,
+                        "results": search_results,
+                        "total_found": len(search_results),
+                        "search_time_ms": 0  # Would track actual search time
+                    }
+
+                # Keyword search matches exact, unstemmed terms, which the
+                # stemmed full-text index cannot tell apart
+                base_stmt = select(Document, DocumentExtract).options(
+                    load_only(
+                        Document.id,
+                        Document.title,
+                        Document.document_type,
+                        Document.authors,
+                        Document.specialty,
+                        Document.word_count
+                    )
+                ).join(
                     DocumentExtract, Document.id == DocumentExtract.document_id
-                ).where(Document.status == "ready")
+                ).where(Document.processing_status == ProcessingStatus.COMPLETED.value)
 
                 # Filter by document IDs if provided
                 if document_ids:
                     base_stmt = base_stmt.where(Document.id.in_(document_ids))
 
-                # Execute query
-                result = await session.execute(base_stmt)
-                documents_with_extracts = result.all()
-
-                # Perform search based on type
-                if search_type == "keyword":
-                    search_results = self._keyword_search(documents_with_extracts, query, max_results)
-                elif search_type == "semantic":
-                    # For now, fall back to keyword search
-                    # In production, you would use vector embeddings and similarity search
-                    search_results = self._keyword_search(documents_with_extracts, query, max_results)
-                else:
-                    search_results = self._keyword_search(documents_with_extracts, query, max_results)
+                # Stream rows in batches and keep only the best matches, so
+                # extract bodies are never all held in memory at once
+                result = await session.stream(base_stmt.execution_options(yield_per=50))
+                search_results, total_found, documents_searched = await self._keyword_search(
+                    result, query, max_results
+                )
 
                 # Add snippets if requested
                 if include_snippets:
@@ -503,9 +814,9 @@ class DocumentProcessor:
 
                 return {
                     "success": True,
-                    "results": search_results[:max_results],
-                    "total_found": len(search_results),
-                    "documents_searched": len(documents_with_extracts),
+                    "results": search_results,
+                    "total_found": total_found,
+                    "documents_searched": documents_searched,
                     "search_time_ms": 0  # Would track actual search time
                 }
 
@@ -513,53 +824,145 @@ class DocumentProcessor:
             logger.error(f"Document search failed: {e}")
             return {"success": False, "error": str(e)}
 
-    def _keyword_search(self, documents_with_extracts, query: str, max_results: int) -> List[Dict[str, Any]]:
-        """Perform keyword-based search"""
+    async def _fulltext_search(
+        self,
+        session,
+        query: str,
+        document_ids: Optional[List[str]],
+        max_results: int,
+        include_snippets: bool
+    ) -> List[Dict[str, Any]]:
+        """Rank extracts with ts_rank_cd over the GIN-indexed content_tsv column"""
+
+        ts_query = func.plainto_tsquery('english', query)
+        columns = [
+            Document.id,
+            Document.title,
+            Document.document_type,
+            Document.authors,
+            Document.specialty,
+            Document.word_count,
+            func.ts_rank_cd(DocumentExtract.content_tsv, ts_query).label('score')
+        ]
+        if include_snippets:
+            columns.append(
+                func.ts_headline(
+                    'english', DocumentExtract.content, ts_query, 'MaxWords=35, MinWords=15'
+                ).label('snippet')
+            )
+
+        stmt = select(*columns).join(
+            DocumentExtract, Document.id == DocumentExtract.document_id
+        ).where(
+            Document.processing_status == ProcessingStatus.COMPLETED.value,
+            DocumentExtract.content_tsv.op('@@')(ts_query)
+        )
+
+        if document_ids:
+            stmt = stmt.where(Document.id.in_(document_ids))
+
+        stmt = stmt.order_by(desc('score')).limit(max_results)
+        rows = (await session.execute(stmt)).all()
 
         results = []
-        query_terms = query.lower().split()
-
-        for document, extract in documents_with_extracts:
-            content_lower = extract.content.lower()
-
-            # Count term matches
-            matches = 0
-            for term in query_terms:
-                matches += content_lower.count(term)
-
-            if matches > 0:
-                # Calculate relevance score
-                relevance = matches / len(query_terms)
-
-                results.append({
-                    "document_id": document.id,
-                    "title": document.title,
-                    "document_type": document.document_type,
-                    "authors": document.authors,
-                    "specialty": document.specialty,
-                    "content": extract.content,
-                    "word_count": extract.word_count,
-                    "relevance_score": relevance,
-                    "matches": matches
-                })
+        for row in rows:
+            result = {
+                "document_id": row.id,
+                "title": row.title,
+                "document_type": row.document_type,
+                "authors": row.authors,
+                "specialty": row.specialty,
+                "word_count": row.word_count,
+                "relevance_score": row.score
+            }
+            if include_snippets:
+                result["snippet"] = row.snippet
+            results.append(result)
 
-        # Sort by relevance
-        results.sort(key=lambda x: x["relevance_score"], reverse=True)
         return results
 
+    async def _keyword_search(
+        self,
+        documents_with_extracts,
+        query: str,
+        max_results: int
+    ) -> Tuple[List[Dict[str, Any]], int, int]:
+        """Perform keyword-based search over streamed rows, keeping the top max_results
+
+        Returns the ranked results, the number of matching documents and the
+        number of documents searched.
+        """
+
+        query_terms = TOKEN_PATTERN.findall(query.lower())
+        if not query_terms:
+            return [], 0, 0
+
+        # Min-heap of (relevance, -row number, document, extract, matches); the row
+        # number keeps earlier rows ahead on ties, as the old stable sort did
+        top_matches = []
+        total_found = 0
+        documents_searched = 0
+
+        async for document, extract in documents_with_extracts:
+            documents_searched += 1
+
+            token_tf = extract.token_tf
+            if token_tf is not None:
+                matches = sum(token_tf.get(term, 0) for term in query_terms)
+            else:
+                # Extracts stored before term frequencies were persisted: count
+                # just the query tokens in one scan rather than tokenizing it all
+                pattern = _query_token_pattern(tuple(query_terms))
+                matches = sum(1 for _ in pattern.finditer(extract.content))
+
+            if matches == 0:
+                continue
+
+            total_found += 1
+
+            # Calculate relevance score
+            relevance = matches / len(query_terms)
+            entry = (relevance, -documents_searched, document, extract, matches)
+
+            if len(top_matches) < max_results:
+                heapq.heappush(top_matches, entry)
+            elif top_matches and relevance > top_matches[0][0]:
+                heapq.heapreplace(top_matches, entry)
+
+        # Sort by relevance
+        top_matches.sort(key=lambda entry: entry[:2], reverse=True)
+
+        results = [
+            {
+                "document_id": document.id,
+                "title": document.title,
+                "document_type": document.document_type,
+                "authors": document.authors,
+                "specialty": document.specialty,
+                "content": extract.content,
+                "word_count": document.word_count,
+                "relevance_score": relevance,
+                "matches": matches
+            }
+            for relevance, _, document, extract, matches in top_matches
+        ]
+
+        return results, total_found, documents_searched
+
+    @staticmethod
+    def _term_frequencies(text: str) -> Dict[str, int]:
+        """Count lowercase word tokens in extracted text"""
+        return dict(Counter(TOKEN_PATTERN.findall(text.lower())))
+
     def _generate_snippet(self, content: str, query: str, snippet_length: int = 200) -> str:
         """Generate a snippet around query terms"""
 
-        query_terms = query.lower().split()
-        content_lower = content.lower()
+        query_terms = TOKEN_PATTERN.findall(query.lower())
 
-        # Find first occurrence of any query term
-        first_match_pos = None
-        for term in query_terms:
-            pos = content_lower.find(term)
-            if pos != -1:
-                if first_match_pos is None or pos < first_match_pos:
-                    first_match_pos = pos
+        # Find first occurrence of any query term in one scan, matching the
+        # same whole tokens keyword search counts, without a lowercased copy
+        match = _query_token_pattern(tuple(query_terms)).search(content) if query_terms else None
+        first_match_pos = match.start() if match else None
 
         if first_match_pos is None:
             return content[:snippet_length] + "..."
@@ -610,9 +1013,17 @@ class DocumentProcessor:
 
         try:
             async with get_async_session() as session:
-                stmt = select(Document).where(Document.id == document_id)
+                # Select only the columns the status response needs
+                stmt = select(
+                    Document.processing_status,
+                    Document.created_at,
+                    Document.indexed_at,
+                    Document.file_size_bytes,
+                    Document.original_filename,
+                    Document.file_type
+                ).where(Document.id == document_id)
                 result = await session.execute(stmt)
-                document = result.scalar_one_or_none()
+                document = result.one_or_none()
 
                 if not document:
                     return {"success": False, "error": "Document not found"}
@@ -620,11 +1031,11 @@ class DocumentProcessor:
                 return {
                     "success": True,
                     "document_id": document_id,
-                    "status": document.status,
+                    "status": document.processing_status,
                     "uploaded_at": document.created_at.isoformat() if document.created_at else None,
-                    "processed_at": document.processed_at.isoformat() if document.processed_at else None,
-                    "file_size": document.file_size,
-                    "file_type": mimetypes.guess_type(document.filename)[0]
+                    "processed_at": document.indexed_at.isoformat() if document.indexed_at else None,
+                    "file_size": document.file_size_bytes,
+                    "file_type": FILE_TYPE_MIME_TYPES.get(self._file_type(document))
                 }
 
         except Exception as e:
@@ -648,28 +1059,17 @@ class DocumentProcessor:
 
         try:
             async with get_async_session() as session:
-                # Get document counts by status
-                status_counts_stmt = select(Document.status,
-                                          asyncio.create_task(session.execute(
-                                              select(Document).where(Document.status == Document.status)
-                                          )).result().rowcount)
-
-                # Simple analytics for now
-                total_docs_stmt = select(Document)
-                total_docs_result = await session.execute(total_docs_stmt)
-                total_docs = len(total_docs_result.all())
-
-                ready_docs_stmt = select(Document).where(Document.status == "ready")
-                ready_docs_result = await session.execute(ready_docs_stmt)
-                ready_docs = len(ready_docs_result.all())
-
-                processing_docs_stmt = select(Document).where(Document.status == "processing")
-                processing_docs_result = await session.execute(processing_docs_stmt)
-                processing_docs = len(processing_docs_result.all())
-
-                error_docs_stmt = select(Document).where(Document.status == "error")
-                error_docs_result = await session.execute(error_docs_stmt)
-                error_docs = len(error_docs_result.all())
+                # Get document counts by status in one grouped query
+                status_counts_stmt = select(
+                    Document.processing_status, func.count().label("count")
+                ).group_by(Document.processing_status)
+                status_counts_result = await session.execute(status_counts_stmt)
+                status_counts = {status: count for status, count in status_counts_result.all()}
+
+                total_docs = sum(status_counts.values())
+                ready_docs = status_counts.get(ProcessingStatus.COMPLETED.value, 0)
+                processing_docs = sum(status_counts.get(status, 0) for status in IN_PROGRESS_STATUSES)
+                error_docs = status_counts.get(ProcessingStatus.FAILED.value, 0)
 
                 return {
                     "total_documents": total_docs,
@@ -1,41 +1,136 @@
 """Document Library Service for Medical Knowledge Platform"""
 
+import asyncio
 import os
-import shutil
 import logging
-from typing import Dict, Any, List, Optional, BinaryIO
-from uuid import uuid4
+import time
+from collections import OrderedDict, deque
+from typing import AsyncIterator, Dict, Any, List, Optional, BinaryIO, Tuple
 from datetime import datetime
 from pathlib import Path
-import mimetypes
 
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func
+from sqlalchemy import select, insert, delete, func, cast, lambda_stmt, literal, literal_column, tuple_, BigInteger, Text
+from sqlalchemy.dialects.postgresql import JSONB
 
 from ..core.database import db_manager
 from ..core.config import settings
-from ..models.document import Document, DocumentType, ProcessingStatus, LibraryCollection
+from ..models.document import Document, DocumentType, ProcessingStatus, LibraryCollection, DOCUMENT_SEARCH_VECTOR, time_ordered_uuid
 
 logger = logging.getLogger(__name__)
 
+# Accepted upload extensions and the MIME type stored for each
+EXTENSION_MIME_TYPES = {
+    'pdf': 'application/pdf',
+    'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    'txt': 'text/plain',
+    'md': 'text/markdown'
+}
+ALLOWED_EXTENSIONS = frozenset(EXTENSION_MIME_TYPES)
+
+# Uploads are streamed to disk in chunks of this size, with a couple of
+# pwrite calls in flight while the next chunk is read (~3 MiB resident)
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+UPLOAD_WRITE_CONCURRENCY = 2
+
+# Read-through caches for get_document / get_document_content. Entries expire
+# after the TTL so status changes made by the processor show up promptly;
+# extracted text is large, so fewer content entries are kept.
+DOCUMENT_CACHE_TTL_SECONDS = 60.0
+DOCUMENT_CACHE_MAX_ITEMS = 1024
+CONTENT_CACHE_MAX_ITEMS = 64
+
+# GROUPING(document_type, specialty, processing_status) bitmask of each
+# grouping set in get_library_stats (a set bit means "not grouped by")
+STATS_BY_TYPE = 0b011
+STATS_BY_SPECIALTY = 0b101
+STATS_BY_STATUS = 0b110
+
+# Extracted text is streamed to clients in slices of this many characters
+CONTENT_STREAM_CHUNK_CHARS = 64 * 1024
+
+# Uploads scheduled within this window are handed to processing as one batch
+PROCESSING_BATCH_DELAY_SECONDS = 0.05
+
+# Columns serialized by list_documents; same keys as Document.to_dict()
+DOCUMENT_LIST_COLUMNS = (
+    Document.id, Document.title, Document.authors, Document.document_type,
+    Document.specialty, Document.subspecialty, Document.original_filename,
+    Document.file_size_bytes, Document.file_type, Document.word_count,
+    Document.page_count, Document.processing_status, Document.processing_progress,
+    Document.publication_date, Document.journal, Document.doi, Document.pmid,
+    Document.keywords, Document.medical_concepts, Document.evidence_level,
+    Document.quality_score, Document.citation_count, Document.created_at,
+    Document.updated_at, Document.is_public, Document.is_favorite
+)
+
+# Pages larger than this are streamed from a server-side cursor
+LIST_STREAM_THRESHOLD = 500
+
+# A search ending in this character matches titles by prefix ("neuro*")
+PREFIX_SEARCH_SUFFIX = "*"
+
+# Escape character for LIKE patterns built from user input
+LIKE_ESCAPE = "\\"
+
+def _document_row_to_dict(row) -> Dict[str, Any]:
+    """Serialize a DOCUMENT_LIST_COLUMNS row mapping like Document.to_dict()"""
+    document = dict(row)
+    document["id"] = str(document["id"])
+    for key in ("publication_date", "created_at", "updated_at"):
+        if document[key]:
+            document[key] = document[key].isoformat()
+    return document
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards so user input only ever matches literally"""
+    return (
+        value.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace("%", LIKE_ESCAPE + "%")
+        .replace("_", LIKE_ESCAPE + "_")
+    )
+
+def _pwrite_all(fd: int, data: memoryview, offset: int):
+    """pwrite a buffer at an offset, retrying short writes"""
+    while data:
+        written = os.pwrite(fd, data, offset)
+        data = data[written:]
+        offset += written
+
+def _drop_page_cache(file_path: Path):
+    """Flush a written file and evict it from the OS page cache"""
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        # DONTNEED only drops clean pages, so write them back first
+        os.fdatasync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+async def _iter_text_chunks(text: str) -> AsyncIterator[bytes]:
+    """Yield text as UTF-8 slices for a streaming response"""
+    for start in range(0, len(text), CONTENT_STREAM_CHUNK_CHARS):
+        yield text[start:start + CONTENT_STREAM_CHUNK_CHARS].encode("utf-8")
+
 class DocumentService:
     """Service for managing document library"""
 
     def __init__(self):
+        # Created on first upload, off the event loop (see _ensure_upload_path)
         self.upload_path = Path("uploads/documents")
-        self.upload_path.mkdir(parents=True, exist_ok=True)
+        self._upload_path_ready = False
+
+        # document_id -> (expires_at, response), least recently used first
+        self._document_cache: OrderedDict[str, Tuple[float, Dict[str, Any]]] = OrderedDict()
+        self._content_cache: OrderedDict[str, Tuple[float, Dict[str, Any]]] = OrderedDict()
 
-        # File type validation
-        self.allowed_extensions = {
-            'pdf': 'application/pdf',
-            'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-            'txt': 'text/plain',
-            'md': 'text/markdown'
-        }
+        # Document ids waiting for the next processing batch
+        self._pending_processing_ids: List[str] = []
+        self._processing_flush_task: Optional[asyncio.Task] = None
 
     async def upload_document(
         self,
-        file_content: bytes,
+        file_stream: AsyncIterator[bytes],
         filename: str,
         title: str,
         document_type: str,
@@ -46,8 +141,8 @@ class DocumentService:
         """Upload and process a document"""
 
         try:
-            # Validate file
-            validation_result = self._validate_file(filename, len(file_content))
+            # Validate file type; the size is checked while streaming
+            validation_result = self._validate_file(filename)
             if not validation_result["valid"]:
                 return {
                     "success": False,
@@ -55,25 +150,30 @@ class DocumentService:
                 }
 
             # Generate unique filename
-            file_extension = Path(filename).suffix.lower().lstrip('.')
-            unique_filename = f"{uuid4()}.{file_extension}"
+            file_extension = validation_result["ext"]
+            unique_filename = f"{time_ordered_uuid()}.{file_extension}"
             file_path = self.upload_path / unique_filename
+            await self._ensure_upload_path()
 
-            # Save file
-            with open(file_path, 'wb') as f:
-                f.write(file_content)
+            # Stream the file to disk without blocking the event loop
+            write_result = await self._write_stream(file_path, file_stream)
+            if not write_result["valid"]:
+                return {
+                    "success": False,
+                    "error": write_result["error"]
+                }
 
             # Create document record
-            document = Document(
+            document_values = dict(
                 title=title,
                 authors=authors or [],
                 document_type=document_type,
                 specialty=specialty,
                 original_filename=filename,
                 file_path=str(file_path),
-                file_size_bytes=len(file_content),
+                file_size_bytes=write_result["size"],
                 file_type=file_extension,
-                mime_type=self.allowed_extensions.get(file_extension),
+                mime_type=validation_result["mime"],
                 processing_status=ProcessingStatus.PENDING.value,
                 uploaded_by="system"  # TODO: Add user management
             )
@@ -82,20 +182,22 @@ class DocumentService:
             if metadata:
                 if "publication_date" in metadata:
                     try:
-                        document.publication_date = datetime.fromisoformat(metadata["publication_date"])
+                        document_values["publication_date"] = datetime.fromisoformat(metadata["publication_date"])
                     except:
                         pass
-                document.journal = metadata.get("journal")
-                document.doi = metadata.get("doi")
-                document.pmid = metadata.get("pmid")
-                document.isbn = metadata.get("isbn")
-                document.keywords = metadata.get("keywords", [])
-
-            # Save to database
+                document_values["journal"] = metadata.get("journal")
+                document_values["doi"] = metadata.get("doi")
+                document_values["pmid"] = metadata.get("pmid")
+                document_values["isbn"] = metadata.get("isbn")
+                document_values["keywords"] = metadata.get("keywords", [])
+
+            # Save to database; RETURNING gives back server-side values in the
+            # same round-trip, so no follow-up refresh SELECT is needed
             async with db_manager.get_session() as session:
-                session.add(document)
-                await session.flush()
-                await session.refresh(document)
+                result = await session.execute(
+                    insert(Document).values(**document_values).returning(Document)
+                )
+                document = result.scalar_one()
 
                 logger.info(f"Document uploaded: {title} (ID: {document.id})")
 
@@ -118,10 +220,16 @@ class DocumentService:
     async def get_document(self, document_id: str) -> Dict[str, Any]:
         """Get document by ID"""
 
+        cached = self._cache_get(self._document_cache, document_id)
+        if cached is not None:
+            return cached
+
         try:
             async with db_manager.get_session() as session:
+                # lambda_stmt caches the constructed statement and its cache key
+                # by code location; document_id is tracked as a bound parameter
                 result = await session.execute(
-                    select(Document).where(Document.id == document_id)
+                    lambda_stmt(lambda: select(Document).where(Document.id == document_id))
                 )
                 document = result.scalar_one_or_none()
 
@@ -131,10 +239,12 @@ class DocumentService:
                         "error": "Document not found"
                     }
 
-                return {
+                response = {
                     "success": True,
                     "document": document.to_dict()
                 }
+                self._cache_put(self._document_cache, document_id, response, DOCUMENT_CACHE_MAX_ITEMS)
+                return response
 
         except Exception as e:
             logger.error(f"Failed to get document {document_id}: {e}")
@@ -155,44 +265,65 @@ class DocumentService:
         """List documents with filtering"""
 
         try:
-            async with db_manager.get_session() as session:
-                # Build query
-                query = select(Document)
-
-                # Apply filters
-                if document_type:
-                    query = query.where(Document.document_type == document_type)
-                if specialty:
-                    query = query.where(Document.specialty == specialty)
-                if status:
-                    query = query.where(Document.processing_status == status)
-                if search:
-                    search_term = f"%{search}%"
+            # Build query over plain columns; a read-only listing doesn't
+            # need ORM instances, identity-map tracking or instrumentation
+            query = select(*DOCUMENT_LIST_COLUMNS)
+
+            # Apply filters
+            if document_type:
+                query = query.where(Document.document_type == document_type)
+            if specialty:
+                query = query.where(Document.specialty == specialty)
+            if status:
+                query = query.where(Document.processing_status == status)
+            search_rank = None
+            search_term = search.rstrip(PREFIX_SEARCH_SUFFIX) if search else None
+            if search_term:
+                escaped_term = _escape_like(search_term.lower())
+                if db_manager.engine.dialect.name == "postgresql":
+                    title_lower = func.lower(Document.title)
+                    if search_term != search:
+                        # Anchored prefix via the text_pattern_ops btree
+                        title_match = title_lower.like(literal(escaped_term) + "%", escape=LIKE_ESCAPE)
+                    else:
+                        # Title substring (e.g. "neuro" in "neurosurgery") via
+                        # the trigram index
+                        title_match = title_lower.like(f"%{escaped_term}%", escape=LIKE_ESCAPE)
+                    # Whole words via idx_documents_fts, or the title match
+                    ts_query = func.plainto_tsquery(literal_column("'simple'"), search_term)
+                    query = query.where(DOCUMENT_SEARCH_VECTOR.op("@@")(ts_query) | title_match)
+                    search_rank = func.ts_rank_cd(DOCUMENT_SEARCH_VECTOR, ts_query)
+                else:
+                    like_term = f"%{escaped_term}%"
                     query = query.where(
-                        Document.title.ilike(search_term) |
-                        Document.authors.astext.ilike(search_term)
+                        Document.title.ilike(like_term, escape=LIKE_ESCAPE) |
+                        cast(Document.authors, Text).ilike(like_term, escape=LIKE_ESCAPE)
                     )
 
-                # Get total count
-                count_query = select(func.count(Document.id)).where(*query.whereclause.clauses if query.whereclause else [])
-                count_result = await session.execute(count_query)
-                total = count_result.scalar()
+            # Total count from the same filtered statement
+            count_query = query.with_only_columns(func.count(Document.id)).order_by(None)
 
-                # Apply ordering and pagination
+            # Apply ordering and pagination
+            if search_rank is not None:
+                query = query.order_by(search_rank.desc(), Document.created_at.desc())
+            else:
                 query = query.order_by(Document.created_at.desc())
-                query = query.offset(offset).limit(limit)
+            query = query.offset(offset).limit(limit)
 
-                # Execute query
-                result = await session.execute(query)
-                documents = result.scalars().all()
+            # The count and the page are independent, so run them concurrently
+            # on separate sessions instead of paying two round-trips in series
+            total, documents = await asyncio.gather(
+                self._fetch_scalar(count_query),
+                self._fetch_mappings(query, stream=limit > LIST_STREAM_THRESHOLD)
+            )
 
-                return {
-                    "success": True,
-                    "documents": [doc.to_dict() for doc in documents],
-                    "total": total,
-                    "limit": limit,
-                    "offset": offset
-                }
+            return {
+                "success": True,
+                "documents": [_document_row_to_dict(row) for row in documents],
+                "total": total,
+                "limit": limit,
+                "offset": offset
+            }
 
         except Exception as e:
             logger.error(f"Failed to list documents: {e}")
@@ -204,11 +335,13 @@ class DocumentService:
     async def delete_document(self, document_id: str) -> Dict[str, Any]:
         """Delete document and its file"""
 
+        self._invalidate_cached(document_id)
+
         try:
             async with db_manager.get_session() as session:
                 # Get document
                 result = await session.execute(
-                    select(Document).where(Document.id == document_id)
+                    lambda_stmt(lambda: select(Document).where(Document.id == document_id))
                 )
                 document = result.scalar_one_or_none()
 
@@ -219,12 +352,7 @@ class DocumentService:
                     }
 
                 # Delete file
-                try:
-                    file_path = Path(document.file_path)
-                    if file_path.exists():
-                        file_path.unlink()
-                except Exception as e:
-                    logger.warning(f"Failed to delete file {document.file_path}: {e}")
+                await self._unlink_file(document.file_path)
 
                 # Delete from database
                 await session.delete(document)
@@ -244,15 +372,61 @@ class DocumentService:
                 "error": str(e)
             }
 
+    async def delete_documents(self, document_ids: List[str]) -> Dict[str, Any]:
+        """Delete several documents and their files
+
+        Rows are removed with one DELETE ... RETURNING, then the files are
+        unlinked concurrently in worker threads.
+        """
+
+        for document_id in document_ids:
+            self._invalidate_cached(document_id)
+
+        try:
+            async with db_manager.get_session() as session:
+                result = await session.execute(
+                    delete(Document)
+                    .where(Document.id.in_(document_ids))
+                    .returning(Document.file_path)
+                )
+                file_paths = result.scalars().all()
+
+            await asyncio.gather(*(self._unlink_file(file_path) for file_path in file_paths))
+
+            logger.info(f"Documents deleted: {len(file_paths)} of {len(document_ids)} requested")
+
+            return {
+                "success": True,
+                "deleted": len(file_paths),
+                "message": f"{len(file_paths)} documents deleted successfully"
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to delete documents {document_ids}: {e}")
+            return {
+                "success": False,
+                "error": str(e)
+            }
+
     async def get_document_content(self, document_id: str) -> Dict[str, Any]:
         """Get extracted text content of document"""
 
+        cached = self._cache_get(self._content_cache, document_id)
+        if cached is not None:
+            return cached
+
         try:
             async with db_manager.get_session() as session:
+                # extracted_text is deferred on the model, so select it explicitly
                 result = await session.execute(
-                    select(Document).where(Document.id == document_id)
+                    lambda_stmt(lambda: select(
+                        Document.title,
+                        Document.extracted_text,
+                        Document.word_count,
+                        Document.page_count
+                    ).where(Document.id == document_id))
                 )
-                document = result.scalar_one_or_none()
+                document = result.one_or_none()
 
                 if not document:
                     return {
@@ -266,7 +440,7 @@ class DocumentService:
                         "error": "Document content not yet extracted"
                     }
 
-                return {
+                response = {
                     "success": True,
                     "document_id": document_id,
                     "title": document.title,
@@ -274,6 +448,8 @@ class DocumentService:
                     "word_count": document.word_count,
                     "page_count": document.page_count
                 }
+                self._cache_put(self._content_cache, document_id, response, CONTENT_CACHE_MAX_ITEMS)
+                return response
 
         except Exception as e:
             logger.error(f"Failed to get document content {document_id}: {e}")
@@ -282,6 +458,41 @@ class DocumentService:
                 "error": str(e)
             }
 
+    async def get_document_text_stream(self, document_id: str) -> Dict[str, Any]:
+        """Get extracted text of document as chunks for a plain-text streaming response"""
+
+        cached = self._cache_get(self._content_cache, document_id)
+        if cached is not None:
+            return {"success": True, "chunks": _iter_text_chunks(cached["content"])}
+
+        try:
+            async with db_manager.get_session() as session:
+                result = await session.execute(
+                    lambda_stmt(lambda: select(Document.extracted_text).where(Document.id == document_id))
+                )
+                document = result.one_or_none()
+
+                if not document:
+                    return {
+                        "success": False,
+                        "error": "Document not found"
+                    }
+
+                if not document.extracted_text:
+                    return {
+                        "success": False,
+                        "error": "Document content not yet extracted"
+                    }
+
+                return {"success": True, "chunks": _iter_text_chunks(document.extracted_text)}
+
+        except Exception as e:
+            logger.error(f"Failed to stream document content {document_id}: {e}")
+            return {
+                "success": False,
+                "error": str(e)
+            }
+
     async def create_collection(
         self,
         name: str,
@@ -292,7 +503,7 @@ class DocumentService:
         """Create a new document collection"""
 
         try:
-            collection = LibraryCollection(
+            collection_values = dict(
                 name=name,
                 description=description,
                 specialty=specialty,
@@ -301,9 +512,10 @@ class DocumentService:
             )
 
             async with db_manager.get_session() as session:
-                session.add(collection)
-                await session.flush()
-                await session.refresh(collection)
+                result = await session.execute(
+                    insert(LibraryCollection).values(**collection_values).returning(LibraryCollection)
+                )
+                collection = result.scalar_one()
 
                 return {
                     "success": True,
@@ -329,35 +541,64 @@ class DocumentService:
 
         try:
             async with db_manager.get_session() as session:
-                # Total documents
-                total_docs = await session.execute(select(func.count(Document.id)))
-                total_documents = total_docs.scalar()
-
-                # Documents by type
-                type_stats = await session.execute(
-                    select(Document.document_type, func.count(Document.id))
-                    .group_by(Document.document_type)
-                )
-                documents_by_type = {row[0]: row[1] for row in type_stats.fetchall()}
-
-                # Documents by specialty
-                specialty_stats = await session.execute(
-                    select(Document.specialty, func.count(Document.id))
-                    .where(Document.specialty.isnot(None))
-                    .group_by(Document.specialty)
+                # Counts by type, specialty and status, plus storage, in one
+                # GROUPING SETS scan instead of five round-trips
+                grouping = func.grouping(
+                    Document.document_type, Document.specialty, Document.processing_status
                 )
-                documents_by_specialty = {row[0]: row[1] for row in specialty_stats.fetchall()}
-
-                # Processing status
-                status_stats = await session.execute(
-                    select(Document.processing_status, func.count(Document.id))
-                    .group_by(Document.processing_status)
+                grouped = select(
+                    Document.document_type,
+                    Document.specialty,
+                    Document.processing_status,
+                    grouping.label("grouping_set"),
+                    func.count(Document.id).label("documents"),
+                    func.sum(Document.file_size_bytes).label("size_bytes")
+                ).group_by(
+                    func.grouping_sets(
+                        tuple_(Document.document_type),
+                        tuple_(Document.specialty),
+                        tuple_(Document.processing_status)
+                    )
+                ).cte("library_stats")
+
+                # Fold the grouped rows into one row of JSONB maps server-side
+                by_type = grouped.c.grouping_set == STATS_BY_TYPE
+                by_specialty = (grouped.c.grouping_set == STATS_BY_SPECIALTY) & grouped.c.specialty.isnot(None)
+                by_status = grouped.c.grouping_set == STATS_BY_STATUS
+                stats_result = await session.execute(
+                    select(
+                        func.jsonb_object_agg(
+                            grouped.c.document_type, grouped.c.documents, type_=JSONB
+                        ).filter(by_type),
+                        func.jsonb_object_agg(
+                            grouped.c.specialty, grouped.c.documents, type_=JSONB
+                        ).filter(by_specialty),
+                        # JSON object keys can't be NULL; "null" is what the key
+                        # serialized as when the map was built in Python
+                        func.jsonb_object_agg(
+                            func.coalesce(grouped.c.processing_status, literal_column("'null'")),
+                            grouped.c.documents,
+                            type_=JSONB
+                        ).filter(by_status),
+                        # Type groups partition every document, so they also give the totals
+                        cast(func.sum(grouped.c.documents).filter(by_type), BigInteger),
+                        cast(func.sum(grouped.c.size_bytes).filter(by_type), BigInteger)
+                    )
                 )
-                documents_by_status = {row[0]: row[1] for row in status_stats.fetchall()}
-
-                # Total storage
-                storage_stats = await session.execute(select(func.sum(Document.file_size_bytes)))
-                total_storage_bytes = storage_stats.scalar() or 0
+                (
+                    documents_by_type,
+                    documents_by_specialty,
+                    documents_by_status,
+                    total_documents,
+                    total_storage_bytes
+                ) = stats_result.one()
+
+                # Aggregates over no rows are NULL
+                documents_by_type = documents_by_type or {}
+                documents_by_specialty = documents_by_specialty or {}
+                documents_by_status = documents_by_status or {}
+                total_documents = total_documents or 0
+                total_storage_bytes = total_storage_bytes or 0
 
                 return {
                     "success": True,
@@ -378,31 +619,175 @@ class DocumentService:
                 "error": str(e)
             }
 
-    def _validate_file(self, filename: str, file_size: int) -> Dict[str, Any]:
-        """Validate uploaded file"""
+    async def _write_stream(self, file_path: Path, file_stream: AsyncIterator[bytes]) -> Dict[str, Any]:
+        """Stream an upload to disk, enforcing the size limit as chunks arrive
 
-        # Check file extension
-        file_extension = Path(filename).suffix.lower().lstrip('.')
-        if file_extension not in self.allowed_extensions:
+        Each chunk is written with pwrite at its offset in a worker thread
+        while the next one is read, so the whole file is never held in memory.
+        An oversized upload is aborted and its partial file removed.
+
+        Writes complete in order with at most UPLOAD_WRITE_CONCURRENCY in
+        flight, so the producer may refill a chunk's buffer once that many
+        further chunks have been requested (see api.library._iter_upload).
+        """
+
+        max_size_bytes = settings.max_file_size_mb * 1024 * 1024
+        writes = deque()
+
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        size = 0
+        too_large = False
+        try:
+            try:
+                async for chunk in file_stream:
+                    if size + len(chunk) > max_size_bytes:
+                        too_large = True
+                        break
+
+                    # Retire the oldest write before starting another
+                    if len(writes) >= UPLOAD_WRITE_CONCURRENCY:
+                        await writes.popleft()
+                    writes.append(asyncio.create_task(
+                        asyncio.to_thread(_pwrite_all, fd, memoryview(chunk), size)
+                    ))
+                    size += len(chunk)
+            finally:
+                # Threads can't be cancelled, so let in-flight writes finish
+                # before the descriptor is closed
+                results = await asyncio.gather(*writes, return_exceptions=True)
+                os.close(fd)
+
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+
+        except BaseException:
+            file_path.unlink(missing_ok=True)
+            raise
+
+        if too_large:
+            file_path.unlink(missing_ok=True)
             return {
                 "valid": False,
-                "error": f"File type .{file_extension} not supported. Allowed: {', '.join(self.allowed_extensions.keys())}"
+                "error": f"File size exceeds maximum {settings.max_file_size_mb}MB"
             }
 
-        # Check file size
-        max_size_bytes = settings.max_file_size_mb * 1024 * 1024
-        if file_size > max_size_bytes:
+        if size >= settings.upload_drop_cache_threshold_mb * 1024 * 1024 and hasattr(os, "posix_fadvise"):
+            # Large uploads are rarely read back soon; keep them from
+            # evicting hotter pages (e.g. the database's) from the cache
+            try:
+                await asyncio.to_thread(_drop_page_cache, file_path)
+            except OSError as e:
+                logger.debug(f"Could not drop page cache for {file_path}: {e}")
+
+        return {"valid": True, "size": size}
+
+    async def _ensure_upload_path(self):
+        """Create the upload directory once, without blocking the event loop"""
+
+        if not self._upload_path_ready:
+            await asyncio.to_thread(self.upload_path.mkdir, parents=True, exist_ok=True)
+            self._upload_path_ready = True
+
+    @staticmethod
+    def _cache_get(cache: OrderedDict, document_id: str) -> Optional[Dict[str, Any]]:
+        """Return a live cached response, refreshing its LRU position"""
+
+        entry = cache.get(document_id)
+        if entry is None:
+            return None
+
+        expires_at, response = entry
+        if expires_at < time.monotonic():
+            del cache[document_id]
+            return None
+
+        cache.move_to_end(document_id)
+        return response
+
+    @staticmethod
+    def _cache_put(cache: OrderedDict, document_id: str, response: Dict[str, Any], max_items: int):
+        """Cache a response, evicting the least recently used entries"""
+
+        cache[document_id] = (time.monotonic() + DOCUMENT_CACHE_TTL_SECONDS, response)
+        cache.move_to_end(document_id)
+        while len(cache) > max_items:
+            cache.popitem(last=False)
+
+    def _invalidate_cached(self, document_id: str):
+        """Drop cached responses for a document"""
+
+        self._document_cache.pop(document_id, None)
+        self._content_cache.pop(document_id, None)
+
+    async def _unlink_file(self, file_path: str):
+        """Remove a stored upload in a worker thread, logging failures"""
+
+        try:
+            await asyncio.to_thread(Path(file_path).unlink, missing_ok=True)
+        except Exception as e:
+            logger.warning(f"Failed to delete file {file_path}: {e}")
+
+    async def _fetch_scalar(self, stmt) -> Any:
+        """Execute a statement on its own session and return its scalar result"""
+
+        async with db_manager.get_session() as session:
+            result = await session.execute(stmt)
+            return result.scalar()
+
+    async def _fetch_mappings(self, stmt, stream: bool = False) -> List[Any]:
+        """Execute a statement on its own session and return its row mappings"""
+
+        async with db_manager.get_session() as session:
+            if stream:
+                # Server-side cursor: rows are fetched in batches, not buffered up front
+                result = await session.stream(stmt)
+                return [row async for row in result.mappings()]
+            result = await session.execute(stmt)
+            return result.mappings().all()
+
+    def _validate_file(self, filename: str) -> Dict[str, Any]:
+        """Validate uploaded file type"""
+
+        # Check file extension
+        file_extension = Path(filename).suffix.lower().lstrip('.')
+        if file_extension not in ALLOWED_EXTENSIONS:
             return {
                 "valid": False,
-                "error": f"File size {file_size / (1024 * 1024):.1f}MB exceeds maximum {settings.max_file_size_mb}MB"
+                "error": f"File type .{file_extension} not supported. Allowed: {', '.join(EXTENSION_MIME_TYPES)}"
             }
 
-        return {"valid": True}
+        return {"valid": True, "ext": file_extension, "mime": EXTENSION_MIME_TYPES[file_extension]}
 
     async def _schedule_processing(self, document_id: str):
-        """Schedule document processing (placeholder for background task)"""
-        # TODO: Implement background processing with Celery or similar
-        logger.info(f"Processing scheduled for document {document_id}")
+        """Queue a document for the next processing batch"""
+
+        self._pending_processing_ids.append(str(document_id))
+        if self._processing_flush_task is None:
+            self._processing_flush_task = asyncio.create_task(self._flush_processing_later())
+
+    async def _flush_processing_later(self):
+        """Wait out the batching window, then submit everything queued so far"""
+
+        await asyncio.sleep(PROCESSING_BATCH_DELAY_SECONDS)
+        self._processing_flush_task = None
+        await self.flush_pending_processing()
+
+    async def flush_pending_processing(self):
+        """Submit queued documents immediately (also called on shutdown)"""
+
+        if self._processing_flush_task is not None:
+            self._processing_flush_task.cancel()
+            self._processing_flush_task = None
+
+        document_ids, self._pending_processing_ids = self._pending_processing_ids, []
+        if document_ids:
+            await self._submit_processing_batch(document_ids)
+
+    async def _submit_processing_batch(self, document_ids: List[str]):
+        """Submit a batch of documents for processing (placeholder for background task)"""
+        # TODO: Enqueue with Celery (group) or Redis (LPUSH) in one call
+        logger.info(f"Processing scheduled for {len(document_ids)} document(s): {', '.join(document_ids)}")
 
 # Global document service instance
 document_service = DocumentService()
\ No newline at end of file
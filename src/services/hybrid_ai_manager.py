@@ -4,11 +4,27 @@ Intelligent routing, cost optimization, and service specialization
 """
 
 import asyncio
+import hashlib
 import logging
-from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
+import random
+import time
+from collections import Counter, OrderedDict, defaultdict
+from typing import AsyncIterator, Callable, ClassVar, Dict, Any, FrozenSet, List, Optional, Tuple
+from datetime import date, datetime, timedelta
 from enum import Enum
 import json
+import re
+import numpy as np
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    from diskcache import Cache
+except ImportError:
+    Cache = None
 
 from ..core.config import settings
 from .multi_ai_manager import multi_ai_manager
@@ -29,38 +45,344 @@ class ChapterType(Enum):
     ANATOMY_PHYSIOLOGY = "anatomy_physiology"
     CASE_STUDY = "case_study"
 
+AI_PROVIDERS = ["openai", "gemini", "claude", "perplexity"]
+
+# PubMed results change slowly, so scored research for a (topic, specialty)
+# is reused for a day; evidence scores are kept per (PMID, current year)
+RESEARCH_CACHE_TTL_SECONDS = 24 * 60 * 60
+RESEARCH_CACHE_MAX_ITEMS = 256
+EVIDENCE_SCORE_CACHE_MAX_ITEMS = 10000
+
+# Evidence scores also persist on disk (with diskcache) so restarts don't
+# rescore known PMIDs; bump the version whenever the scoring rules change
+EVIDENCE_SCORE_VERSION = 1
+EVIDENCE_SCORE_DISK_TTL_SECONDS = 60 * 24 * 60 * 60
+EVIDENCE_SCORE_DISK_SIZE_LIMIT = 200 * 1024 * 1024
+
+# Successful responses to deterministic (temperature 0) calls are reused for
+# byte-identical prompts to the same provider within this window
+PROMPT_CACHE_TTL_SECONDS = 60 * 60
+PROMPT_CACHE_MAX_ITEMS = 512
+
+# Days of per-provider call counts kept in usage_tracker
+USAGE_HISTORY_DAYS = 30
+
+# Flat cost estimate per provider call (USD)
+COST_PER_PROVIDER_CALL = 0.50
+
+# Provider availability rarely flips between requests, so polled
+# usage analytics reuse it for a few seconds
+PROVIDERS_STATUS_TTL_SECONDS = 5.0
+
+# Concurrent PubMed searches (NCBI allows 10 requests/s with an API key,
+# and each search is an esearch + efetch pair)
+PUBMED_MAX_CONCURRENT_SEARCHES = 8
+
+# Gemini's analysis is embedded in Claude's prompt; beyond this many
+# characters (~1000 tokens) only its head and tail are kept
+RESEARCH_ANALYSIS_PROMPT_MAX_CHARS = 4000
+
+# Stage prompts, filled with str.format per chapter
+RESEARCH_ANALYSIS_PROMPT_TEMPLATE = """
+As Gemini 2.5 Pro with Deep Search and Deep Think capabilities, analyze the research data for: {topic}
+
+Research Sources Available: {n_sources} high-quality sources
+Average Evidence Score: {avg_score:.2f}
+
+Please provide:
+1. Statistical analysis of the evidence
+2. Key research findings and trends
+3. Evidence quality assessment
+4. Research gaps identification
+5. Clinical implications of the data
+
+Use your deep thinking process to provide comprehensive analysis.
+"""
+
+TEXT_REFINEMENT_PROMPT_TEMPLATE = """
+As Claude Opus 4.1 with extended reasoning capabilities, create a well-structured medical chapter on: {topic}
+
+Chapter Structure Required: {sections}
+Research Analysis: {research_analysis}
+
+Please provide:
+1. Executive summary (300 words)
+2. Well-organized content for each section
+3. Seamless integration of research findings
+4. Clear, clinical language suitable for medical professionals
+5. Logical flow between sections
+
+Use your extended reasoning for comprehensive medical writing.
+"""
+
+GUIDELINES_PROMPT_TEMPLATE = """
+As Perplexity Pro with research and citation capabilities, research current guidance for a medical chapter on: {topic}
+
+Chapter Structure: {sections}
+
+Please provide:
+1. Current clinical guidelines and recommendations (2023-2024)
+2. Visual descriptions for anatomical illustrations needed
+3. Recent developments and emerging treatments
+4. Evidence-based citations with specific references
+5. Multi-modal content suggestions
+
+Include specific citations and reference the most current literature.
+"""
+
+class _TokenBucket:
+    """Requests-per-second limiter that waits for a token instead of failing"""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Take one token, sleeping until one is available"""
+
+        # The lock queues waiters so tokens are handed out in arrival order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+# Transient provider failures (429 / 5xx) are retried with jittered
+# exponential backoff, honoring Retry-After when the provider sends it
+AI_CALL_MAX_ATTEMPTS = 4
+AI_RETRY_MAX_DELAY_SECONDS = 30.0
+
+# Heading of item 3 ("Evidence quality assessment") in Gemini's streamed
+# analysis: the statistics and key findings Claude builds on are complete.
+# Anchored to an unindented line start (after a newline, since the streamed
+# tail may begin mid-line) and to the heading text, so indented "3." sub-items
+# and other lines mentioning evidence quality don't match
+RESEARCH_FINDINGS_COMPLETE_PATTERN = re.compile(
+    r"(?<=\n)(?:#+[ \t]*)?(?:\*\*)?3[.)][ \t*]*evidence quality",
+    re.IGNORECASE
+)
+RESEARCH_FINDINGS_TAIL_CHARS = 200
+
+class _CircuitBreaker:
+    """Stops routing to a provider after repeated failures, then lets a trial call through"""
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.failures = 0
+        self.opened_at = None
+
+    @property
+    def state(self) -> str:
+        """closed, open, or half_open once the recovery timeout has passed"""
+
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.recovery_timeout:
+            return "half_open"
+        return "open"
+
+    def allow_request(self) -> bool:
+        return self.state != "open"
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self):
+        self.failures += 1
+        # A failed trial call reopens the breaker for another timeout
+        if self.state == "half_open" or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+
 class HybridAIManager:
     """Advanced AI orchestration with intelligent routing and specialization"""
 
+    __slots__ = (
+        "daily_budget",
+        "rate_limit",
+        "max_concurrent_calls",
+        "usage_tracker",
+        "_daily_total_cost",
+        "_providers_status_cache",
+        "circuit_breakers",
+        "_research_cache",
+        "_research_in_flight",
+        "_pubmed_semaphore",
+        "_evidence_score_cache",
+        "_evidence_score_disk",
+        "_prompt_cache",
+        "_provider_semaphores",
+        "_provider_buckets",
+        "ai_specialization",
+        "evidence_hierarchy",
+        "_evidence_phrases",
+        "_evidence_regex",
+        "_evidence_automaton",
+        "_high_impact_regex",
+    )
+
+    # Section outline per chapter type
+    _STRUCTURE_TEMPLATES: ClassVar[Dict[str, Tuple[str, ...]]] = {
+        "disease_overview": (
+            "Executive Summary",
+            "Epidemiology",
+            "Pathophysiology",
+            "Clinical Presentation",
+            "Diagnostic Workup",
+            "Treatment Options",
+            "Surgical Considerations",
+            "Complications and Management",
+            "Prognosis and Follow-up",
+            "Future Directions",
+            "References"
+        ),
+        "surgical_technique": (
+            "Executive Summary",
+            "Introduction and Background",
+            "Indications and Contraindications",
+            "Preoperative Planning",
+            "Surgical Technique",
+            "Postoperative Care",
+            "Complications and Management",
+            "Outcomes and Evidence",
+            "Pearls and Pitfalls",
+            "Future Developments",
+            "References"
+        ),
+        "anatomy_physiology": (
+            "Executive Summary",
+            "Anatomical Overview",
+            "Microanatomy",
+            "Physiological Function",
+            "Development and Aging",
+            "Clinical Correlations",
+            "Pathological Variants",
+            "Surgical Anatomy",
+            "Imaging Considerations",
+            "Clinical Applications",
+            "References"
+        ),
+        "case_study": (
+            "Executive Summary",
+            "Case Presentation",
+            "Clinical History",
+            "Physical Examination",
+            "Diagnostic Workup",
+            "Differential Diagnosis",
+            "Management Approach",
+            "Surgical Intervention",
+            "Postoperative Course",
+            "Discussion and Literature Review",
+            "References"
+        )
+    }
+
+    # Approximate chapter length in words per chapter type
+    _LENGTH_ESTIMATES: ClassVar[Dict[str, int]] = {
+        "disease_overview": 5000,
+        "surgical_technique": 4000,
+        "anatomy_physiology": 3500,
+        "case_study": 3000
+    }
+
+    # Topic terms that mark a topic as highly complex
+    _COMPLEX_TERMS: ClassVar[FrozenSet[str]] = frozenset({"molecular", "genetic", "immunology", "pathophysiology"})
+
+    # Output token budget per AISpecialty value
+    _STAGE_MAX_TOKENS: ClassVar[Dict[str, int]] = {
+        AISpecialty.RESEARCH_ANALYSIS.value: 1500,
+        AISpecialty.TEXT_REFINEMENT.value: 2000,
+        AISpecialty.VISUAL_INTEGRATION.value: 1500,
+        AISpecialty.EVIDENCE_SYNTHESIS.value: 2000,
+        AISpecialty.FALLBACK.value: 2000
+    }
+
+    # Extra instructions per AISpecialty value and provider
+    _SPECIALTY_ENHANCEMENTS: ClassVar[Dict[str, Dict[str, str]]] = {
+        AISpecialty.RESEARCH_ANALYSIS.value: {
+            "gemini": "Use your Deep Search and Deep Think capabilities for comprehensive analysis.",
+            "perplexity": "Focus on evidence synthesis and statistical interpretation."
+        },
+        AISpecialty.TEXT_REFINEMENT.value: {
+            "claude": "Use your extended reasoning for superior medical writing and organization.",
+            "openai": "Focus on clear, clinical language and logical structure."
+        },
+        AISpecialty.VISUAL_INTEGRATION.value: {
+            "perplexity": "Integrate visual elements and current research with citations.",
+            "gemini": "Include multi-modal content suggestions and current guidelines."
+        }
+    }
+
     def __init__(self):
         self.daily_budget = 15.0  # $15/day per service
         self.rate_limit = 60  # calls per minute per service
-        self.usage_tracker = {}
-        self.circuit_breakers = {}
+        self.max_concurrent_calls = 4  # in-flight calls per service
+        self.usage_tracker: defaultdict[date, Counter] = defaultdict(Counter)
+        # Running per-day cost, kept alongside usage_tracker so analytics don't re-sum it
+        self._daily_total_cost: defaultdict[date, float] = defaultdict(float)
+        # (expires_at, provider -> available)
+        self._providers_status_cache: Optional[Tuple[float, Dict[str, bool]]] = None
+        self.circuit_breakers = {provider: _CircuitBreaker() for provider in AI_PROVIDERS}
+
+        # (topic, specialty) -> (expires_at, research), least recently used first
+        self._research_cache: OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = OrderedDict()
+        # In-flight research fetches, so concurrent chapters on the same
+        # (topic, specialty) share one PubMed search
+        self._research_in_flight: Dict[Tuple[str, str], asyncio.Task] = {}
+        self._pubmed_semaphore = asyncio.Semaphore(PUBMED_MAX_CONCURRENT_SEARCHES)
+        # (pmid, year) -> evidence score, least recently used first
+        self._evidence_score_cache: OrderedDict[Tuple[str, int], float] = OrderedDict()
+        # blake2b(provider, specialty, prompt) -> (expires_at, response), least recently used first
+        self._prompt_cache: OrderedDict[str, Tuple[float, Dict[str, Any]]] = OrderedDict()
+        self._evidence_score_disk = None
+        if Cache is not None:
+            try:
+                self._evidence_score_disk = Cache(
+                    settings.evidence_score_cache_dir, size_limit=EVIDENCE_SCORE_DISK_SIZE_LIMIT
+                )
+            except Exception as e:
+                logger.warning(f"Evidence score disk cache unavailable: {e}")
+
+        # Throttle before dispatch rather than finding out from provider 429s
+        self._provider_semaphores = {
+            provider: asyncio.Semaphore(self.max_concurrent_calls) for provider in AI_PROVIDERS
+        }
+        self._provider_buckets = {
+            provider: _TokenBucket(rate=self.rate_limit / 60, capacity=self.rate_limit)
+            for provider in AI_PROVIDERS
+        }
 
-        # AI Role Specialization Matrix
+        # AI Role Specialization Matrix, keyed by AISpecialty value
         self.ai_specialization = {
-            AISpecialty.RESEARCH_ANALYSIS: {
+            AISpecialty.RESEARCH_ANALYSIS.value: {
                 "primary": "gemini",
                 "secondary": "perplexity",
                 "capabilities": ["data_analysis", "statistical_interpretation", "evidence_synthesis"]
             },
-            AISpecialty.TEXT_REFINEMENT: {
+            AISpecialty.TEXT_REFINEMENT.value: {
                 "primary": "claude",
                 "secondary": "openai",
                 "capabilities": ["text_polishing", "structure_organization", "citation_integration"]
             },
-            AISpecialty.VISUAL_INTEGRATION: {
+            AISpecialty.VISUAL_INTEGRATION.value: {
                 "primary": "perplexity",
                 "secondary": "gemini",
                 "capabilities": ["anatomical_images", "multi_modal_content", "real_time_research"]
             },
-            AISpecialty.EVIDENCE_SYNTHESIS: {
+            AISpecialty.EVIDENCE_SYNTHESIS.value: {
                 "primary": "gemini",
                 "secondary": "claude",
                 "capabilities": ["research_combination", "conflict_resolution", "quality_scoring"]
             },
-            AISpecialty.FALLBACK: {
+            AISpecialty.FALLBACK.value: {
                 "primary": "openai",
                 "secondary": "claude",
                 "capabilities": ["general_tasks", "backup_processing", "specialized_fallback"]
@@ -81,6 +403,24 @@ class HybridAIManager:
             "expert_opinion": 0.4
         }
 
+        # One regex pass per field instead of a substring scan per evidence
+        # type; matches keep the plain substring semantics of the old checks
+        self._evidence_phrases = {
+            evidence_type.replace("_", " "): (rank, score)
+            for rank, (evidence_type, score) in enumerate(self.evidence_hierarchy.items())
+        }
+        self._evidence_regex = re.compile(
+            "|".join(re.escape(phrase) for phrase in self._evidence_phrases), re.IGNORECASE
+        )
+        # With pyahocorasick, one automaton pass finds every phrase occurrence
+        self._evidence_automaton = None
+        if ahocorasick is not None:
+            self._evidence_automaton = ahocorasick.Automaton()
+            for phrase, rank_and_score in self._evidence_phrases.items():
+                self._evidence_automaton.add_word(phrase, rank_and_score)
+            self._evidence_automaton.make_automaton()
+        self._high_impact_regex = re.compile("nature|science|nejm|lancet|jama", re.IGNORECASE)
+
     async def generate_intelligent_chapter(
         self,
         topic: str,
@@ -105,20 +445,7 @@ class HybridAIManager:
             # Step 4: Quality Validation and Cross-Referencing
             final_chapter = await self._validate_and_cross_reference(chapter_content, topic)
 
-            return {
-                "success": True,
-                "chapter": final_chapter,
-                "metadata": {
-                    "topic": topic,
-                    "chapter_type": chapter_type,
-                    "specialty": specialty,
-                    "evidence_quality": final_chapter.get("evidence_score", 0),
-                    "ai_providers_used": final_chapter.get("providers_used", []),
-                    "research_sources": len(research_data.get("sources", [])),
-                    "generation_time": final_chapter.get("generation_time"),
-                    "cost_estimate": self._calculate_cost_estimate(final_chapter)
-                }
-            }
+            return self._chapter_response(final_chapter, topic, chapter_type, specialty, research_data)
 
         except Exception as e:
             logger.error(f"Intelligent chapter generation failed: {e}")
@@ -127,6 +454,196 @@ class HybridAIManager:
                 "error": str(e)
             }
 
+    async def generate_intelligent_chapter_batch(
+        self,
+        chapter_specs: List[Dict[str, Any]],
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> List[Dict[str, Any]]:
+        """Generate several chapters, sending text refinement through the OpenAI Batch API
+
+        Research, Gemini analysis and Perplexity guidelines stay interactive;
+        the text refinement prompts for every chapter go out as one batch
+        (about half the cost, completes within 24h). If the batch can't be
+        used, refinement falls back to rate-limited interactive calls.
+        Each spec takes generate_intelligent_chapter's arguments; results
+        come back in spec order and are also passed to on_progress as each
+        chapter is finished.
+        """
+
+        start_time = time.perf_counter()
+
+        async def prepare(spec: Dict[str, Any]) -> Dict[str, Any]:
+            topic = spec["topic"]
+            chapter_type = spec.get("chapter_type", "disease_overview")
+            specialty = spec.get("specialty", "neurosurgery")
+
+            structure = await self._analyze_topic_and_structure(topic, chapter_type, specialty)
+            research_data = await self._orchestrate_research(topic, specialty)
+            gemini_analysis, perplexity_enhancement = await asyncio.gather(
+                self._get_specialized_ai_response(
+                    provider="gemini",
+                    specialty=AISpecialty.RESEARCH_ANALYSIS,
+                    prompt=self._research_analysis_prompt(topic, research_data),
+                    context_data=research_data
+                ),
+                self._get_specialized_ai_response(
+                    provider="perplexity",
+                    specialty=AISpecialty.VISUAL_INTEGRATION,
+                    prompt=self._guidelines_prompt(topic, structure),
+                    context_data={"research": research_data}
+                )
+            )
+            return {
+                "topic": topic,
+                "chapter_type": chapter_type,
+                "specialty": specialty,
+                "structure": structure,
+                "research_data": research_data,
+                "gemini_analysis": gemini_analysis,
+                "perplexity_enhancement": perplexity_enhancement
+            }
+
+        # Step 1: Research and the interactive AI stages for every chapter at
+        # once; the research cache dedupes overlapping topics
+        prepared = await asyncio.gather(
+            *(prepare(spec) for spec in chapter_specs), return_exceptions=True
+        )
+        results: List[Optional[Dict[str, Any]]] = [None] * len(chapter_specs)
+        pending = []
+        for index, chapter in enumerate(prepared):
+            if isinstance(chapter, Exception):
+                logger.error(f"Batch chapter preparation failed for {chapter_specs[index].get('topic')}: {chapter}")
+                results[index] = {"success": False, "error": str(chapter)}
+                if on_progress:
+                    on_progress(results[index])
+            else:
+                chapter["index"] = index
+                chapter["research_analysis"] = (
+                    chapter["gemini_analysis"]["content"]
+                    if chapter["gemini_analysis"].get("success") else None
+                )
+                pending.append(chapter)
+
+        # Step 2: Text refinement for all chapters in one provider batch
+        refinement_prompts = [
+            self._text_refinement_prompt(
+                chapter["topic"], chapter["structure"], chapter["research_analysis"]
+            )
+            for chapter in pending
+        ]
+
+        def refine_interactively(chapter: Dict[str, Any], prompt: str):
+            return self._get_specialized_ai_response(
+                provider="claude",
+                specialty=AISpecialty.TEXT_REFINEMENT,
+                prompt=prompt,
+                context_data={"structure": chapter["structure"], "research": chapter["research_data"]}
+            )
+
+        refinements = None
+        if pending and self._check_service_availability("openai"):
+            for _ in pending:
+                self._track_usage("openai")
+            batch = await multi_ai_manager.batch_generate_content(
+                prompts=[
+                    self._enhance_prompt_for_specialty(prompt, AISpecialty.TEXT_REFINEMENT, "openai")
+                    for prompt in refinement_prompts
+                ],
+                provider="openai",
+                max_tokens=self._STAGE_MAX_TOKENS[AISpecialty.TEXT_REFINEMENT.value],
+                temperature=0.7
+            )
+            if batch.get("success"):
+                refinements = batch["results"]
+                # Requests that failed inside the batch are retried interactively
+                failed = [index for index, refinement in enumerate(refinements) if not refinement.get("success")]
+                if failed:
+                    logger.warning(f"{len(failed)} batch text refinements failed, retrying with interactive calls")
+                    retries = await asyncio.gather(
+                        *(refine_interactively(pending[index], refinement_prompts[index]) for index in failed),
+                        return_exceptions=True
+                    )
+                    for index, retry in zip(failed, retries):
+                        refinements[index] = retry
+            else:
+                logger.warning(f"Batch text refinement unavailable, using interactive calls: {batch.get('error')}")
+        if refinements is None:
+            refinements = await asyncio.gather(
+                *(refine_interactively(chapter, prompt) for chapter, prompt in zip(pending, refinement_prompts)),
+                return_exceptions=True
+            )
+
+        # Step 3: Integrate and validate each chapter as in the single path
+        for chapter, refinement in zip(pending, refinements):
+            if isinstance(refinement, Exception):
+                logger.warning(f"Text refinement failed for {chapter['topic']}: {refinement}")
+                refinement = {"success": False}
+
+            providers_used = []
+            sections_content = {}
+            if chapter["gemini_analysis"].get("success"):
+                providers_used.append("gemini")
+                sections_content["research_analysis"] = chapter["gemini_analysis"]["content"]
+            if refinement.get("success"):
+                providers_used.append(refinement.get("provider", "claude"))
+                sections_content["structured_content"] = refinement["content"]
+            if chapter["perplexity_enhancement"].get("success"):
+                providers_used.append("perplexity")
+                sections_content["enhanced_content"] = chapter["perplexity_enhancement"]["content"]
+
+            try:
+                topic = chapter["topic"]
+                structure = chapter["structure"]
+                research_data = chapter["research_data"]
+                final_content = await self._integrate_ai_responses(sections_content, structure, topic)
+                chapter_content = {
+                    "success": True,
+                    "content": final_content,
+                    "providers_used": providers_used,
+                    "generation_time": time.perf_counter() - start_time,
+                    "evidence_score": research_data.get("average_evidence_score", 0),
+                    "research_sources_count": len(research_data.get("sources", [])),
+                    "sections_generated": len(structure["sections"])
+                }
+                final_chapter = await self._validate_and_cross_reference(chapter_content, topic)
+                result = self._chapter_response(
+                    final_chapter, topic, chapter["chapter_type"], chapter["specialty"], research_data
+                )
+            except Exception as e:
+                logger.error(f"Batch chapter generation failed for {chapter['topic']}: {e}")
+                result = {"success": False, "error": str(e)}
+
+            results[chapter["index"]] = result
+            if on_progress:
+                on_progress(result)
+
+        return results
+
+    def _chapter_response(
+        self,
+        final_chapter: Dict[str, Any],
+        topic: str,
+        chapter_type: str,
+        specialty: str,
+        research_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Wrap a validated chapter with its generation metadata"""
+
+        return {
+            "success": True,
+            "chapter": final_chapter,
+            "metadata": {
+                "topic": topic,
+                "chapter_type": chapter_type,
+                "specialty": specialty,
+                "evidence_quality": final_chapter.get("evidence_score", 0),
+                "ai_providers_used": final_chapter.get("providers_used", []),
+                "research_sources": len(research_data.get("sources", [])),
+                "generation_time": final_chapter.get("generation_time"),
+                "cost_estimate": self._calculate_cost_estimate(final_chapter)
+            }
+        }
+
     async def _analyze_topic_and_structure(
         self,
         topic: str,
@@ -135,64 +652,9 @@ class HybridAIManager:
     ) -> Dict[str, Any]:
         """Analyze topic and determine optimal chapter structure"""
 
-        structure_templates = {
-            "disease_overview": [
-                "Executive Summary",
-                "Epidemiology",
-                "Pathophysiology",
-                "Clinical Presentation",
-                "Diagnostic Workup",
-                "Treatment Options",
-                "Surgical Considerations",
-                "Complications and Management",
-                "Prognosis and Follow-up",
-                "Future Directions",
-                "References"
-            ],
-            "surgical_technique": [
-                "Executive Summary",
-                "Introduction and Background",
-                "Indications and Contraindications",
-                "Preoperative Planning",
-                "Surgical Technique",
-                "Postoperative Care",
-                "Complications and Management",
-                "Outcomes and Evidence",
-                "Pearls and Pitfalls",
-                "Future Developments",
-                "References"
-            ],
-            "anatomy_physiology": [
-                "Executive Summary",
-                "Anatomical Overview",
-                "Microanatomy",
-                "Physiological Function",
-                "Development and Aging",
-                "Clinical Correlations",
-                "Pathological Variants",
-                "Surgical Anatomy",
-                "Imaging Considerations",
-                "Clinical Applications",
-                "References"
-            ],
-            "case_study": [
-                "Executive Summary",
-                "Case Presentation",
-                "Clinical History",
-                "Physical Examination",
-                "Diagnostic Workup",
-                "Differential Diagnosis",
-                "Management Approach",
-                "Surgical Intervention",
-                "Postoperative Course",
-                "Discussion and Literature Review",
-                "References"
-            ]
-        }
-
         return {
             "type": chapter_type,
-            "sections": structure_templates.get(chapter_type, structure_templates["disease_overview"]),
+            "sections": self._STRUCTURE_TEMPLATES.get(chapter_type, self._STRUCTURE_TEMPLATES["disease_overview"]),
             "specialty": specialty,
             "estimated_length": self._estimate_chapter_length(chapter_type),
             "complexity_level": self._assess_topic_complexity(topic)
@@ -201,34 +663,78 @@ class HybridAIManager:
     async def _orchestrate_research(self, topic: str, specialty: str) -> Dict[str, Any]:
         """Orchestrate multi-source research extraction"""
 
+        cache_key = (topic.lower().strip(), specialty)
+        cached = self._research_cache.get(cache_key)
+        if cached is not None:
+            expires_at, research = cached
+            if expires_at > time.monotonic():
+                self._research_cache.move_to_end(cache_key)
+                return research
+            del self._research_cache[cache_key]
+
+        in_flight = self._research_in_flight.get(cache_key)
+        if in_flight is None:
+            in_flight = asyncio.create_task(self._fetch_research(topic, specialty, cache_key))
+            self._research_in_flight[cache_key] = in_flight
+            in_flight.add_done_callback(lambda _: self._research_in_flight.pop(cache_key, None))
+
+        # Shielded so one cancelled caller doesn't cancel the search for the rest
+        return await asyncio.shield(in_flight)
+
+    async def _fetch_research(
+        self,
+        topic: str,
+        specialty: str,
+        cache_key: Tuple[str, str]
+    ) -> Dict[str, Any]:
+        """Search and score PubMed literature for a topic, caching successful results"""
+
         try:
             # Enhanced PubMed search with MeSH terms
-            pubmed_results = await research_api.search_pubmed(
-                query=f"{topic} AND {specialty}",
-                max_results=50,
-                year_from=2015  # Focus on recent literature
-            )
+            async with self._pubmed_semaphore:
+                pubmed_results = await research_api.search_pubmed(
+                    query=f"{topic} AND {specialty}",
+                    max_results=50,
+                    year_from=2015  # Focus on recent literature
+                )
 
             # Quality filtering and evidence scoring
             if pubmed_results.get("success"):
-                scored_sources = []
-                for article in pubmed_results.get("results", []):
-                    evidence_score = self._calculate_evidence_score(article)
-                    if evidence_score > 0.7:  # Quality threshold
-                        article["evidence_score"] = evidence_score
-                        scored_sources.append(article)
-
-                # Sort by evidence quality
-                scored_sources.sort(key=lambda x: x.get("evidence_score", 0), reverse=True)
-
-                return {
+                articles = pubmed_results.get("results", [])
+                current_year = datetime.now().year
+                scores = np.fromiter(
+                    (self._cached_evidence_score(article, current_year=current_year) for article in articles),
+                    dtype=np.float64,
+                    count=len(articles)
+                )
+                kept = np.flatnonzero(scores > 0.7)  # Quality threshold
+                kept_scores = scores[kept]
+
+                # Top 30 highest quality sources; the stable sort keeps search
+                # order among equal scores
+                top = kept[np.argsort(-kept_scores, kind="stable")[:30]]
+                top_sources = []
+                for i in top:
+                    article = articles[i]
+                    article["evidence_score"] = float(scores[i])
+                    top_sources.append(article)
+
+                research = {
                     "success": True,
-                    "sources": scored_sources[:30],  # Top 30 highest quality sources
-                    "total_sources_found": len(pubmed_results.get("results", [])),
-                    "quality_filtered": len(scored_sources),
-                    "average_evidence_score": sum(s.get("evidence_score", 0) for s in scored_sources) / len(scored_sources) if scored_sources else 0
+                    "sources": top_sources,
+                    "total_sources_found": len(articles),
+                    "quality_filtered": len(kept),
+                    "average_evidence_score": float(kept_scores.mean()) if len(kept) else 0
                 }
 
+                # Only successful fetches are cached, so failures are retried
+                self._research_cache[cache_key] = (time.monotonic() + RESEARCH_CACHE_TTL_SECONDS, research)
+                self._research_cache.move_to_end(cache_key)
+                while len(self._research_cache) > RESEARCH_CACHE_MAX_ITEMS:
+                    self._research_cache.popitem(last=False)
+
+                return research
+
             return {"success": False, "sources": []}
 
         except Exception as e:
@@ -244,87 +750,102 @@ class HybridAIManager:
     ) -> Dict[str, Any]:
         """Generate content using specialized AI providers"""
 
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         providers_used = []
         sections_content = {}
 
-        try:
-            # Step 1: Gemini - Research Analysis and Evidence Synthesis
+        async def analyze_and_structure():
+            def refine(research_analysis: Optional[str]) -> asyncio.Task:
+                # Step 2: Claude - Text Refinement and Structure Organization
+                logger.info("✍️ Claude Opus: Structuring content and refining text")
+                return asyncio.create_task(self._get_specialized_ai_response(
+                    provider="claude",
+                    specialty=AISpecialty.TEXT_REFINEMENT,
+                    prompt=self._text_refinement_prompt(topic, structure, research_analysis),
+                    context_data={"structure": structure, "research": research_data}
+                ))
+
+            # Step 1: Gemini - Research Analysis and Evidence Synthesis. The
+            # analysis is streamed so Claude starts as soon as the statistics
+            # and key findings are in, instead of after Gemini's last token
             logger.info("🔬 Gemini 2.5 Pro: Analyzing research data and statistics")
-            gemini_analysis = await self._get_specialized_ai_response(
-                provider="gemini",
-                specialty=AISpecialty.RESEARCH_ANALYSIS,
-                prompt=f"""
-                As Gemini 2.5 Pro with Deep Search and Deep Think capabilities, analyze the research data for: {topic}
-
-                Research Sources Available: {len(research_data.get('sources', []))} high-quality sources
-                Average Evidence Score: {research_data.get('average_evidence_score', 0):.2f}
-
-                Please provide:
-                1. Statistical analysis of the evidence
-                2. Key research findings and trends
-                3. Evidence quality assessment
-                4. Research gaps identification
-                5. Clinical implications of the data
-
-                Use your deep thinking process to provide comprehensive analysis.
-                """,
-                context_data=research_data
+            research_prompt = self._research_analysis_prompt(topic, research_data)
+            analysis_parts = []
+            tail = ""
+            claude_task = None
+            try:
+                try:
+                    async for chunk in self._stream_specialized_ai_response(
+                        "gemini", AISpecialty.RESEARCH_ANALYSIS, research_prompt
+                    ):
+                        analysis_parts.append(chunk)
+                        # Search the whole new chunk, carrying only a short
+                        # tail over for headings split across chunks
+                        window = tail + chunk
+                        if claude_task is None and RESEARCH_FINDINGS_COMPLETE_PATTERN.search(window):
+                            claude_task = refine("".join(analysis_parts))
+                        tail = window[-RESEARCH_FINDINGS_TAIL_CHARS:]
+                    gemini_analysis = {"success": True, "content": "".join(analysis_parts), "provider": "gemini"}
+                except Exception as e:
+                    logger.warning(f"Streaming research analysis failed: {e}")
+                    if analysis_parts:
+                        gemini_analysis = {"success": False, "error": str(e)}
+                    else:
+                        # Nothing streamed: use the regular path, which also
+                        # retries and falls back to the secondary provider
+                        gemini_analysis = await self._get_specialized_ai_response(
+                            provider="gemini",
+                            specialty=AISpecialty.RESEARCH_ANALYSIS,
+                            prompt=research_prompt,
+                            context_data=research_data
+                        )
+
+                if claude_task is None:
+                    claude_task = refine(
+                        gemini_analysis["content"] if gemini_analysis.get("success") else None
+                    )
+                claude_synthesis = await claude_task
+            except BaseException:
+                if claude_task is not None:
+                    claude_task.cancel()
+                raise
+
+            return gemini_analysis, claude_synthesis
+
+        try:
+            # Step 3: Perplexity - Visual Integration and Current Guidelines.
+            # Its guideline pass only needs the topic, so it runs alongside the
+            # Gemini -> Claude chain instead of waiting for Claude's draft
+            logger.info("🌐 Perplexity Pro: Adding visuals and current guidelines")
+            chain_result, perplexity_enhancement = await asyncio.gather(
+                analyze_and_structure(),
+                self._get_specialized_ai_response(
+                    provider="perplexity",
+                    specialty=AISpecialty.VISUAL_INTEGRATION,
+                    prompt=self._guidelines_prompt(topic, structure),
+                    context_data={"research": research_data}
+                ),
+                return_exceptions=True
             )
 
+            # One provider failing doesn't discard the others' output
+            if isinstance(chain_result, Exception):
+                logger.warning(f"Gemini/Claude generation failed: {chain_result}")
+                gemini_analysis, claude_synthesis = {"success": False}, {"success": False}
+            else:
+                gemini_analysis, claude_synthesis = chain_result
+            if isinstance(perplexity_enhancement, Exception):
+                logger.warning(f"Perplexity enhancement failed: {perplexity_enhancement}")
+                perplexity_enhancement = {"success": False}
+
             if gemini_analysis.get("success"):
                 providers_used.append("gemini")
                 sections_content["research_analysis"] = gemini_analysis["content"]
 
-            # Step 2: Claude - Text Refinement and Structure Organization
-            logger.info("✍️ Claude Opus: Structuring content and refining text")
-            claude_synthesis = await self._get_specialized_ai_response(
-                provider="claude",
-                specialty=AISpecialty.TEXT_REFINEMENT,
-                prompt=f"""
-                As Claude Opus 4.1 with extended reasoning capabilities, create a well-structured medical chapter on: {topic}
-
-                Chapter Structure Required: {structure['sections']}
-                Research Analysis: {sections_content.get('research_analysis', 'No analysis available')}
-
-                Please provide:
-                1. Executive summary (300 words)
-                2. Well-organized content for each section
-                3. Seamless integration of research findings
-                4. Clear, clinical language suitable for medical professionals
-                5. Logical flow between sections
-
-                Use your extended reasoning for comprehensive medical writing.
-                """,
-                context_data={"structure": structure, "research": research_data}
-            )
-
             if claude_synthesis.get("success"):
                 providers_used.append("claude")
                 sections_content["structured_content"] = claude_synthesis["content"]
 
-            # Step 3: Perplexity - Visual Integration and Current Guidelines
-            logger.info("🌐 Perplexity Pro: Adding visuals and current guidelines")
-            perplexity_enhancement = await self._get_specialized_ai_response(
-                provider="perplexity",
-                specialty=AISpecialty.VISUAL_INTEGRATION,
-                prompt=f"""
-                As Perplexity Pro with research and citation capabilities, enhance the medical content for: {topic}
-
-                Existing Content: {sections_content.get('structured_content', 'No content available')}
-
-                Please provide:
-                1. Current clinical guidelines and recommendations (2023-2024)
-                2. Visual descriptions for anatomical illustrations needed
-                3. Recent developments and emerging treatments
-                4. Evidence-based citations with specific references
-                5. Multi-modal content suggestions
-
-                Include specific citations and reference the most current literature.
-                """,
-                context_data={"content": sections_content, "research": research_data}
-            )
-
             if perplexity_enhancement.get("success"):
                 providers_used.append("perplexity")
                 sections_content["enhanced_content"] = perplexity_enhancement["content"]
@@ -332,7 +853,7 @@ class HybridAIManager:
             # Step 4: Final Integration and Quality Check
             final_content = await self._integrate_ai_responses(sections_content, structure, topic)
 
-            generation_time = (datetime.now() - start_time).total_seconds()
+            generation_time = time.perf_counter() - start_time
 
             return {
                 "success": True,
@@ -351,19 +872,68 @@ class HybridAIManager:
                 "error": str(e)
             }
 
+    def _research_analysis_prompt(self, topic: str, research_data: Dict[str, Any]) -> str:
+        """Prompt for the research analysis stage"""
+
+        return RESEARCH_ANALYSIS_PROMPT_TEMPLATE.format(
+            topic=topic,
+            n_sources=len(research_data.get("sources", [])),
+            avg_score=research_data.get("average_evidence_score", 0)
+        )
+
+    def _text_refinement_prompt(
+        self,
+        topic: str,
+        structure: Dict[str, Any],
+        research_analysis: Optional[str]
+    ) -> str:
+        """Prompt for the text refinement stage, folding in the research analysis"""
+
+        return TEXT_REFINEMENT_PROMPT_TEMPLATE.format(
+            topic=topic,
+            sections=structure["sections"],
+            research_analysis=self._compact_text(research_analysis, RESEARCH_ANALYSIS_PROMPT_MAX_CHARS)
+            if research_analysis else "No analysis available"
+        )
+
+    @staticmethod
+    def _compact_text(text: str, max_chars: int) -> str:
+        """Text cut to its head and tail when longer than max_chars"""
+
+        if len(text) <= max_chars:
+            return text
+        half = max_chars // 2
+        return f"{text[:half].rstrip()}\n...\n{text[-half:].lstrip()}"
+
+    def _guidelines_prompt(self, topic: str, structure: Dict[str, Any]) -> str:
+        """Prompt for the current guidelines and visuals stage"""
+
+        return GUIDELINES_PROMPT_TEMPLATE.format(topic=topic, sections=structure["sections"])
+
     async def _get_specialized_ai_response(
         self,
         provider: str,
         specialty: AISpecialty,
         prompt: str,
-        context_data: Dict[str, Any] = None
+        context_data: Dict[str, Any] = None,
+        temperature: float = 0.7,
+        use_cache: Optional[bool] = None
     ) -> Dict[str, Any]:
-        """Get specialized response from AI provider based on their strengths"""
+        """Get specialized response from AI provider based on their strengths
+
+        With use_cache, a successful response is reused for the same
+        provider, specialty, temperature and prompt for PROMPT_CACHE_TTL_SECONDS.
+        It defaults to caching only deterministic (temperature 0) calls, so
+        regenerating creative output always reaches the provider.
+        """
+
+        if use_cache is None:
+            use_cache = temperature == 0
 
         # Check rate limits and circuit breakers
         if not self._check_service_availability(provider):
             # Fallback to secondary provider
-            fallback_provider = self.ai_specialization[specialty]["secondary"]
+            fallback_provider = self.ai_specialization[specialty.value]["secondary"]
             if self._check_service_availability(fallback_provider):
                 provider = fallback_provider
             else:
@@ -372,38 +942,101 @@ class HybridAIManager:
         # Route to appropriate AI with specialized prompting
         enhanced_prompt = self._enhance_prompt_for_specialty(prompt, specialty, provider)
 
+        cache_key = None
+        if use_cache:
+            cache_key = hashlib.blake2b(
+                f"{provider}\0{specialty.value}\0{temperature}\0{enhanced_prompt}".encode(), digest_size=16
+            ).hexdigest()
+            cached = self._prompt_cache.get(cache_key)
+            if cached is not None:
+                expires_at, response = cached
+                if expires_at > time.monotonic():
+                    self._prompt_cache.move_to_end(cache_key)
+                    return {**response, "cached": True}
+                del self._prompt_cache[cache_key]
+
         # Track usage for cost optimization
         self._track_usage(provider)
 
-        # Call the AI provider
-        result = await multi_ai_manager.generate_content(
-            prompt=enhanced_prompt,
-            provider=provider,
-            max_tokens=2000,
-            temperature=0.7
-        )
+        # Call the AI provider within its concurrency and rate limits,
+        # retrying transient failures here rather than failing the chapter
+        breaker = self.circuit_breakers[provider]
+        for attempt in range(AI_CALL_MAX_ATTEMPTS):
+            async with self._provider_semaphores[provider]:
+                await self._provider_buckets[provider].acquire()
+                result = await multi_ai_manager.generate_content(
+                    prompt=enhanced_prompt,
+                    provider=provider,
+                    max_tokens=self._STAGE_MAX_TOKENS[specialty.value],
+                    temperature=temperature
+                )
+
+            if result.get("success"):
+                breaker.record_success()
+                if cache_key is not None:
+                    self._prompt_cache[cache_key] = (time.monotonic() + PROMPT_CACHE_TTL_SECONDS, result)
+                    while len(self._prompt_cache) > PROMPT_CACHE_MAX_ITEMS:
+                        self._prompt_cache.popitem(last=False)
+                return result
+
+            status_code = result.get("status_code")
+            if status_code is not None and status_code != 429 and status_code < 500:
+                # Rejected request (e.g. 400), not a provider outage
+                return result
+
+            breaker.record_failure()
+            if status_code is None or attempt == AI_CALL_MAX_ATTEMPTS - 1 or not breaker.allow_request():
+                return result
+
+            await asyncio.sleep(self._retry_delay(attempt, result.get("retry_after")))
 
         return result
 
+    async def _stream_specialized_ai_response(
+        self,
+        provider: str,
+        specialty: AISpecialty,
+        prompt: str
+    ) -> AsyncIterator[str]:
+        """Stream a specialized response from one provider (no retry or fallback)"""
+
+        if not self._check_service_availability(provider):
+            raise RuntimeError(f"Provider {provider} not available")
+
+        enhanced_prompt = self._enhance_prompt_for_specialty(prompt, specialty, provider)
+        self._track_usage(provider)
+
+        breaker = self.circuit_breakers[provider]
+        async with self._provider_semaphores[provider]:
+            await self._provider_buckets[provider].acquire()
+            try:
+                async for chunk in multi_ai_manager.stream_content(
+                    prompt=enhanced_prompt,
+                    provider=provider,
+                    max_tokens=self._STAGE_MAX_TOKENS[specialty.value],
+                    temperature=0.7
+                ):
+                    yield chunk
+            except Exception:
+                breaker.record_failure()
+                raise
+        breaker.record_success()
+
+    @staticmethod
+    def _retry_delay(attempt: int, retry_after: Optional[str]) -> float:
+        """Backoff before the next attempt: Retry-After if given, else jittered exponential"""
+
+        if retry_after:
+            try:
+                return min(float(retry_after), AI_RETRY_MAX_DELAY_SECONDS)
+            except ValueError:
+                pass  # HTTP-date form; fall back to backoff
+        return min(2 ** attempt + random.random(), AI_RETRY_MAX_DELAY_SECONDS)
+
     def _enhance_prompt_for_specialty(self, prompt: str, specialty: AISpecialty, provider: str) -> str:
         """Enhance prompt based on AI provider specialty"""
 
-        specialty_enhancements = {
-            AISpecialty.RESEARCH_ANALYSIS: {
-                "gemini": "Use your Deep Search and Deep Think capabilities for comprehensive analysis.",
-                "perplexity": "Focus on evidence synthesis and statistical interpretation."
-            },
-            AISpecialty.TEXT_REFINEMENT: {
-                "claude": "Use your extended reasoning for superior medical writing and organization.",
-                "openai": "Focus on clear, clinical language and logical structure."
-            },
-            AISpecialty.VISUAL_INTEGRATION: {
-                "perplexity": "Integrate visual elements and current research with citations.",
-                "gemini": "Include multi-modal content suggestions and current guidelines."
-            }
-        }
-
-        enhancement = specialty_enhancements.get(specialty, {}).get(provider, "")
+        enhancement = self._SPECIALTY_ENHANCEMENTS.get(specialty.value, {}).get(provider, "")
         return f"{prompt}\n\nSpecial Instructions: {enhancement}"
 
     async def _integrate_ai_responses(
@@ -414,37 +1047,80 @@ class HybridAIManager:
     ) -> str:
         """Integrate responses from multiple AI providers into coherent chapter"""
 
-        integrated_content = f"# {topic}\n\n"
-        integrated_content += "*Generated using advanced AI orchestration with multiple specialized providers*\n\n"
+        generated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        parts = [
+            f"# {topic}\n\n",
+            "*Generated using advanced AI orchestration with multiple specialized providers*\n\n"
+        ]
 
         # Add research analysis summary
         if "research_analysis" in sections_content:
-            integrated_content += "## Research Foundation\n\n"
-            integrated_content += sections_content["research_analysis"]
-            integrated_content += "\n\n---\n\n"
+            parts.append("## Research Foundation\n\n")
+            parts.append(sections_content["research_analysis"])
+            parts.append("\n\n---\n\n")
 
         # Add main structured content
         if "structured_content" in sections_content:
-            integrated_content += sections_content["structured_content"]
-            integrated_content += "\n\n---\n\n"
+            parts.append(sections_content["structured_content"])
+            parts.append("\n\n---\n\n")
 
         # Add enhanced content with current guidelines
         if "enhanced_content" in sections_content:
-            integrated_content += "## Current Guidelines and Developments\n\n"
-            integrated_content += sections_content["enhanced_content"]
-            integrated_content += "\n\n"
+            parts.append("## Current Guidelines and Developments\n\n")
+            parts.append(sections_content["enhanced_content"])
+            parts.append("\n\n")
 
         # Add generation metadata
-        integrated_content += "\n\n---\n\n"
-        integrated_content += "**Generation Metadata:**\n"
-        integrated_content += f"- AI Providers Used: {', '.join(sections_content.keys())}\n"
-        integrated_content += f"- Chapter Type: {structure['type']}\n"
-        integrated_content += f"- Specialty: {structure['specialty']}\n"
-        integrated_content += f"- Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        parts.append("\n\n---\n\n")
+        parts.append("**Generation Metadata:**\n")
+        parts.append(f"- AI Providers Used: {', '.join(sections_content.keys())}\n")
+        parts.append(f"- Chapter Type: {structure['type']}\n")
+        parts.append(f"- Specialty: {structure['specialty']}\n")
+        parts.append(f"- Generated: {generated_at}\n")
+
+        return "".join(parts)
+
+    def _cached_evidence_score(self, article: Dict[str, Any], *, current_year: int) -> float:
+        """Evidence score for an article, memoized by PMID across overlapping searches"""
+
+        pmid = article.get("pmid")
+        if not pmid:
+            return self._calculate_evidence_score(article, current_year=current_year)
+
+        # The recency bonus depends on the current year, so it is part of the key
+        cache_key = (pmid, current_year)
+        score = self._evidence_score_cache.get(cache_key)
+        if score is None:
+            score = self._disk_evidence_score(article, pmid, current_year)
+            self._evidence_score_cache[cache_key] = score
+            while len(self._evidence_score_cache) > EVIDENCE_SCORE_CACHE_MAX_ITEMS:
+                self._evidence_score_cache.popitem(last=False)
+        else:
+            self._evidence_score_cache.move_to_end(cache_key)
+        return score
+
+    def _disk_evidence_score(self, article: Dict[str, Any], pmid: str, current_year: int) -> float:
+        """Evidence score from the on-disk cache, scoring and storing it on a miss"""
 
-        return integrated_content
+        if self._evidence_score_disk is None:
+            return self._calculate_evidence_score(article, current_year=current_year)
+
+        disk_key = f"{EVIDENCE_SCORE_VERSION}:{pmid}:{current_year}"
+        try:
+            score = self._evidence_score_disk.get(disk_key)
+        except Exception as e:
+            logger.warning(f"Evidence score disk cache read failed: {e}")
+            return self._calculate_evidence_score(article, current_year=current_year)
+
+        if score is None:
+            score = self._calculate_evidence_score(article, current_year=current_year)
+            try:
+                self._evidence_score_disk.set(disk_key, score, expire=EVIDENCE_SCORE_DISK_TTL_SECONDS)
+            except Exception as e:
+                logger.warning(f"Evidence score disk cache write failed: {e}")
+        return score
 
-    def _calculate_evidence_score(self, article: Dict[str, Any]) -> float:
+    def _calculate_evidence_score(self, article: Dict[str, Any], *, current_year: int) -> float:
         """Calculate evidence quality score for research article"""
 
         base_score = 0.5
@@ -454,7 +1130,6 @@ class HybridAIManager:
         if pub_year:
             try:
                 year = int(pub_year)
-                current_year = datetime.now().year
                 if year >= current_year - 5:  # Last 5 years
                     base_score += 0.2
                 elif year >= current_year - 10:  # Last 10 years
@@ -463,64 +1138,63 @@ class HybridAIManager:
                 pass
 
         # Journal quality (simplified - in production, use impact factors)
-        journal = article.get("journal", "").lower()
-        high_impact_journals = ["nature", "science", "nejm", "lancet", "jama"]
-        if any(journal_name in journal for journal_name in high_impact_journals):
+        if self._high_impact_regex.search(article.get("journal", "")):
             base_score += 0.2
 
-        # Article type bonus
-        title = article.get("title", "").lower()
-        abstract = article.get("abstract", "").lower()
-
-        for evidence_type, score in self.evidence_hierarchy.items():
-            if evidence_type.replace("_", " ") in title or evidence_type.replace("_", " ") in abstract:
-                base_score = max(base_score, score * 0.8)  # 80% of hierarchy score
-                break
+        # Article type bonus: the highest-ranked evidence type mentioned
+        # Lowercased once; the newline keeps phrases from matching across the two fields
+        text = f"{article.get('title') or ''}\n{article.get('abstract') or ''}".lower()
+        matched = self._evidence_matches(text)
+        if matched:
+            _, score = min(matched)
+            base_score = max(base_score, score * 0.8)  # 80% of hierarchy score
 
         return min(base_score, 1.0)
 
+    def _evidence_matches(self, text: str) -> List[Tuple[int, float]]:
+        """(hierarchy rank, score) of each evidence-type phrase found in lowercased text"""
+
+        if self._evidence_automaton is not None:
+            return [rank_and_score for _, rank_and_score in self._evidence_automaton.iter(text)]
+        return [self._evidence_phrases[phrase] for phrase in self._evidence_regex.findall(text)]
+
     def _check_service_availability(self, provider: str) -> bool:
         """Check if AI service is available based on rate limits and circuit breakers"""
 
-        # Simple implementation - in production, implement proper circuit breaker
-        return provider in multi_ai_manager.providers and multi_ai_manager.providers[provider]
+        configured = provider in multi_ai_manager.providers and multi_ai_manager.providers[provider]
+        breaker = self.circuit_breakers.get(provider)
+        return bool(configured) and (breaker is None or breaker.allow_request())
 
     def _track_usage(self, provider: str):
         """Track usage for cost optimization"""
 
         today = datetime.now().date()
         if today not in self.usage_tracker:
-            self.usage_tracker[today] = {}
-
-        if provider not in self.usage_tracker[today]:
-            self.usage_tracker[today][provider] = 0
+            # First call of the day: drop counts past the retention window
+            cutoff = today - timedelta(days=USAGE_HISTORY_DAYS)
+            for day in [day for day in self.usage_tracker if day < cutoff]:
+                del self.usage_tracker[day]
+                self._daily_total_cost.pop(day, None)
 
         self.usage_tracker[today][provider] += 1
+        self._daily_total_cost[today] += COST_PER_PROVIDER_CALL
 
     def _calculate_cost_estimate(self, chapter_data: Dict[str, Any]) -> float:
         """Calculate estimated cost for chapter generation"""
 
         # Simplified cost calculation
-        base_cost_per_provider = 0.50  # $0.50 per provider call
         providers_used = len(chapter_data.get("providers_used", []))
-        return base_cost_per_provider * providers_used
+        return COST_PER_PROVIDER_CALL * providers_used
 
     def _estimate_chapter_length(self, chapter_type: str) -> int:
         """Estimate chapter length in words"""
 
-        length_estimates = {
-            "disease_overview": 5000,
-            "surgical_technique": 4000,
-            "anatomy_physiology": 3500,
-            "case_study": 3000
-        }
-        return length_estimates.get(chapter_type, 4000)
+        return self._LENGTH_ESTIMATES.get(chapter_type, 4000)
 
     def _assess_topic_complexity(self, topic: str) -> str:
         """Assess topic complexity for AI routing decisions"""
 
-        complex_terms = ["molecular", "genetic", "immunology", "pathophysiology"]
-        if any(term in topic.lower() for term in complex_terms):
+        if self._COMPLEX_TERMS.intersection(re.findall(r"[a-z]+", topic.lower())):
             return "high"
         elif len(topic.split()) > 3:
             return "medium"
@@ -546,18 +1220,25 @@ class HybridAIManager:
         """Get usage analytics for cost optimization"""
 
         today = datetime.now().date()
-        daily_usage = self.usage_tracker.get(today, {})
+        daily_usage = self.usage_tracker.get(today, Counter())
+        daily_cost = self._daily_total_cost.get(today, 0.0)
 
         return {
             "daily_usage": daily_usage,
-            "total_calls_today": sum(daily_usage.values()),
-            "estimated_daily_cost": sum(daily_usage.values()) * 0.50,
-            "budget_remaining": self.daily_budget - (sum(daily_usage.values()) * 0.50),
-            "providers_status": {
-                provider: self._check_service_availability(provider)
-                for provider in ["openai", "gemini", "claude", "perplexity"]
-            }
+            "total_calls_today": daily_usage.total(),
+            "estimated_daily_cost": daily_cost,
+            "budget_remaining": self.daily_budget - daily_cost,
+            "providers_status": self._providers_status()
         }
 
+    def _providers_status(self) -> Dict[str, bool]:
+        """Availability of every provider, cached for PROVIDERS_STATUS_TTL_SECONDS"""
+
+        now = time.monotonic()
+        if self._providers_status_cache is None or self._providers_status_cache[0] <= now:
+            status = {provider: self._check_service_availability(provider) for provider in AI_PROVIDERS}
+            self._providers_status_cache = (now + PROVIDERS_STATUS_TTL_SECONDS, status)
+        return dict(self._providers_status_cache[1])
+
 # Global hybrid AI manager instance
 hybrid_ai_manager = HybridAIManager()
\ No newline at end of file
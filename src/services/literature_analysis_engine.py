@@ -4,17 +4,32 @@ Advanced automated analysis and synthesis of medical literature
 """
 
 import asyncio
+import hashlib
 import logging
 import json
 import re
 from typing import Dict, List, Any, Optional, Tuple, Set
 from datetime import datetime, timedelta
-from collections import defaultdict, Counter
+from collections import defaultdict, Counter, OrderedDict
+from itertools import islice
 from dataclasses import dataclass
 from enum import Enum
 import networkx as nx
 import numpy as np
+from scipy import sparse
 
+try:
+    from datasketch import MinHash, MinHashLSH
+except ImportError:
+    MinHash = None
+    MinHashLSH = None
+
+try:
+    from diskcache import Cache
+except ImportError:
+    Cache = None
+
+from ..core.config import settings
 from .research_api import research_api
 from .multi_ai_manager import multi_ai_manager
 from .semantic_search_engine import semantic_search_engine
@@ -22,6 +37,50 @@ from .neurosurgical_concepts import neurosurgical_concepts, ConceptCategory
 
 logger = logging.getLogger(__name__)
 
+# Completed analyses kept per (topic, max_papers, years_back): an in-process
+# LRU, plus a disk tier (with diskcache) that survives restarts
+ANALYSIS_CACHE_MAX_ITEMS = 128
+ANALYSIS_CACHE_DISK_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# Paper-pair conflict comparisons in flight at once (one LLM call each)
+CONFLICT_COMPARISON_CONCURRENCY = 10
+
+# With embeddings available, only pairs whose title + abstract embeddings are
+# at least this cosine-similar are sent for an LLM conflict comparison
+CONFLICT_CANDIDATE_SIMILARITY = 0.85
+
+def _pagerank(graph: nx.DiGraph, alpha: float = 0.85, max_iter: int = 100, tol: float = 1.0e-6) -> Dict[Any, float]:
+    """PageRank by sparse power iteration, with nx.pagerank's defaults
+
+    Dangling nodes spread their rank uniformly; stops once the L1 change
+    drops below n * tol.
+    """
+
+    nodes = list(graph)
+    n = len(nodes)
+    if n == 0:
+        return {}
+
+    index = {node: i for i, node in enumerate(nodes)}
+    edges = list(graph.edges())
+    adjacency = sparse.csr_matrix(
+        (np.ones(len(edges)), ([index[u] for u, _ in edges], [index[v] for _, v in edges])),
+        shape=(n, n)
+    )
+    out_degree = np.asarray(adjacency.sum(axis=1)).ravel()
+    dangling = out_degree == 0
+    inverse_degree = np.divide(1.0, out_degree, out=np.zeros(n), where=~dangling)
+    transition = (sparse.diags(inverse_degree) @ adjacency).T.tocsr()
+
+    rank = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        previous = rank
+        rank = alpha * (transition @ previous + previous[dangling].sum() / n) + (1 - alpha) / n
+        if np.abs(rank - previous).sum() < n * tol:
+            break
+
+    return dict(zip(nodes, rank.tolist()))
+
 class EvidenceLevel(Enum):
     SYSTEMATIC_REVIEW = "systematic_review"
     META_ANALYSIS = "meta_analysis"
@@ -32,6 +91,32 @@ class EvidenceLevel(Enum):
     CASE_REPORT = "case_report"
     EXPERT_OPINION = "expert_opinion"
 
+EVIDENCE_LEVELS_BY_LABEL = {level.value: level for level in EvidenceLevel}
+
+# Titles with word Jaccard similarity above this are duplicates; with
+# datasketch, MinHash LSH finds the candidates instead of comparing every pair
+TITLE_DUPLICATE_THRESHOLD = 0.85
+TITLE_MINHASH_PERMUTATIONS = 64
+
+# Extracted concepts kept per paper text, shared by relevance scoring and
+# topic grouping
+CONCEPT_CACHE_MAX_ITEMS = 2000
+
+# Citation network metrics: betweenness is estimated from a sample of source
+# nodes on larger graphs, and closeness is only computed for small ones
+CITATION_BETWEENNESS_SAMPLE_NODES = 50
+CITATION_CLOSENESS_MAX_NODES = 200
+
+# Papers classified per evidence-level LLM call, and its output budget: about
+# 10 tokens per '"12": "randomized_trial",' entry, with headroom for the
+# code fence or preamble the Claude wrapper's instructions tend to add
+EVIDENCE_CLASSIFICATION_BATCH_SIZE = 20
+EVIDENCE_CLASSIFICATION_TOKENS_PER_PAPER = 16
+EVIDENCE_CLASSIFICATION_TOKENS_OVERHEAD = 250
+
+# One complete '"<paper number>": "<label>"' entry of a classification response
+EVIDENCE_LABEL_ENTRY_PATTERN = re.compile(r'"(\d+)"\s*:\s*"([a-z_]+)"', re.IGNORECASE)
+
 class ConflictType(Enum):
     METHODOLOGY = "methodology"
     RESULTS = "results"
@@ -100,9 +185,31 @@ class LiteratureAnalysisEngine:
             EvidenceLevel.EXPERT_OPINION: 0.4
         }
 
-        # Cache for literature analysis
-        self.analysis_cache = {}
+        # Cache for literature analysis, least recently used first
+        self.analysis_cache: OrderedDict[str, EvidenceSynthesis] = OrderedDict()
         self.citation_networks = {}
+        self._analysis_disk_cache = None
+        if Cache is not None:
+            try:
+                self._analysis_disk_cache = Cache(settings.literature_analysis_cache_dir)
+            except Exception as e:
+                logger.warning(f"Literature analysis disk cache unavailable: {e}")
+        # Keyword fallback for evidence classification, one pattern per level in
+        # priority order; plain substring matches like the original term checks
+        self._evidence_keyword_patterns = [
+            (level, re.compile("|".join(re.escape(term) for term in terms)))
+            for level, terms in (
+                (EvidenceLevel.SYSTEMATIC_REVIEW, ['systematic review', 'meta-analysis']),
+                (EvidenceLevel.RANDOMIZED_TRIAL, ['randomized', 'rct', 'controlled trial']),
+                (EvidenceLevel.COHORT_STUDY, ['cohort', 'longitudinal']),
+                (EvidenceLevel.CASE_CONTROL, ['case-control', 'case control']),
+                (EvidenceLevel.CASE_SERIES, ['case series', 'case study']),
+                (EvidenceLevel.CASE_REPORT, ['case report'])
+            )
+        ]
+
+        # blake2b(paper text) -> extracted concepts, least recently used first
+        self._concept_cache: OrderedDict[str, List[Any]] = OrderedDict()
 
     async def analyze_literature_corpus(
         self,
@@ -115,6 +222,14 @@ class LiteratureAnalysisEngine:
         Comprehensive analysis of literature corpus on a specific topic
         """
 
+        cache_key = hashlib.blake2b(
+            f"{topic}|{max_papers}|{years_back}".encode('utf-8'), digest_size=16
+        ).hexdigest()
+        cached = self._cached_analysis(cache_key)
+        if cached is not None:
+            logger.info(f"♻️ Using cached literature analysis for: '{topic}'")
+            return cached
+
         try:
             logger.info(f"🔬 Starting literature analysis for: '{topic}'")
 
@@ -153,9 +268,10 @@ class LiteratureAnalysisEngine:
                 citation_network=citation_network
             )
 
-            # Cache the result
-            cache_key = f"{topic}_{max_papers}_{years_back}"
-            self.analysis_cache[cache_key] = result
+            # Cache the result; an empty corpus usually means the searches
+            # failed, so it is not kept
+            if papers:
+                self._store_analysis(cache_key, result)
 
             logger.info(f"✅ Literature analysis completed (quality: {quality_score:.2f})")
             return result
@@ -164,6 +280,41 @@ class LiteratureAnalysisEngine:
             logger.error(f"❌ Literature analysis failed: {e}")
             raise
 
+    def _cached_analysis(self, cache_key: str) -> Optional[EvidenceSynthesis]:
+        """Cached analysis from memory, else from disk"""
+
+        result = self.analysis_cache.get(cache_key)
+        if result is not None:
+            self.analysis_cache.move_to_end(cache_key)
+            return result
+
+        if self._analysis_disk_cache is not None:
+            try:
+                result = self._analysis_disk_cache.get(cache_key)
+            except Exception as e:
+                logger.warning(f"Literature analysis disk cache read failed: {e}")
+            if result is not None:
+                self._remember_analysis(cache_key, result)
+        return result
+
+    def _store_analysis(self, cache_key: str, result: EvidenceSynthesis):
+        """Cache an analysis in memory and on disk"""
+
+        self._remember_analysis(cache_key, result)
+        if self._analysis_disk_cache is not None:
+            try:
+                self._analysis_disk_cache.set(cache_key, result, expire=ANALYSIS_CACHE_DISK_TTL_SECONDS)
+            except Exception as e:
+                logger.warning(f"Literature analysis disk cache write failed: {e}")
+
+    def _remember_analysis(self, cache_key: str, result: EvidenceSynthesis):
+        """Add an analysis to the in-memory LRU"""
+
+        self.analysis_cache[cache_key] = result
+        self.analysis_cache.move_to_end(cache_key)
+        while len(self.analysis_cache) > ANALYSIS_CACHE_MAX_ITEMS:
+            self.analysis_cache.popitem(last=False)
+
     async def _gather_literature(
         self,
         topic: str,
@@ -177,37 +328,39 @@ class LiteratureAnalysisEngine:
             current_year = datetime.now().year
             year_from = current_year - years_back
 
-            # Search PubMed
-            pubmed_result = await research_api.search_pubmed(
-                query=topic,
-                max_results=max_papers // 2,
-                year_from=year_from,
-                article_types=["Clinical Trial", "Systematic Review", "Meta-Analysis", "Review"]
+            # Search PubMed and Google Scholar (for additional papers) together
+            pubmed_result, scholar_result = await asyncio.gather(
+                research_api.search_pubmed(
+                    query=topic,
+                    max_results=max_papers // 2,
+                    year_from=year_from,
+                    article_types=["Clinical Trial", "Systematic Review", "Meta-Analysis", "Review"]
+                ),
+                research_api.search_google_scholar(
+                    query=topic,
+                    max_results=max_papers // 2,
+                    year_from=year_from
+                ),
+                return_exceptions=True
             )
 
             papers = []
-            if pubmed_result.get("success"):
-                papers.extend(pubmed_result.get("articles", []))
-
-            # Search Google Scholar for additional papers
-            scholar_result = await research_api.search_google_scholar(
-                query=topic,
-                max_results=max_papers // 2,
-                year_from=year_from
-            )
-
-            if scholar_result.get("success"):
-                papers.extend(scholar_result.get("articles", []))
+            for source, result in (("PubMed", pubmed_result), ("Google Scholar", scholar_result)):
+                if isinstance(result, Exception):
+                    logger.warning(f"{source} search failed: {result}")
+                elif result.get("success"):
+                    papers.extend(result.get("results", []))
 
             # Remove duplicates based on title similarity
             unique_papers = await self._deduplicate_papers(papers)
 
             # Enhance papers with neurosurgical relevance scoring
-            enhanced_papers = []
-            for paper in unique_papers[:max_papers]:
-                relevance = await self._calculate_neurosurgical_relevance(paper)
+            enhanced_papers = unique_papers[:max_papers]
+            relevances = await asyncio.gather(
+                *(self._calculate_neurosurgical_relevance(paper) for paper in enhanced_papers)
+            )
+            for paper, relevance in zip(enhanced_papers, relevances):
                 paper['neurosurgical_relevance'] = relevance
-                enhanced_papers.append(paper)
 
             # Sort by relevance and return top papers
             enhanced_papers.sort(key=lambda x: x['neurosurgical_relevance'], reverse=True)
@@ -226,8 +379,10 @@ class LiteratureAnalysisEngine:
 
             # Add nodes for each paper
             nodes = []
+            paper_ids = []
             for paper in papers:
-                pmid = paper.get('pmid', paper.get('id', str(hash(paper['title']))))
+                pmid = self._paper_id(paper)
+                paper_ids.append(pmid)
 
                 node_data = {
                     'pmid': pmid,
@@ -239,29 +394,35 @@ class LiteratureAnalysisEngine:
                     'neurosurgical_relevance': paper.get('neurosurgical_relevance', 0.0)
                 }
 
-                G.add_node(pmid, **node_data)
                 nodes.append(node_data)
 
+            G.add_nodes_from((node_data['pmid'], node_data) for node_data in nodes)
+            node_ids = set(paper_ids)
+
             # Add edges based on citations (simplified approach)
             edges = []
-            for paper in papers:
-                pmid = paper.get('pmid', paper.get('id', str(hash(paper['title']))))
+            for pmid, paper in zip(paper_ids, papers):
                 references = paper.get('references', [])
 
                 for ref_pmid in references:
-                    if ref_pmid in G.nodes():
-                        G.add_edge(pmid, ref_pmid, relationship='cites')
+                    if ref_pmid in node_ids:
                         edges.append({
                             'citing': pmid,
                             'cited': ref_pmid,
                             'relationship': 'cites'
                         })
 
+            G.add_edges_from(((edge['citing'], edge['cited']) for edge in edges), relationship='cites')
+
             # Calculate network metrics
             try:
-                pagerank = nx.pagerank(G)
-                betweenness = nx.betweenness_centrality(G)
-                closeness = nx.closeness_centrality(G)
+                pagerank = _pagerank(G)
+                node_count = G.number_of_nodes()
+                if node_count > CITATION_BETWEENNESS_SAMPLE_NODES:
+                    betweenness = nx.betweenness_centrality(G, k=CITATION_BETWEENNESS_SAMPLE_NODES, seed=0)
+                else:
+                    betweenness = nx.betweenness_centrality(G)
+                closeness = nx.closeness_centrality(G) if node_count < CITATION_CLOSENESS_MAX_NODES else {}
             except:
                 pagerank = {node: 0.1 for node in G.nodes()}
                 betweenness = {node: 0.1 for node in G.nodes()}
@@ -289,52 +450,80 @@ class LiteratureAnalysisEngine:
     async def _classify_evidence_levels(self, papers: List[Dict[str, Any]]) -> List[CitationNode]:
         """Classify papers by evidence level using AI analysis"""
 
-        classified_papers = []
-
-        for paper in papers:
-            try:
-                # Extract key information
-                title = paper.get('title', '')
-                abstract = paper.get('abstract', '')
-                keywords = paper.get('keywords', [])
-
-                # Use AI to classify evidence level
-                evidence_level = await self._ai_classify_evidence_level(title, abstract)
-
-                # Create CitationNode
-                node = CitationNode(
-                    pmid=paper.get('pmid', str(hash(title))),
-                    title=title,
-                    authors=paper.get('authors', []),
-                    journal=paper.get('journal', ''),
-                    year=paper.get('year', 0),
-                    citation_count=paper.get('citation_count', 0),
-                    abstract=abstract,
-                    keywords=keywords,
-                    evidence_level=evidence_level,
-                    neurosurgical_relevance=paper.get('neurosurgical_relevance', 0.0)
+        # One classification call per EVIDENCE_CLASSIFICATION_BATCH_SIZE papers,
+        # with the batches in flight together
+        paper_iter = iter(papers)
+        batches = list(iter(lambda: list(islice(paper_iter, EVIDENCE_CLASSIFICATION_BATCH_SIZE)), []))
+        batch_levels = await asyncio.gather(
+            *(
+                self._ai_classify_evidence_level_batch(
+                    [(paper.get('title', ''), paper.get('abstract', '')) for paper in batch]
                 )
+                for batch in batches
+            ),
+            return_exceptions=True
+        )
 
-                classified_papers.append(node)
+        classified_papers = []
 
-            except Exception as e:
-                logger.warning(f"Failed to classify paper: {e}")
-                continue
+        for batch, levels in zip(batches, batch_levels):
+            if isinstance(levels, Exception):
+                logger.warning(f"Failed to classify evidence levels: {levels}")
+                levels = [
+                    self._keyword_evidence_level(paper.get('title', ''), paper.get('abstract', ''))
+                    for paper in batch
+                ]
+
+            for paper, evidence_level in zip(batch, levels):
+                try:
+                    # Extract key information
+                    title = paper.get('title', '')
+                    abstract = paper.get('abstract', '')
+                    keywords = paper.get('keywords', [])
+
+                    # Create CitationNode
+                    node = CitationNode(
+                        pmid=self._paper_id(paper),
+                        title=title,
+                        authors=paper.get('authors', []),
+                        journal=paper.get('journal', ''),
+                        year=paper.get('year', 0),
+                        citation_count=paper.get('citation_count', 0),
+                        abstract=abstract,
+                        keywords=keywords,
+                        evidence_level=evidence_level,
+                        neurosurgical_relevance=paper.get('neurosurgical_relevance', 0.0)
+                    )
+
+                    classified_papers.append(node)
+
+                except Exception as e:
+                    logger.warning(f"Failed to classify paper: {e}")
+                    continue
 
         return classified_papers
 
-    async def _ai_classify_evidence_level(self, title: str, abstract: str) -> EvidenceLevel:
-        """Use AI to classify the evidence level of a paper"""
+    async def _ai_classify_evidence_level_batch(self, items: List[Tuple[str, str]]) -> List[EvidenceLevel]:
+        """Use AI to classify the evidence level of several papers in one call
+
+        Labels are keyed by paper number, so a skipped or reordered entry only
+        affects that paper; papers the response doesn't cover fall back to
+        keyword classification.
+        """
 
         try:
+            papers_text = "\n\n".join(
+                f"Paper {number}:\nTitle: {title}\nAbstract: {abstract[:500]}..."
+                for number, (title, abstract) in enumerate(items, 1)
+            )
+
             # Create classification prompt
             prompt = f"""
-            Classify the evidence level of this medical research paper:
+            Classify the evidence level of each of these {len(items)} medical research papers:
 
-            Title: {title}
-            Abstract: {abstract[:500]}...
+            {papers_text}
 
-            Classify as one of:
+            Classify each as one of:
             - systematic_review: Systematic review or meta-analysis
             - meta_analysis: Statistical meta-analysis
             - randomized_trial: Randomized controlled trial
@@ -344,7 +533,8 @@ class LiteratureAnalysisEngine:
             - case_report: Single case report
             - expert_opinion: Expert opinion or editorial
 
-            Respond with only the classification (e.g., "randomized_trial").
+            Respond with only a JSON object mapping each paper number to its classification:
+            {{"1": "randomized_trial", "2": "cohort_study", ...}}
             """
 
             # Use Claude for classification (best for medical text analysis)
@@ -352,48 +542,57 @@ class LiteratureAnalysisEngine:
                 prompt=prompt,
                 provider="claude",
                 context_type="medical",
-                max_tokens=50,
+                max_tokens=(
+                    EVIDENCE_CLASSIFICATION_TOKENS_PER_PAPER * len(items)
+                    + EVIDENCE_CLASSIFICATION_TOKENS_OVERHEAD
+                ),
                 temperature=0.1
             )
 
+            labels: Dict[int, str] = {}
             if result.get("success"):
-                classification = result["content"].strip().lower()
-
-                # Map to EvidenceLevel enum
-                level_mapping = {
-                    'systematic_review': EvidenceLevel.SYSTEMATIC_REVIEW,
-                    'meta_analysis': EvidenceLevel.META_ANALYSIS,
-                    'randomized_trial': EvidenceLevel.RANDOMIZED_TRIAL,
-                    'cohort_study': EvidenceLevel.COHORT_STUDY,
-                    'case_control': EvidenceLevel.CASE_CONTROL,
-                    'case_series': EvidenceLevel.CASE_SERIES,
-                    'case_report': EvidenceLevel.CASE_REPORT,
-                    'expert_opinion': EvidenceLevel.EXPERT_OPINION
-                }
-
-                return level_mapping.get(classification, EvidenceLevel.EXPERT_OPINION)
-
-            # Fallback classification based on keywords
-            title_abstract = (title + " " + abstract).lower()
-
-            if any(term in title_abstract for term in ['systematic review', 'meta-analysis']):
-                return EvidenceLevel.SYSTEMATIC_REVIEW
-            elif any(term in title_abstract for term in ['randomized', 'rct', 'controlled trial']):
-                return EvidenceLevel.RANDOMIZED_TRIAL
-            elif any(term in title_abstract for term in ['cohort', 'longitudinal']):
-                return EvidenceLevel.COHORT_STUDY
-            elif any(term in title_abstract for term in ['case-control', 'case control']):
-                return EvidenceLevel.CASE_CONTROL
-            elif any(term in title_abstract for term in ['case series', 'case study']):
-                return EvidenceLevel.CASE_SERIES
-            elif any(term in title_abstract for term in ['case report']):
-                return EvidenceLevel.CASE_REPORT
+                content = result["content"]
+                try:
+                    analysis = json.loads(content[content.find("{"):content.rfind("}") + 1])
+                    labels = {int(number): label for number, label in analysis.items() if isinstance(label, str)}
+                except (ValueError, AttributeError):
+                    # Typically cut off before the closing brace: keep the entries that are complete
+                    labels = {int(number): label for number, label in EVIDENCE_LABEL_ENTRY_PATTERN.findall(content)}
+                    logger.warning(
+                        f"Evidence classification response was not valid JSON "
+                        f"(output tokens: {result.get('usage', {}).get('output_tokens', 'unknown')}); "
+                        f"recovered {len(labels)} of {len(items)} labels"
+                    )
             else:
-                return EvidenceLevel.EXPERT_OPINION
+                logger.warning(f"Evidence classification failed: {result.get('error')}")
+
+            levels = []
+            missing = 0
+            for number, (title, abstract) in enumerate(items, 1):
+                label = labels.get(number)
+                if label is not None:
+                    levels.append(EVIDENCE_LEVELS_BY_LABEL.get(label.strip().lower(), EvidenceLevel.EXPERT_OPINION))
+                else:
+                    missing += 1
+                    levels.append(self._keyword_evidence_level(title, abstract))
+
+            if missing and result.get("success"):
+                logger.warning(f"Evidence classification missed {missing} of {len(items)} papers; used keywords for them")
+            return levels
 
         except Exception as e:
             logger.warning(f"Failed to classify evidence level: {e}")
-            return EvidenceLevel.EXPERT_OPINION
+            return [EvidenceLevel.EXPERT_OPINION] * len(items)
+
+    def _keyword_evidence_level(self, title: str, abstract: str) -> EvidenceLevel:
+        """Fallback classification based on keywords"""
+
+        title_abstract = f"{title} {abstract}".lower()
+
+        for level, pattern in self._evidence_keyword_patterns:
+            if pattern.search(title_abstract):
+                return level
+        return EvidenceLevel.EXPERT_OPINION
 
     async def _detect_research_conflicts(self, papers: List[CitationNode]) -> List[LiteratureConflict]:
         """Detect conflicts and contradictions in research findings"""
@@ -404,12 +603,27 @@ class LiteratureAnalysisEngine:
             # Group papers by similar topics using semantic search
             topic_groups = await self._group_papers_by_topic(papers)
 
+            # One embedding per paper, unit length so dot products are cosines
+            embeddings = None
+            try:
+                vectors = np.asarray(await semantic_search_engine.create_embedding_batch(
+                    [f"{paper.title} {paper.abstract}" for paper in papers]
+                ), dtype=float)
+                norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+                embeddings = vectors / np.where(norms > 0, norms, 1.0)
+                rows = {id(paper): row for row, paper in enumerate(papers)}
+            except Exception as e:
+                logger.info(f"Comparing every paper pair for conflicts, no embeddings: {e}")
+
             for topic, group_papers in topic_groups.items():
                 if len(group_papers) < 2:
                     continue
 
                 # Compare findings within each topic group
-                topic_conflicts = await self._detect_conflicts_in_group(group_papers)
+                group_embeddings = None
+                if embeddings is not None:
+                    group_embeddings = embeddings[[rows[id(paper)] for paper in group_papers]]
+                topic_conflicts = await self._detect_conflicts_in_group(group_papers, group_embeddings)
                 conflicts.extend(topic_conflicts)
 
             return conflicts
@@ -426,9 +640,9 @@ class LiteratureAnalysisEngine:
         try:
             # Extract topics from titles and abstracts
             for paper in papers:
-                # Use semantic search to extract key concepts
-                concepts = await semantic_search_engine._extract_query_concepts(
-                    paper.title + " " + paper.abstract
+                # Key concepts, usually already extracted for relevance scoring
+                concepts = await self._concepts_for(
+                    self._paper_text(paper.title, paper.abstract, paper.keywords)
                 )
 
                 # Group by primary concept category
@@ -446,18 +660,42 @@ class LiteratureAnalysisEngine:
             logger.error(f"Failed to group papers by topic: {e}")
             return {'general': papers}
 
-    async def _detect_conflicts_in_group(self, papers: List[CitationNode]) -> List[LiteratureConflict]:
-        """Detect conflicts within a group of related papers"""
+    async def _detect_conflicts_in_group(
+        self,
+        papers: List[CitationNode],
+        embeddings: Optional[np.ndarray] = None
+    ) -> List[LiteratureConflict]:
+        """Detect conflicts within a group of related papers
 
-        conflicts = []
+        Given unit-length embeddings aligned with papers, only pairs at least
+        CONFLICT_CANDIDATE_SIMILARITY apart are compared; otherwise every pair is.
+        """
+
+        semaphore = asyncio.Semaphore(CONFLICT_COMPARISON_CONCURRENCY)
+
+        async def compare(paper_a: CitationNode, paper_b: CitationNode) -> Optional[LiteratureConflict]:
+            async with semaphore:
+                return await self._compare_papers_for_conflicts(paper_a, paper_b)
 
         try:
-            # Compare each pair of papers
-            for i, paper_a in enumerate(papers):
-                for paper_b in papers[i+1:]:
-                    conflict = await self._compare_papers_for_conflicts(paper_a, paper_b)
-                    if conflict:
-                        conflicts.append(conflict)
+            if embeddings is not None:
+                similarity = embeddings @ embeddings.T
+                pairs = zip(*np.nonzero(np.triu(similarity >= CONFLICT_CANDIDATE_SIMILARITY, k=1)))
+            else:
+                pairs = ((i, j) for i in range(len(papers)) for j in range(i + 1, len(papers)))
+
+            # Compare each candidate pair of papers concurrently
+            results = await asyncio.gather(
+                *(compare(papers[i], papers[j]) for i, j in pairs),
+                return_exceptions=True
+            )
+
+            conflicts = []
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.warning(f"Conflict comparison failed: {result}")
+                elif result:
+                    conflicts.append(result)
 
             return conflicts
 
@@ -643,20 +881,24 @@ class LiteratureAnalysisEngine:
             if not papers:
                 return 0.0
 
+            total_papers = len(papers)
+            evidence_scores = np.fromiter(
+                (self.evidence_weights[paper.evidence_level] for paper in papers), float, total_papers
+            )
+            years = np.fromiter((paper.year for paper in papers), float, total_papers)
+            relevance_scores = np.fromiter((paper.neurosurgical_relevance for paper in papers), float, total_papers)
+
             # Evidence level quality (40% of score)
-            evidence_scores = [self.evidence_weights[paper.evidence_level] for paper in papers]
-            avg_evidence_quality = sum(evidence_scores) / len(evidence_scores)
+            avg_evidence_quality = float(evidence_scores.mean())
 
             # Sample size factor (20% of score)
-            total_papers = len(papers)
             size_factor = min(total_papers / 20, 1.0)  # Optimal around 20 papers
 
             # Recency factor (20% of score)
             current_year = datetime.now().year
-            years = [paper.year for paper in papers if paper.year > 0]
-            if years:
-                avg_year = sum(years) / len(years)
-                recency_factor = max(0, min((avg_year - (current_year - 10)) / 10, 1.0))
+            years = years[years > 0]
+            if years.size:
+                recency_factor = float(np.clip((years.mean() - (current_year - 10)) / 10, 0.0, 1.0))
             else:
                 recency_factor = 0.5
 
@@ -664,8 +906,7 @@ class LiteratureAnalysisEngine:
             conflict_penalty = min(len(conflicts) * 0.1, 0.3)  # Max 30% penalty
 
             # Neurosurgical relevance (10% of score)
-            relevance_scores = [paper.neurosurgical_relevance for paper in papers]
-            avg_relevance = sum(relevance_scores) / len(relevance_scores) if relevance_scores else 0.5
+            avg_relevance = float(relevance_scores.mean())
 
             # Combined quality score
             quality_score = (
@@ -691,10 +932,10 @@ class LiteratureAnalysisEngine:
             keywords = paper.get('keywords', [])
 
             # Combine text for analysis
-            text = f"{title} {abstract} {' '.join(keywords)}"
+            text = self._paper_text(title, abstract, keywords)
 
             # Extract neurosurgical concepts
-            concepts = await semantic_search_engine._extract_query_concepts(text)
+            concepts = await self._concepts_for(text)
 
             # Calculate relevance based on concept matches and weights
             relevance_score = 0.0
@@ -721,42 +962,103 @@ class LiteratureAnalysisEngine:
             logger.warning(f"Failed to calculate neurosurgical relevance: {e}")
             return 0.5
 
+    def _paper_id(self, paper: Dict[str, Any]) -> str:
+        """PMID or source id of a paper, else a digest of its title that is stable across runs"""
+
+        return (
+            paper.get('pmid')
+            or paper.get('id')
+            or hashlib.blake2b(paper.get('title', '').encode('utf-8'), digest_size=8).hexdigest()
+        )
+
+    def _paper_text(self, title: str, abstract: str, keywords: List[str]) -> str:
+        """Text a paper's concepts are extracted from"""
+
+        return f"{title} {abstract} {' '.join(keywords)}"
+
+    async def _concepts_for(self, text: str) -> List[Any]:
+        """Concepts extracted from paper text, memoized by content hash"""
+
+        key = hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+        concepts = self._concept_cache.get(key)
+        if concepts is None:
+            concepts = await semantic_search_engine._extract_query_concepts(text)
+            self._concept_cache[key] = concepts
+            while len(self._concept_cache) > CONCEPT_CACHE_MAX_ITEMS:
+                self._concept_cache.popitem(last=False)
+        else:
+            self._concept_cache.move_to_end(key)
+        return concepts
+
     async def _deduplicate_papers(self, papers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Remove duplicate papers based on title similarity"""
 
+        if MinHashLSH is not None:
+            return self._deduplicate_papers_lsh(papers)
+
         unique_papers = []
-        seen_titles = set()
+        # Inverted index from word to kept titles, so each title is compared
+        # with every earlier one in a single bincount
+        postings: Dict[str, List[int]] = defaultdict(list)
+        seen_sizes: List[int] = []
 
         for paper in papers:
-            title = paper.get('title', '').lower().strip()
+            words = set(paper.get('title', '').lower().split())
+
+            # Titles without words never match anything
+            if words:
+                shared_words = [key for word in words for key in postings.get(word, ())]
+                if shared_words:
+                    intersection = np.bincount(shared_words, minlength=len(seen_sizes))
+                    similarity = intersection / (len(words) + np.asarray(seen_sizes) - intersection)
+                    if (similarity > TITLE_DUPLICATE_THRESHOLD).any():
+                        continue
 
-            # Simple deduplication based on title similarity
-            is_duplicate = False
-            for seen_title in seen_titles:
-                if self._title_similarity(title, seen_title) > 0.85:
-                    is_duplicate = True
-                    break
+                for word in words:
+                    postings[word].append(len(seen_sizes))
+                seen_sizes.append(len(words))
 
-            if not is_duplicate:
-                unique_papers.append(paper)
-                seen_titles.add(title)
+            unique_papers.append(paper)
 
         return unique_papers
 
-    def _title_similarity(self, title1: str, title2: str) -> float:
-        """Calculate similarity between two titles"""
+    def _deduplicate_papers_lsh(self, papers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Remove duplicate papers, checking only MinHash LSH candidates per title"""
+
+        unique_papers = []
+        lsh = MinHashLSH(threshold=TITLE_DUPLICATE_THRESHOLD, num_perm=TITLE_MINHASH_PERMUTATIONS)
+        seen_words: List[Set[str]] = []
+
+        for paper in papers:
+            words = set(paper.get('title', '').lower().split())
+
+            # Titles without words never match anything
+            if words:
+                minhash = MinHash(num_perm=TITLE_MINHASH_PERMUTATIONS)
+                for word in words:
+                    minhash.update(word.encode('utf-8'))
+
+                # Candidates are confirmed with the exact similarity
+                if any(
+                    self._word_similarity(words, seen_words[key]) > TITLE_DUPLICATE_THRESHOLD
+                    for key in lsh.query(minhash)
+                ):
+                    continue
+
+                lsh.insert(len(seen_words), minhash)
+                seen_words.append(words)
+
+            unique_papers.append(paper)
 
-        # Simple word-based similarity
-        words1 = set(title1.lower().split())
-        words2 = set(title2.lower().split())
+        return unique_papers
+
+    def _word_similarity(self, words1: Set[str], words2: Set[str]) -> float:
+        """Jaccard similarity of two word sets"""
 
         if not words1 or not words2:
             return 0.0
 
-        intersection = words1 & words2
-        union = words1 | words2
-
-        return len(intersection) / len(union) if union else 0.0
+        return len(words1 & words2) / len(words1 | words2)
 
     async def generate_systematic_review(
         self,
@@ -2,7 +2,7 @@
 
 import asyncio
 import logging
-from typing import Dict, Any, List, Optional
+from typing import AsyncIterator, Dict, Any, List, Optional
 from enum import Enum
 import aiohttp
 import json
@@ -12,6 +12,28 @@ from ..core.api_key_manager import api_key_manager
 
 logger = logging.getLogger(__name__)
 
+# OpenAI Batch API: requests complete within the window at about half price
+OPENAI_BATCH_COMPLETION_WINDOW = "24h"
+OPENAI_BATCH_POLL_SECONDS = 60
+OPENAI_BATCH_FINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+# Polling stops (and the batch is cancelled) past the completion window plus
+# a margin for OpenAI to mark it expired, or after this many failed polls in a row
+OPENAI_BATCH_DEADLINE_SECONDS = 25 * 60 * 60
+OPENAI_BATCH_MAX_FAILED_POLLS = 10
+
+# Fixed part of every Claude request; sent ahead of the query so Anthropic
+# prompt caching can reuse it across topics
+CLAUDE_INSTRUCTIONS = """As Claude Opus 4.1 with extended capabilities, please provide a comprehensive medical analysis.
+
+Please use your extended reasoning to:
+1. Perform deep analysis of the medical context
+2. Consider multiple evidence sources and perspectives
+3. Provide nuanced clinical insights
+4. Include relevant contraindications and considerations
+5. Structure the response for clinical utility
+
+Provide a thorough, evidence-based response in markdown format."""
+
 class AIProvider(Enum):
     OPENAI = "openai"
     GEMINI = "gemini"
@@ -161,7 +183,9 @@ class MultiAIManager:
                         return {
                             "success": False,
                             "error": f"OpenAI API error: {response.status} - {error_text}",
-                            "content": ""
+                            "content": "",
+                            "status_code": response.status,
+                            "retry_after": response.headers.get("Retry-After")
                         }
 
         except Exception as e:
@@ -192,31 +216,7 @@ class MultiAIManager:
 
         async with aiohttp.ClientSession() as session:
             headers = {"Content-Type": "application/json"}
-
-            # Enhanced prompt for medical context with deep thinking
-            enhanced_prompt = f"""
-            As Gemini 2.5 Pro with Deep Search and Deep Think capabilities, provide a comprehensive medical analysis:
-
-            Medical Query: {prompt}
-
-            Please use your deep thinking process to:
-            1. Analyze the medical context thoroughly
-            2. Search through your knowledge for the most current information
-            3. Consider multiple perspectives and evidence levels
-            4. Provide a well-structured, evidence-based response
-
-            Format your response in markdown with clear sections.
-            """
-
-            payload = {
-                "contents": [{"parts": [{"text": enhanced_prompt}]}],
-                "generationConfig": {
-                    "temperature": temperature,
-                    "maxOutputTokens": max_tokens,
-                    "candidateCount": 1
-                }
-            }
-
+            payload = self._gemini_payload(prompt, max_tokens, temperature)
             url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={settings.google_api_key}"
 
             async with session.post(url, headers=headers, json=payload) as response:
@@ -244,9 +244,88 @@ class MultiAIManager:
                     return {
                         "success": False,
                         "error": f"Gemini API error: {response.status} - {error_text}",
-                        "content": ""
+                        "content": "",
+                        "status_code": response.status,
+                        "retry_after": response.headers.get("Retry-After")
                     }
 
+    async def stream_content(
+        self,
+        prompt: str,
+        provider: Optional[str] = None,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        model: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """Yield generated text incrementally as the provider produces it
+
+        Gemini streams over server-sent events; other providers yield their
+        complete response as a single chunk. Raises RuntimeError on failure.
+        """
+
+        if not provider:
+            provider = settings.default_ai_provider
+
+        if provider != AIProvider.GEMINI.value:
+            result = await self.generate_content(prompt, provider=provider, max_tokens=max_tokens, temperature=temperature, model=model)
+            if not result.get("success"):
+                raise RuntimeError(result.get("error", f"{provider} generation failed"))
+            yield result["content"]
+            return
+
+        if not self.providers.get(provider):
+            raise RuntimeError(f"Provider {provider} not available or not configured")
+
+        if not model:
+            model = "gemini-2.5-pro"  # Latest Gemini model
+
+        url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:streamGenerateContent?alt=sse&key={settings.google_api_key}"
+        async with aiohttp.ClientSession() as session:
+            async with session.post(
+                url,
+                headers={"Content-Type": "application/json"},
+                json=self._gemini_payload(prompt, max_tokens, temperature)
+            ) as response:
+                if response.status != 200:
+                    raise RuntimeError(f"Gemini API error: {response.status} - {await response.text()}")
+
+                # Each SSE event carries the next slice of the candidate's text
+                async for line in response.content:
+                    if not line.startswith(b"data:"):
+                        continue
+                    data = json.loads(line[5:])
+                    for candidate in data.get("candidates", [])[:1]:
+                        for part in candidate.get("content", {}).get("parts", []):
+                            if part.get("text"):
+                                yield part["text"]
+
+    def _gemini_payload(self, prompt: str, max_tokens: int, temperature: float) -> Dict[str, Any]:
+        """Request body for Gemini generation, shared by the regular and streaming calls"""
+
+        # Enhanced prompt for medical context with deep thinking
+        enhanced_prompt = f"""
+            As Gemini 2.5 Pro with Deep Search and Deep Think capabilities, provide a comprehensive medical analysis:
+
+            Medical Query: {prompt}
+
+            Please use your deep thinking process to:
+            1. Analyze the medical context thoroughly
+            2. Search through your knowledge for the most current information
+            3. Consider multiple perspectives and evidence levels
+            4. Provide a well-structured, evidence-based response
+
+            Format your response in markdown with clear sections.
+            """
+
+        return {
+            "contents": [{"parts": [{"text": enhanced_prompt}]}],
+            "generationConfig": {
+                "temperature": temperature,
+                "maxOutputTokens": max_tokens,
+                "candidateCount": 1
+            }
+        }
+
     async def _claude_generate(self, prompt: str, max_tokens: int, temperature: float, model: Optional[str]) -> Dict[str, Any]:
         """Anthropic Claude generation with Opus 4.1 extended capabilities"""
         if not model:
@@ -259,21 +338,11 @@ class MultiAIManager:
                 "anthropic-version": "2023-06-01"
             }
 
-            # Enhanced prompt for extended reasoning
-            enhanced_prompt = f"""
-            As Claude Opus 4.1 with extended capabilities, please provide a comprehensive medical analysis:
-
-            Medical Query: {prompt}
-
-            Please use your extended reasoning to:
-            1. Perform deep analysis of the medical context
-            2. Consider multiple evidence sources and perspectives
-            3. Provide nuanced clinical insights
-            4. Include relevant contraindications and considerations
-            5. Structure the response for clinical utility
-
-            Provide a thorough, evidence-based response in markdown format.
-            """
+            # Enhanced prompt for extended reasoning: fixed instructions
+            # first, then the query
+            instructions = {"type": "text", "text": CLAUDE_INSTRUCTIONS}
+            if settings.claude_prompt_caching:
+                instructions["cache_control"] = {"type": "ephemeral"}
 
             payload = {
                 "model": model,
@@ -282,7 +351,10 @@ class MultiAIManager:
                 "messages": [
                     {
                         "role": "user",
-                        "content": enhanced_prompt
+                        "content": [
+                            instructions,
+                            {"type": "text", "text": f"Medical Query: {prompt}"}
+                        ]
                     }
                 ]
             }
@@ -307,7 +379,9 @@ class MultiAIManager:
                     return {
                         "success": False,
                         "error": f"Claude API error: {response.status} - {error_text}",
-                        "content": ""
+                        "content": "",
+                        "status_code": response.status,
+                        "retry_after": response.headers.get("Retry-After")
                     }
 
     async def _perplexity_generate(self, prompt: str, max_tokens: int, temperature: float, model: Optional[str]) -> Dict[str, Any]:
@@ -377,7 +451,9 @@ class MultiAIManager:
                     return {
                         "success": False,
                         "error": f"Perplexity API error: {response.status} - {error_text}",
-                        "content": ""
+                        "content": "",
+                        "status_code": response.status,
+                        "retry_after": response.headers.get("Retry-After")
                     }
 
     async def multi_provider_synthesis(self, prompt: str, providers: List[str] = None) -> Dict[str, Any]:
@@ -426,6 +502,200 @@ class MultiAIManager:
             "synthesis_method": "multi_provider"
         }
 
+    @staticmethod
+    async def _cancel_openai_batch(session: aiohttp.ClientSession, batch_id: str):
+        """Cancel an abandoned batch so it is not billed for work nobody reads"""
+
+        try:
+            async with session.post(f"https://api.openai.com/v1/batches/{batch_id}/cancel") as response:
+                if response.status != 200:
+                    logger.warning(f"OpenAI batch {batch_id} cancel error: {response.status}")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(f"Cancelling OpenAI batch {batch_id} failed: {e}")
+
+    async def batch_generate_content(
+        self,
+        prompts: List[str],
+        provider: str = "openai",
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        model: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Generate content for many prompts through the provider's Batch API
+
+        The prompts are uploaded as one JSONL file and the batch is polled
+        until it finishes, so this can take up to the completion window.
+        Results are returned in prompt order, shaped like generate_content's.
+        """
+
+        if provider != AIProvider.OPENAI.value:
+            return {
+                "success": False,
+                "error": f"Batch generation not supported for provider {provider}",
+                "results": []
+            }
+
+        if not self.providers.get(provider):
+            return {
+                "success": False,
+                "error": f"Provider {provider} not available or not configured",
+                "results": []
+            }
+
+        if not model:
+            model = "gpt-4"
+
+        try:
+            api_key, key_id = await api_key_manager.get_active_key("openai")
+            start_time = asyncio.get_event_loop().time()
+            requests = "\n".join(
+                json.dumps({
+                    "custom_id": str(index),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": model,
+                        "messages": [
+                            {
+                                "role": "system",
+                                "content": "You are a medical expert assistant. Provide accurate, evidence-based medical information."
+                            },
+                            {"role": "user", "content": prompt}
+                        ],
+                        "max_tokens": max_tokens,
+                        "temperature": temperature
+                    }
+                })
+                for index, prompt in enumerate(prompts)
+            )
+
+            async with aiohttp.ClientSession(headers={"Authorization": f"Bearer {api_key}"}) as session:
+                form = aiohttp.FormData()
+                form.add_field("purpose", "batch")
+                form.add_field("file", requests.encode("utf-8"), filename="batch.jsonl", content_type="application/jsonl")
+                async with session.post("https://api.openai.com/v1/files", data=form) as response:
+                    if response.status != 200:
+                        return {
+                            "success": False,
+                            "error": f"OpenAI file upload error: {response.status} - {await response.text()}",
+                            "results": []
+                        }
+                    input_file_id = (await response.json())["id"]
+
+                async with session.post(
+                    "https://api.openai.com/v1/batches",
+                    json={
+                        "input_file_id": input_file_id,
+                        "endpoint": "/v1/chat/completions",
+                        "completion_window": OPENAI_BATCH_COMPLETION_WINDOW
+                    }
+                ) as response:
+                    if response.status != 200:
+                        return {
+                            "success": False,
+                            "error": f"OpenAI batch error: {response.status} - {await response.text()}",
+                            "results": []
+                        }
+                    batch = await response.json()
+
+                deadline = start_time + OPENAI_BATCH_DEADLINE_SECONDS
+                failed_polls = 0
+                while batch["status"] not in OPENAI_BATCH_FINAL_STATUSES:
+                    if (
+                        asyncio.get_event_loop().time() >= deadline
+                        or failed_polls >= OPENAI_BATCH_MAX_FAILED_POLLS
+                    ):
+                        await self._cancel_openai_batch(session, batch["id"])
+                        return {
+                            "success": False,
+                            "error": f"OpenAI batch {batch['id']} still {batch['status']} when polling stopped",
+                            "results": []
+                        }
+
+                    await asyncio.sleep(OPENAI_BATCH_POLL_SECONDS)
+                    try:
+                        async with session.get(f"https://api.openai.com/v1/batches/{batch['id']}") as response:
+                            if response.status == 200:
+                                batch = await response.json()
+                                failed_polls = 0
+                            else:
+                                failed_polls += 1
+                    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                        logger.warning(f"Polling OpenAI batch {batch['id']} failed: {e}")
+                        failed_polls += 1
+
+                if batch["status"] != "completed" or not batch.get("output_file_id"):
+                    return {
+                        "success": False,
+                        "error": f"OpenAI batch {batch['id']} ended with status {batch['status']}",
+                        "results": []
+                    }
+
+                async with session.get(
+                    f"https://api.openai.com/v1/files/{batch['output_file_id']}/content"
+                ) as response:
+                    output = await response.text()
+
+            # Output lines come back in any order; custom_id is the prompt index
+            results = [
+                {"success": False, "error": "No batch output for request", "content": ""}
+                for _ in prompts
+            ]
+            usage_totals = {"prompt_tokens": 0, "completion_tokens": 0}
+            for line in output.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                response_record = record.get("response") or {}
+                body = response_record.get("body") or {}
+                if record.get("error") or response_record.get("status_code") != 200:
+                    error = record.get("error") or body.get("error")
+                    results[int(record["custom_id"])] = {
+                        "success": False,
+                        "error": f"OpenAI batch request error: {error}",
+                        "content": ""
+                    }
+                    continue
+
+                usage = body.get("usage", {})
+                usage_totals["prompt_tokens"] += usage.get("prompt_tokens", 0)
+                usage_totals["completion_tokens"] += usage.get("completion_tokens", 0)
+                results[int(record["custom_id"])] = {
+                    "success": True,
+                    "content": body["choices"][0]["message"]["content"],
+                    "provider": "openai",
+                    "model": model,
+                    "usage": usage
+                }
+
+            # GPT-4 pricing (approximate), halved for batch requests
+            estimated_cost = (
+                usage_totals["prompt_tokens"] * 0.00003 + usage_totals["completion_tokens"] * 0.00006
+            ) / 2
+            await api_key_manager.record_api_call(
+                service="openai",
+                key_id=key_id,
+                success=True,
+                response_time_ms=(asyncio.get_event_loop().time() - start_time) * 1000,
+                estimated_cost=estimated_cost,
+                operation_type="neurosurgical_batch_content_generation"
+            )
+
+            return {
+                "success": True,
+                "results": results,
+                "batch_id": batch["id"],
+                "estimated_cost": estimated_cost
+            }
+
+        except Exception as e:
+            logger.error(f"OpenAI batch generation failed: {e}")
+            return {
+                "success": False,
+                "error": str(e),
+                "results": []
+            }
+
     def _synthesize_responses(self, results: List[Dict[str, Any]]) -> str:
         """Synthesize multiple AI responses into a coherent result"""
         synthesis = f"# Multi-Provider Medical Analysis\n\n"
@@ -18,6 +18,22 @@ class ResearchAPIManager:
         self.pubmed_base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
         self.scholar_available = bool(settings.scholar_api_key or settings.serpapi_key)
 
+        # One keep-alive session shared by all requests (created on first use)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Shared HTTP session, so repeated searches reuse TCP/TLS connections"""
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session"""
+
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
     async def search_pubmed(
         self,
         query: str,
@@ -48,76 +64,77 @@ class ResearchAPIManager:
 
             full_query = " AND ".join(search_terms)
 
-            async with aiohttp.ClientSession() as session:
-                # Step 1: Search for PMIDs
-                search_params = {
-                    "db": "pubmed",
-                    "term": full_query,
-                    "retmax": max_results,
-                    "retmode": "json"
-                }
+            session = self._get_session()
 
-                if settings.pubmed_email:
-                    search_params["email"] = settings.pubmed_email
-                if settings.pubmed_api_key:
-                    search_params["api_key"] = settings.pubmed_api_key
-
-                async with session.get(
-                    f"{self.pubmed_base_url}/esearch.fcgi",
-                    params=search_params
-                ) as response:
-                    if response.status != 200:
-                        return {
-                            "success": False,
-                            "error": f"PubMed search failed: {response.status}",
-                            "results": []
-                        }
-
-                    search_data = await response.json()
-                    pmids = search_data.get("esearchresult", {}).get("idlist", [])
-
-                    if not pmids:
-                        return {
-                            "success": True,
-                            "results": [],
-                            "total_count": 0,
-                            "query": query
-                        }
-
-                # Step 2: Fetch article details
-                fetch_params = {
-                    "db": "pubmed",
-                    "id": ",".join(pmids),
-                    "retmode": "xml"
-                }
+            # Step 1: Search for PMIDs
+            search_params = {
+                "db": "pubmed",
+                "term": full_query,
+                "retmax": max_results,
+                "retmode": "json"
+            }
+
+            if settings.pubmed_email:
+                search_params["email"] = settings.pubmed_email
+            if settings.pubmed_api_key:
+                search_params["api_key"] = settings.pubmed_api_key
+
+            async with session.get(
+                f"{self.pubmed_base_url}/esearch.fcgi",
+                params=search_params
+            ) as response:
+                if response.status != 200:
+                    return {
+                        "success": False,
+                        "error": f"PubMed search failed: {response.status}",
+                        "results": []
+                    }
 
-                if settings.pubmed_email:
-                    fetch_params["email"] = settings.pubmed_email
-                if settings.pubmed_api_key:
-                    fetch_params["api_key"] = settings.pubmed_api_key
-
-                async with session.get(
-                    f"{self.pubmed_base_url}/efetch.fcgi",
-                    params=fetch_params
-                ) as response:
-                    if response.status != 200:
-                        return {
-                            "success": False,
-                            "error": f"PubMed fetch failed: {response.status}",
-                            "results": []
-                        }
-
-                    xml_content = await response.text()
-                    articles = self._parse_pubmed_xml(xml_content)
+                search_data = await response.json()
+                pmids = search_data.get("esearchresult", {}).get("idlist", [])
 
+                if not pmids:
                     return {
                         "success": True,
-                        "results": articles,
-                        "total_count": len(articles),
-                        "query": query,
-                        "source": "pubmed"
+                        "results": [],
+                        "total_count": 0,
+                        "query": query
+                    }
+
+            # Step 2: Fetch article details
+            fetch_params = {
+                "db": "pubmed",
+                "id": ",".join(pmids),
+                "retmode": "xml"
+            }
+
+            if settings.pubmed_email:
+                fetch_params["email"] = settings.pubmed_email
+            if settings.pubmed_api_key:
+                fetch_params["api_key"] = settings.pubmed_api_key
+
+            async with session.get(
+                f"{self.pubmed_base_url}/efetch.fcgi",
+                params=fetch_params
+            ) as response:
+                if response.status != 200:
+                    return {
+                        "success": False,
+                        "error": f"PubMed fetch failed: {response.status}",
+                        "results": []
                     }
 
+                xml_content = await response.text()
+                articles = self._parse_pubmed_xml(xml_content)
+
+                return {
+                    "success": True,
+                    "results": articles,
+                    "total_count": len(articles),
+                    "query": query,
+                    "source": "pubmed"
+                }
+
         except Exception as e:
             logger.error(f"PubMed search failed: {e}")
             return {
@@ -143,55 +160,55 @@ class ResearchAPIManager:
             }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                params = {
-                    "engine": "google_scholar",
-                    "q": query,
-                    "api_key": settings.serpapi_key,
-                    "num": max_results
-                }
+            session = self._get_session()
+            params = {
+                "engine": "google_scholar",
+                "q": query,
+                "api_key": settings.serpapi_key,
+                "num": max_results
+            }
 
-                if year_from:
-                    params["as_ylo"] = year_from
-                if year_to:
-                    params["as_yhi"] = year_to
-
-                async with session.get(
-                    "https://serpapi.com/search.json",
-                    params=params
-                ) as response:
-                    if response.status != 200:
-                        return {
-                            "success": False,
-                            "error": f"Google Scholar search failed: {response.status}",
-                            "results": []
-                        }
-
-                    data = await response.json()
-                    organic_results = data.get("organic_results", [])
-
-                    # Parse results
-                    articles = []
-                    for result in organic_results:
-                        article = {
-                            "title": result.get("title", ""),
-                            "authors": result.get("publication_info", {}).get("authors", []),
-                            "abstract": result.get("snippet", ""),
-                            "publication_info": result.get("publication_info", {}),
-                            "link": result.get("link", ""),
-                            "cited_by_count": result.get("inline_links", {}).get("cited_by", {}).get("total", 0),
-                            "year": self._extract_year_from_publication_info(result.get("publication_info", {})),
-                            "source": "google_scholar"
-                        }
-                        articles.append(article)
+            if year_from:
+                params["as_ylo"] = year_from
+            if year_to:
+                params["as_yhi"] = year_to
 
+            async with session.get(
+                "https://serpapi.com/search.json",
+                params=params
+            ) as response:
+                if response.status != 200:
                     return {
-                        "success": True,
-                        "results": articles,
-                        "total_count": len(articles),
-                        "query": query,
+                        "success": False,
+                        "error": f"Google Scholar search failed: {response.status}",
+                        "results": []
+                    }
+
+                data = await response.json()
+                organic_results = data.get("organic_results", [])
+
+                # Parse results
+                articles = []
+                for result in organic_results:
+                    article = {
+                        "title": result.get("title", ""),
+                        "authors": result.get("publication_info", {}).get("authors", []),
+                        "abstract": result.get("snippet", ""),
+                        "publication_info": result.get("publication_info", {}),
+                        "link": result.get("link", ""),
+                        "cited_by_count": result.get("inline_links", {}).get("cited_by", {}).get("total", 0),
+                        "year": self._extract_year_from_publication_info(result.get("publication_info", {})),
                         "source": "google_scholar"
                     }
+                    articles.append(article)
+
+                return {
+                    "success": True,
+                    "results": articles,
+                    "total_count": len(articles),
+                    "query": query,
+                    "source": "google_scholar"
+                }
 
         except Exception as e:
             logger.error(f"Google Scholar search failed: {e}")
@@ -251,41 +268,41 @@ class ResearchAPIManager:
         """Get detailed information about a specific PubMed article"""
 
         try:
-            async with aiohttp.ClientSession() as session:
-                params = {
-                    "db": "pubmed",
-                    "id": pmid,
-                    "retmode": "xml"
-                }
+            session = self._get_session()
+            params = {
+                "db": "pubmed",
+                "id": pmid,
+                "retmode": "xml"
+            }
+
+            if settings.pubmed_email:
+                params["email"] = settings.pubmed_email
+            if settings.pubmed_api_key:
+                params["api_key"] = settings.pubmed_api_key
 
-                if settings.pubmed_email:
-                    params["email"] = settings.pubmed_email
-                if settings.pubmed_api_key:
-                    params["api_key"] = settings.pubmed_api_key
-
-                async with session.get(
-                    f"{self.pubmed_base_url}/efetch.fcgi",
-                    params=params
-                ) as response:
-                    if response.status != 200:
-                        return {
-                            "success": False,
-                            "error": f"Failed to fetch article details: {response.status}"
-                        }
-
-                    xml_content = await response.text()
-                    articles = self._parse_pubmed_xml(xml_content, detailed=True)
-
-                    if articles:
-                        return {
-                            "success": True,
-                            "article": articles[0]
-                        }
-                    else:
-                        return {
-                            "success": False,
-                            "error": "Article not found"
-                        }
+            async with session.get(
+                f"{self.pubmed_base_url}/efetch.fcgi",
+                params=params
+            ) as response:
+                if response.status != 200:
+                    return {
+                        "success": False,
+                        "error": f"Failed to fetch article details: {response.status}"
+                    }
+
+                xml_content = await response.text()
+                articles = self._parse_pubmed_xml(xml_content, detailed=True)
+
+                if articles:
+                    return {
+                        "success": True,
+                        "article": articles[0]
+                    }
+                else:
+                    return {
+                        "success": False,
+                        "error": "Article not found"
+                    }
 
         except Exception as e:
             logger.error(f"Failed to get article details for PMID {pmid}: {e}")
@@ -60,6 +60,7 @@ class NeurosurgicalSemanticSearchEngine:
 
     def __init__(self):
         self.model = None
+        self.model_name = 'all-MiniLM-L6-v2'
         self.concept_embeddings = {}
         self.document_embeddings = {}
         self.search_cache = {}
@@ -68,7 +69,7 @@ class NeurosurgicalSemanticSearchEngine:
         if EMBEDDINGS_AVAILABLE:
             try:
                 # Use medical domain model for better medical text understanding
-                self.model = SentenceTransformer('all-MiniLM-L6-v2')  # Lightweight model
+                self.model = SentenceTransformer(self.model_name)  # Lightweight model
                 logger.info("✅ Sentence transformer model loaded successfully")
             except Exception as e:
                 logger.warning(f"⚠️ Failed to load sentence transformer: {e}")
@@ -104,6 +105,23 @@ class NeurosurgicalSemanticSearchEngine:
             logger.error(f"❌ Failed to initialize concept embeddings: {e}")
             self.model = None
 
+    async def create_embedding(self, text: str) -> np.ndarray:
+        """Create an embedding vector for a single text"""
+        embeddings = await self.create_embedding_batch([text])
+        return embeddings[0]
+
+    async def create_embedding_batch(self, texts: List[str]) -> List[np.ndarray]:
+        """Create embedding vectors for several texts in one model call"""
+
+        if not self.model:
+            raise RuntimeError("Embedding model not available")
+
+        if not texts:
+            return []
+
+        # The forward pass is CPU-bound; keep it off the event loop
+        return list(await asyncio.to_thread(self.model.encode, texts))
+
     async def search(
         self,
         query: str,
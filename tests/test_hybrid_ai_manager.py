@@ -0,0 +1,72 @@
+"""Tests for the hybrid AI manager's streamed research analysis handling"""
+
+from src.services.hybrid_ai_manager import (
+    RESEARCH_FINDINGS_COMPLETE_PATTERN,
+    RESEARCH_FINDINGS_TAIL_CHARS,
+)
+
+ANALYSIS = """## Research Analysis
+
+1. **Statistical analysis of the evidence**
+   1. Pooled sample of 30.
+   2. Mean follow-up 3.5 years
+   3. Recurrence fell from 12% to 4%
+   3) Evidence quality of the pooled trials was moderate
+
+2. **Key research findings and trends**
+Evidence quality improved after 2018.
+30. Outcomes were stable.
+
+3. **Evidence Quality Assessment**
+Most sources are cohort studies.
+"""
+
+
+def _first_match_offset(text: str, chunk_size: int) -> int:
+    """Stream text in chunks as the manager does; return how much had arrived at the first match"""
+
+    tail = ""
+    for start in range(0, len(text), chunk_size):
+        chunk = text[start:start + chunk_size]
+        window = tail + chunk
+        if RESEARCH_FINDINGS_COMPLETE_PATTERN.search(window):
+            return start + len(chunk)
+        tail = window[-RESEARCH_FINDINGS_TAIL_CHARS:]
+    return -1
+
+
+def test_findings_complete_only_at_item_three_heading():
+    heading = ANALYSIS.index("3. **Evidence Quality Assessment**")
+    for chunk_size in (1, 7, 50, len(ANALYSIS)):
+        received = _first_match_offset(ANALYSIS, chunk_size)
+        assert received > heading, chunk_size
+        assert "Key research findings" in ANALYSIS[:received]
+
+
+def test_heading_deep_inside_one_large_chunk():
+    heading = "\n3. **Evidence Quality Assessment**\n"
+    text = "x" * 299 + heading
+    text += "y" * (563 - len(text))
+    assert len(text) == 563 and len(text) - text.index(heading) == 264
+    assert _first_match_offset(text, len(text)) == len(text)
+
+
+def test_heading_variants_match():
+    for heading in (
+        "\n3. Evidence quality assessment",
+        "\n### 3) Evidence Quality",
+        "\n**3.** **Evidence quality assessment**",
+    ):
+        assert RESEARCH_FINDINGS_COMPLETE_PATTERN.search(heading), heading
+
+
+def test_nested_items_and_numbers_do_not_match():
+    for line in (
+        "\n   3. Recurrence fell from 12% to 4%",
+        "\n   3) Evidence quality of the pooled trials was moderate",
+        "\n30. Outcomes were stable.",
+        "\n3.5 years of follow-up",
+        "\nEvidence quality improved after 2018.",
+        "3. Evidence quality assessment",
+    ):
+        assert not RESEARCH_FINDINGS_COMPLETE_PATTERN.search(line), line